@@ -0,0 +1,237 @@
+"""
+Offline micro-benchmarks for the CPU hot paths of the card pipeline.
+
+    python -m benchmarks.run                   # compare against benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline   # store the current timings as the new baseline
+    python -m benchmarks.run --record set run  # re-record the API fixtures (needs network + API key)
+
+Every case runs on the payloads in benchmarks/fixtures, so no network or Anki is
+needed. The shipped fixtures are synthetic: they copy the shape and size of the
+Dictionary API and Big Huge Thesaurus responses for "set" and "run", but the
+definitions, examples and word lists are generated filler, and the clipboard
+transcript repeats a few typical lines. Run --record to replace them with real
+responses. A case is a regression when its best time per call exceeds the
+baseline by more than --threshold (default 25%); the exit code is then 1.
+Baselines are machine-specific: save one on the machine you compare on.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+REPEATS = 5
+
+HIGHLIGHT_SENTENCE = "She runs every morning, and running has made her a better runner than those who ran before."
+POS_SENTENCE = "The committee will set the agenda before the meeting starts."
+# Cases that measure nothing useful without the NLTK tagger and WordNet data
+NLTK_CASES = {"detect_pos_from_context", "highlight_focus_word"}
+
+
+def load_fixture(name: str):
+    path = os.path.join(FIXTURES_DIR, name)
+    if name.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    with open(path, encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _note_args(dictionary_response):
+    from src.config.settings import MODEL_NAME
+
+    return {
+        "word": "set",
+        "sentence": POS_SENTENCE,
+        "highlighted": POS_SENTENCE,
+        "image_url": "https://images.pexels.com/photos/1/pexels-photo-1.jpeg",
+        "dictionary_data": {"definition": "put", "synonyms": "place", "antonyms": "", "related": "", "similar": ""},
+        "sentence_audio_ref": "[sound:tts_sentence_set.mp3]",
+        "word_audio_ref": "[sound:tts_set.mp3]",
+        "irregular_forms_field": "set - set - set",
+        "dictionary_entry": dictionary_response,
+        "translation_ua": "встановлювати",
+        "config": {"model_name": MODEL_NAME},
+        "deck_name": "Benchmark",
+    }
+
+
+def build_cases() -> dict:
+    """
+    Returns {name: zero-argument callable}. Imports happen here so that a case's
+    one-off import cost is not part of its timing.
+    """
+    from src.services.cefr_data import load_cefr_frequency_data, load_cefr_index, CEFR_INDEX_PATH
+    from src.services.cefr_index import CefrIndex
+    from src.services.clipboard_service import clean_clipboard_text
+    from src.services.dictionary_service import _process_thesaurus_data
+    from src.linguistics.pos import detect_pos_from_context
+    from src.utils.highlight import highlight_focus_word
+    from src.ui.html_templates import render_dictionary_html
+    from src.services.cefr_data import get_cefr_frequency_data, get_cefr_lemma_map
+    from src.utils.note_builder import build_anki_note
+    from src.services.cefr_annotation import annotate_text, get_cefr_vocabulary
+    from src.services.spelling_service import get_spelling_index, suggest_spelling
+
+    cefr_index = get_cefr_frequency_data()  # render_dictionary_html looks the word up; load it outside the timing
+    get_cefr_lemma_map()
+    load_cefr_index()  # make sure the compact index has been built before timing how fast it opens
+    transcript = load_fixture("clipboard_transcript.txt")
+    dictionary = {word: load_fixture(f"dictionary_{word}.json") for word in ("set", "run")}
+    thesaurus = {word: load_fixture(f"thesaurus_{word}.json") for word in ("set", "run")}
+    note_args = _note_args(render_dictionary_html(dictionary["set"]))
+    get_cefr_vocabulary()
+    get_spelling_index()
+    # ~1 MB of running text built from the fixture definitions and examples
+    definitions = [d.get(key, "") for entries in dictionary.values() for e in entries
+                   for m in e["meanings"] for d in m["definitions"] for key in ("definition", "example")]
+    text_1mb = " ".join(definitions) * (1_000_000 // len(" ".join(definitions)) + 1)
+
+    return {
+        "load_cefr_frequency_data": load_cefr_frequency_data,
+        "open_cefr_index": lambda: CefrIndex(CEFR_INDEX_PATH).close(),
+        "cefr_index.get": lambda: (cefr_index.get("acquaintance"), cefr_index.get("notaword")),
+        "clean_clipboard_text": lambda: clean_clipboard_text(transcript),
+        "detect_pos_from_context": lambda: detect_pos_from_context("set", POS_SENTENCE),
+        "highlight_focus_word": lambda: highlight_focus_word(HIGHLIGHT_SENTENCE, "run", pos="v"),
+        "process_thesaurus_data[set]": lambda: _process_thesaurus_data(thesaurus["set"], "verb"),
+        "process_thesaurus_data[run:all]": lambda: _process_thesaurus_data(thesaurus["run"]),
+        "render_dictionary_html[set]": lambda: render_dictionary_html(dictionary["set"]),
+        "render_dictionary_html[run]": lambda: render_dictionary_html(dictionary["run"]),
+        "build_anki_note": lambda: build_anki_note(**note_args),
+        "annotate_text[1MB]": lambda: annotate_text(text_1mb),
+        "suggest_spelling[perseverence]": lambda: suggest_spelling("perseverence"),
+    }
+
+
+def time_case(func, repeats: int = REPEATS) -> float:
+    """Best seconds per call over `repeats` rounds, each long enough (>= 0.2 s) to be stable."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+
+def nltk_data_available() -> bool:
+    try:
+        from nltk import pos_tag, word_tokenize
+        from nltk.stem import WordNetLemmatizer
+
+        pos_tag(word_tokenize("Warm up."))
+        WordNetLemmatizer().lemmatize("running", pos="v")
+        return True
+    except Exception:
+        return False
+
+
+def selected_cases(cases: dict, selected=None) -> list:
+    return [name for name in cases if not selected or any(s in name for s in selected)]
+
+
+def run_cases(cases: dict, selected=None) -> dict:
+    results = {}
+    has_nltk = nltk_data_available()
+    for name in selected_cases(cases, selected):
+        func = cases[name]
+        if name in NLTK_CASES and not has_nltk:
+            print(f"  {name:<34} skipped (NLTK data missing: python scripts/install_nltk_data.py)")
+            continue
+        func()  # warm-up: lazy imports and caches must not count
+        results[name] = time_case(func)
+        print(f"  {name:<34} {results[name] * 1e6:>12.1f} µs")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Returns (name, baseline_s, current_s, ratio) for every case slower than baseline * (1 + threshold)."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous and current > previous * (1 + threshold):
+            regressions.append((name, previous, current, current / previous))
+    return regressions
+
+
+def missing_from_baseline(names, baseline: dict) -> list:
+    """Names of the cases the baseline has no timing for, so nothing guards them against regressions."""
+    return [name for name in names if name not in baseline]
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def save_baseline(results: dict, path: str = BASELINE_PATH) -> None:
+    data = {
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def record_fixtures(words) -> None:
+    """Re-records the Dictionary API and Big Huge Thesaurus payloads used by the benchmarks."""
+    from src.services.dictionary_cache import enable_refresh
+    from src.services.dictionary_service import _fetch_big_huge_data, _fetch_dictionary_api_data, is_no_entry
+
+    enable_refresh()
+    for word in words:
+        for kind, fetch in (("dictionary", _fetch_dictionary_api_data), ("thesaurus", _fetch_big_huge_data)):
+            data = fetch(word)
+            if not data or is_no_entry(data):
+                print(f"  {kind}_{word}.json not recorded")
+                continue
+            with open(os.path.join(FIXTURES_DIR, f"{kind}_{word}.json"), "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            print(f"  {kind}_{word}.json recorded")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline micro-benchmarks for the card pipeline hot paths")
+    parser.add_argument("cases", nargs="*", help="Only run cases whose name contains one of these strings")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the timings as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown before a case counts as a regression (default: 0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument("--record", nargs="+", metavar="WORD", help="Re-record the API fixtures for WORD(s) and exit")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record_fixtures(args.record)
+        return 0
+
+    cases = build_cases()
+    results = run_cases(cases, args.cases)
+    baseline = load_baseline(args.baseline)
+    if args.save_baseline:
+        baseline = {**baseline, **results}
+        save_baseline(baseline, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+
+    for name in missing_from_baseline(selected_cases(cases, args.cases), baseline):
+        hint = " with the NLTK data installed" if name in NLTK_CASES else ""
+        print(f"NO BASELINE {name}: not checked for regressions (run --save-baseline{hint})")
+    if args.save_baseline:
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, previous, current, ratio in regressions:
+        print(f"REGRESSION {name}: {previous * 1e6:.1f} µs -> {current * 1e6:.1f} µs ({ratio:.2f}x)")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
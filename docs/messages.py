@@ -45,7 +45,15 @@ USER_INTERACTION_INPUT_VALIDATION = {
     # POS detection error
     "pos_detection_error": "⚠️ Error detecting part of speech: {error}",
     # Word and POS prompts
-    "word_prompt": "🔤 Enter the word you want to study: ",
+    "word_prompt": "🔤 Enter the word you want to study (separate several words with commas): ",
+    "word_header": "\n━━ {word} ({index}/{total}) ━━",
+    "word_suggestions": "💡 Suggested focus words: {choices}\n   Type a number, a word, or several separated by commas (e.g. 1, 3 or 2, flee).",
+    "word_suggestion_item": "{index}) {word} [{level}]",
+    "spelling_unknown": "❓ \"{word}\" is not in the vocabulary. Did you mean: {choices}",
+    "spelling_suggestion_item": "{index}) {word} ({frequency})",
+    "spelling_prompt": "   Type a number to use it, another word to replace it, or press Enter to keep \"{word}\": ",
+    "word_not_provided": "No focus word was provided. Exiting.",
+    "no_words_left": "No focus words are left to make cards for. Exiting.",
     "pos_prompt": "📝 Part of speech [{detected_pos}] [Press Enter to confirm or change (noun/verb/adjective/adverb)]: ",
     "about_message": "🃏 AnkiCardsToolkit v{version} by Oleg Kovalyov - Create Anki flashcard with word from your sentence\n"
 }
@@ -57,8 +65,12 @@ DATA_GATHERING_PROCESSING = {
     # CEFR/frequency data loading
     "cefr_loaded": "✅ Loaded CEFR/frequency data for {count} words",
     "cefr_load_error": "⚠️ Could not load CEFR/frequency data: {error}",
+    "cefr_csv_unreadable": "cannot read '{path}': {error}",
+    "cefr_csv_invalid": "'{path}' has no 'Word,CEFR,Frequency' header or no rows. Restore it from git or regenerate it (see README, 'CEFR & Frequency Integration').",
     # Dictionary fetch/format
     "dict_fetch_error": "❌ Failed to fetch dictionary data for '{word}'.",
+    "dict_no_entry": "❌ The dictionary has no entry for '{word}'; skipping it.",
+    "dict_backend_unknown": "⚠️ Unknown dictionary backend '{name}' in DICTIONARY_BACKENDS (choose from: {choices}).",
     "dict_format_error": "❌ Error formatting dictionary entry: {error}",
     "dict_format_invalid": "Invalid dictionary data.",
     "dict_format_generic": "Error formatting dictionary entry.",
@@ -68,6 +80,7 @@ DATA_GATHERING_PROCESSING = {
     "thesaurus_key_missing": "❌ BIG_HUGE_API_KEY not found. Please check your .env file.",
     "thesaurus_query": "\n🔍 Querying Big Huge Thesaurus for '{word}'...",
     "thesaurus_success": "✅ Received response from Big Huge Thesaurus",
+    "thesaurus_backend_unknown": "⚠️ Unknown thesaurus backend '{name}' in THESAURUS_BACKENDS (choose from: {choices}).",
     # Image selection
     "no_images_found": "No images found.",
     "image_number_prompt": "\n🔢 Enter image number (1-{max}) or press Enter to skip: ",
@@ -129,6 +142,85 @@ CARD_CONSTRUCTION_SUBMISSION = {
     "note_add_error": "❌ Error adding card: {error}"
 }
 
+# SERVER MODE (generate_card.py --serve)
+SERVER_MODE = {
+    "listening": "🌐 Card server listening on {url} (default deck: {deck_name}). Press Ctrl+C to stop.",
+    "stopped": "\n🛑 Card server stopped.",
+    "request_error": "❌ Card request failed: {error}"
+}
+
+# BATCH MODE (generate_card.py --batch)
+BATCH_MODE = {
+    "started": "📦 Building cards from {path} into deck '{deck_name}' ({workers} at a time)...",
+    "journal": "📒 Progress journal: {path} (re-run the same command to resume)",
+    "row_added": "✅ Row {row}: '{word}' added, ID = {note_id}",
+    "row_failed": "❌ Row {row}: '{word}' failed: {error}",
+    "summary": "\n📊 Batch finished: {added} added, {failed} failed",
+    "file_error": "❌ Cannot read batch file: {error}"
+}
+
+# ANNOTATE MODE (--annotate)
+ANNOTATE_MODE = {
+    "summary": "📊 {tokens} tokens ({unique} distinct) annotated in {seconds:.2f}s",
+    "level_counts": "   {counts}",
+    "file_error": "❌ Cannot read text file: {error}"
+}
+
+# STUDY LIST MODE (--study-list)
+STUDY_LIST_MODE = {
+    "summary": "📊 {files} corpora, {tokens} tokens, {lemmas} distinct words ({known} already in the deck)",
+    "level_counts": "   {counts}",
+    "file_error": "❌ Cannot read corpus file: {error}"
+}
+
+# SENTENCE MINING MODE (--index-corpus, --mine-sentences)
+SENTENCE_MINING_MODE = {
+    "index_built": "📚 Indexed {sentences} sentences for {lemmas} words from {files} files in {seconds:.1f}s → {path}",
+    "index_missing": "❌ Cannot open the sentence index at {path} ({error}). Build it first: python generate_card.py --index-corpus DIR",
+    "mined": "📊 {found}/{total} words got a sentence ({micros:.0f} µs per word)",
+    "not_found": "   No sentence for: {words}",
+    "file_error": "❌ Cannot read file: {error}"
+}
+
+# I+1 MODE (--i-plus-one)
+I_PLUS_ONE_MODE = {
+    "summary": "📊 {sentences} indexed sentences, {known} known words ({deck} from the deck): {matches} sentences with exactly one new word, for {words} words"
+}
+
+# COVERAGE MODE (--coverage)
+COVERAGE_MODE = {
+    "reference_corpus": "{files} corpora, {tokens} tokens",
+    "reference_table": "the frequency ranking of {path}",
+    "summary": "📊 Against {reference}: {known} of {words} words carded, covering {deck:.1f}% of running text ({with_stopwords:.1f}% with function words)",
+    "bands_header": "Frequency bands (9 = most frequent): carded words, share of text, covered, gap",
+    "levels_header": "CEFR levels: carded words, share of text, covered, gap",
+    "gap_row": "   {label:>2}  {known:>6}/{words:<6}  {share:5.1f}%  {covered:5.1f}%  {gap:5.1f}%",
+    "gains_header": "Top {count} uncarded words by added coverage (cumulative):",
+    "gain_row": "   {rank:>3}. {word} ({level}) → {coverage:.1f}%",
+    "target_row": "🎯 {target:.0f}% coverage: {count} more words",
+    "target_unreachable": "🎯 {target:.0f}% coverage: not reachable with the CEFR vocabulary alone",
+    "file_error": "❌ Cannot read corpus file: {error}"
+}
+
+# DICTIONARY CACHE (--refresh, --cache-stats)
+DICTIONARY_CACHE = {
+    "stats": "🗄️ Dictionary cache {path}: {entries} words ({not_found} without an entry), {bytes} bytes. Hits: {hits}, misses: {misses}, bytes saved: {bytes_saved}",
+    "disabled": "🗄️ The dictionary cache is disabled (DICTIONARY_CACHE_PATH is empty or cannot be opened)"
+}
+
+# THESAURUS TABLE (--build-thesaurus)
+THESAURUS_TABLE = {
+    "built": "📚 Local thesaurus: {words} words, {bytes} bytes, built in {seconds:.1f}s → {path}",
+    "missing": "ℹ️ The local thesaurus {path} is not built or out of date; build it with: python generate_card.py --build-thesaurus",
+    "wordnet_missing": "❌ Building the thesaurus needs the WordNet data: python scripts/install_nltk_data.py",
+    "write_error": "❌ Cannot write the thesaurus table: {error}"
+}
+
+# DICTIONARY CARD HTML (rendered on the Anki card back)
+DICTIONARY_HTML = {
+    "cefr_lemma_title": "Level of the base form"
+}
+
 # DEVELOPER / SYSTEM MESSAGES
 DEVELOPER_NOTES = {
     "nltk_download_failure": "⚠️ Could not download NLTK data for testing: {error}"
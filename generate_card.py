@@ -1,6 +1,6 @@
 import os
 import sys
-from src.cli.args import handle_cli_arguments
+from src.cli.args import parse_arguments, handle_cli_arguments
 
 # Minimal venv and .env check before any other imports
 if "VIRTUAL_ENV" not in os.environ:
@@ -10,37 +10,51 @@ if not os.path.exists(".env"):
     print("⚠️  .env file is missing in the project root. Please create it with the following content as an example:\nMODEL_NAME=VocabCard_English_UA\nDECK_NAME=Default\nPEXELS_API_KEY=your_pexels_api_key\nBIG_HUGE_API_KEY=your_big_huge_thesaurus_key\nANKI_CONNECT_URL=http://localhost:8765\nCONFIG_FILE=last_deck.txt\nTTS_PROVIDER=gtts\nUSER_LOCALE=uk")
     sys.exit(1)
 
-# Now import the rest of your app
+# =========================================================================
+# CLI ARGUMENT HANDLING (must be first, before any other imports)
+# =========================================================================
+
+cli_args = parse_arguments()
+if not handle_cli_arguments(cli_args):
+    sys.exit(0)
+
+from src.utils.tracing import enable_tracing, span
+
+if cli_args.trace:
+    enable_tracing(cli_args.trace)
+if cli_args.profile:
+    from src.utils.profiling import enable_profiling
+
+    enable_profiling(cli_args.profile)
+
+# =========================================================================
+# Delayed imports: only import after argument parsing is successful
+# =========================================================================
+# Heavy dependencies (NLTK, gTTS, the CEFR table) are loaded lazily by the
+# modules below or imported at the step that needs them, so that `--help`
+# and `--set-language` start instantly. tests/test_startup.py enforces this.
 from src.config.language_config import initialize_language_if_needed
 from src.utils.config_builder import config_build, get_default_deck_name
 from src.locales.loader import get_message
 from src.services.clipboard_service import get_clean_sentence_from_clipboard
-from src.linguistics.pos import detect_pos_from_context, get_irregular_forms
+from src.linguistics.pos import get_irregular_forms, tag_sentence
 from src.utils.highlight import highlight_focus_word
 from src.services.dictionary_service import (
     fetch_word_data,
-    format_dictionary_entry
+    format_dictionary_entry,
+    is_no_entry,
+    is_known_no_entry
 )
-from src.services.tts_service import generate_tts_base64
+from src.services.dictionary_cache import enable_refresh, get_dictionary_cache
 from src.services.media_service import send_media_file
 from src.ui.image_selector import select_image_for_card
-from src.services.anki_service import check_anki_connect, add_note
-from src.services.deck_service import get_deck_name, create_deck_if_not_exists
+from src.services.bootstrap_service import StartupBootstrap
+from src.services.deck_service import get_deck_name
 from src.utils.validation import validate_config
-from src.utils.note_builder import build_anki_note
 from src.utils.note_builder import submit_note_to_anki
-from src.ui.user_input import get_confirmed_pos
-
-# =========================================================================
-# CLI ARGUMENT HANDLING (must be first, before any other imports)
-# =========================================================================
-
-if not handle_cli_arguments():
-    sys.exit(0)
-
-# =========================================================================
-# Delayed imports: only import after argument parsing is successful
-# =========================================================================
+from src.ui.user_input import get_confirmed_pos, parse_focus_words, format_suggestions, confirm_spelling
+from src.services.suggestion_service import suggest_focus_words
+from src.services.spelling_service import is_known_word, suggest_spelling
 
 # ============================================================================
 # STEP 1: INITIALIZATION & CONFIGURATION
@@ -52,18 +66,135 @@ if not handle_cli_arguments():
 # Initialize language configuration early if needed
 initialize_language_if_needed()
 
+# Cached DictionaryAPI responses are ignored (and replaced) for this run
+if cli_args.refresh:
+    enable_refresh()
+
+# =========================================================================
+# CACHE STATS MODE: what the persistent DictionaryAPI cache holds and has saved
+# =========================================================================
+if cli_args.cache_stats:
+    cache = get_dictionary_cache()
+    if cache is None:
+        print(get_message("DICTIONARY_CACHE.disabled"))
+    else:
+        print(get_message("DICTIONARY_CACHE.stats", path=cache.path, **cache.stats()))
+    sys.exit(0)
+
+# =========================================================================
+# ANNOTATE MODE: CEFR levels for a whole text; needs no Anki or API keys
+# =========================================================================
+if cli_args.annotate:
+    from src.services.cefr_annotation import run_annotate
+
+    try:
+        run_annotate(cli_args.annotate)
+    except OSError as e:
+        print(get_message("ANNOTATE_MODE.file_error", error=str(e)))
+        sys.exit(1)
+    sys.exit(0)
+
+# =========================================================================
+# SENTENCE MINING MODE: index a corpus once, then find sentences for word lists
+# =========================================================================
+if cli_args.index_corpus or cli_args.mine_sentences:
+    from src.services.sentence_index import run_index_corpus, run_mine_sentences
+
+    try:
+        if cli_args.index_corpus:
+            run_index_corpus(cli_args.index_corpus)
+        if cli_args.mine_sentences:
+            run_mine_sentences(cli_args.mine_sentences)
+    except OSError as e:
+        print(get_message("SENTENCE_MINING_MODE.file_error", error=str(e)))
+        sys.exit(1)
+    sys.exit(0)
+
+# =========================================================================
+# THESAURUS BUILD MODE: WordNet relations of the vocabulary, for lookups without the API
+# =========================================================================
+if cli_args.build_thesaurus:
+    from src.services.thesaurus_table import run_build_thesaurus
+
+    try:
+        run_build_thesaurus()
+    except OSError as e:
+        print(get_message("THESAURUS_TABLE.write_error", error=str(e)))
+        sys.exit(1)
+    sys.exit(0)
+
 # ===== STRICT EARLY CONFIG VALIDATION (no user prompt, no data loading) =====
 config = config_build()
 
 # Read deck name from last_deck.txt or .env, but do NOT prompt the user before validation
 default_deck_name = get_default_deck_name(config)
 
+# =========================================================================
+# STUDY LIST MODE: rank a corpus's words for carding; needs no API keys
+# =========================================================================
+if cli_args.study_list:
+    from src.services.corpus_profile import run_study_list
+
+    try:
+        run_study_list(cli_args.study_list, default_deck_name, workers=max(1, cli_args.workers),
+                       save_path=cli_args.save_profile)
+    except (OSError, ValueError) as e:
+        print(get_message("STUDY_LIST_MODE.file_error", error=str(e)))
+        sys.exit(1)
+    sys.exit(0)
+
+# =========================================================================
+# I+1 MODE: indexed sentences with exactly one word that is not in the deck
+# =========================================================================
+if cli_args.i_plus_one:
+    from src.services.i_plus_one import run_i_plus_one
+
+    run_i_plus_one(default_deck_name, known_level=cli_args.known_level)
+    sys.exit(0)
+
+# =========================================================================
+# COVERAGE MODE: how much of a corpus the deck covers, and which words add the most
+# =========================================================================
+if cli_args.coverage is not None:
+    from src.services.coverage_service import run_coverage
+
+    try:
+        run_coverage(cli_args.coverage, default_deck_name, workers=max(1, cli_args.workers))
+    except (OSError, ValueError) as e:
+        print(get_message("COVERAGE_MODE.file_error", error=str(e)))
+        sys.exit(1)
+    sys.exit(0)
+
 validate_config(config)
 
 # =========================================================================
-# STEP 2: ANKI CONNECTION CHECK (no user prompt, no data loading)
+# SERVER MODE: keep NLTK, the CEFR table and connections warm across cards
 # =========================================================================
-check_anki_connect()
+if cli_args.serve:
+    from src.config.settings import CARD_SERVER_PORT
+    from src.services.card_server import serve
+
+    serve(config, default_deck_name, port=cli_args.port or CARD_SERVER_PORT)
+    sys.exit(0)
+
+# =========================================================================
+# BATCH MODE: one card per row of a TSV/CSV file, no prompts
+# =========================================================================
+if cli_args.batch:
+    from src.services.batch_service import run_batch
+
+    try:
+        summary = run_batch(cli_args.batch, config, default_deck_name, workers=max(1, cli_args.workers))
+    except OSError as e:
+        print(get_message("BATCH_MODE.file_error", error=str(e)))
+        sys.exit(1)
+    sys.exit(0 if summary["failed"] == 0 else 1)
+
+# =========================================================================
+# STEP 2: ANKI CONNECTION CHECK (runs in the background during the deck prompt)
+# =========================================================================
+# The AnkiConnect probe, CEFR table load and NLTK warm-up overlap with user input
+bootstrap = StartupBootstrap().start()
 
 # =========================================================================
 # STEP 3: USER INTERACTION & INPUT VALIDATION
@@ -71,73 +202,144 @@ check_anki_connect()
 
 # Now prompt the user for the deck name (if needed)
 deck_name = get_deck_name()
-create_deck_if_not_exists(deck_name)
+bootstrap.ensure_anki_connect()
+bootstrap.ensure_cefr_data()
+bootstrap.create_deck(deck_name)
+bootstrap.load_deck_words(deck_name)
+bootstrap.load_spelling_index()
 
 # Get sentence from clipboard
-sentence = get_clean_sentence_from_clipboard()
+with span("clipboard"):
+    sentence = get_clean_sentence_from_clipboard()
 
-# Get focus word from user
-word = input(get_message("USER_INTERACTION_INPUT_VALIDATION.word_prompt")).strip().lower()
+# Tokenize and tag the sentence once: it ranks the suggestions and serves every focus word's POS
+with span("pos_tagging"):
+    bootstrap.wait("nltk")
+    tagged = tag_sentence(sentence)
 
-# Detect and confirm part of speech
-pos = get_confirmed_pos(word, sentence)
+# Offer the sentence's rarest / highest-level words that are not in the deck yet
+with span("suggestions"):
+    suggestions = suggest_focus_words(sentence, tagged, known_words=bootstrap.wait("deck_words") or set())
+if suggestions:
+    print(get_message("USER_INTERACTION_INPUT_VALIDATION.word_suggestions", choices=format_suggestions(suggestions)))
 
-# ============================================================================
-# STEP 4: DATA GATHERING & PROCESSING
-# ============================================================================
+# Get focus word(s) from user; several words for the same sentence are separated by commas
+with span("word_prompt", category="input"):
+    words = parse_focus_words(input(get_message("USER_INTERACTION_INPUT_VALIDATION.word_prompt")),
+                              suggestions=[s["word"] for s in suggestions])
+if not words:
+    print(get_message("USER_INTERACTION_INPUT_VALIDATION.word_not_provided"))
+    sys.exit(1)
 
-# Fetch dictionary data with confirmed POS
-dictionary_data = fetch_word_data(word, pos)
+# Catch typos against the local vocabulary before any dictionary request is spent on them,
+# and drop words the dictionary cache already knows have no entry
+bootstrap.wait("spelling")
+checked = []
+for word in words:
+    if " " not in word and not is_known_word(word):
+        with span("spelling"):
+            corrections = suggest_spelling(word)
+        if corrections:
+            word = confirm_spelling(word, corrections)
+    if is_known_no_entry(word):
+        print(get_message("DATA_GATHERING_PROCESSING.dict_no_entry", word=word))
+    elif word not in checked:
+        checked.append(word)
+words = checked
+if not words:
+    print(get_message("USER_INTERACTION_INPUT_VALIDATION.no_words_left"))
+    sys.exit(1)
 
-# Highlight focus word in sentence
-pos_map = {'noun': 'n', 'verb': 'v', 'adjective': 'a', 'adverb': 'r'}
-highlighted = highlight_focus_word(sentence, word, pos=pos_map.get(pos, 'n'))
+# Start dictionary, thesaurus, Pexels and TTS requests for every word now; they run while the user
+# confirms the POS. The sentence audio is synthesized once and shared by all the words' notes.
+from src.services.prefetch_service import start_card_prefetch, start_sentence_audio, sentence_audio_prefix
 
-# Fetch and select image
-image_url = select_image_for_card(word)
+sentence_audio = start_sentence_audio(sentence, words)
+prefetches = {word: start_card_prefetch(word, sentence, sentence_audio=sentence_audio) for word in words}
 
-# Generate audio files
-word_audio_ref, word_audio_data = generate_tts_base64(word, word)
+cards = []
+for index, word in enumerate(words, 1):
+    if len(words) > 1:
+        print(get_message("USER_INTERACTION_INPUT_VALIDATION.word_header", word=word, index=index, total=len(words)))
+    prefetch = prefetches[word]
 
-sentence_audio_ref, sentence_audio_data = generate_tts_base64(sentence, f"sentence_{word}")
+    # Detect and confirm part of speech
+    with span("pos_prompt", category="input", word=word):
+        pos = get_confirmed_pos(word, sentence, tagged)
 
-# Get irregular verb forms
-irregular_forms_field = get_irregular_forms(word)
+    # ========================================================================
+    # STEP 4: DATA GATHERING & PROCESSING
+    # ========================================================================
 
-# Get Ukrainian translation
-print(get_message("DATA_GATHERING_PROCESSING.translation_intro"))
-translation_ua = input(get_message("DATA_GATHERING_PROCESSING.translation_prompt")).strip()
+    # Fetch dictionary data with confirmed POS
+    with span("dictionary_join", word=word):
+        dictionary_data = fetch_word_data(word, pos, prefetched=prefetch["word_data"])
+    if is_no_entry(dictionary_data):
+        continue
+
+    # Highlight focus word in sentence
+    with span("highlight", word=word):
+        pos_map = {'noun': 'n', 'verb': 'v', 'adjective': 'a', 'adverb': 'r'}
+        highlighted = highlight_focus_word(sentence, word, pos=pos_map.get(pos, 'n'))
+
+    # Fetch and select image
+    with span("pexels_join", word=word):
+        images = prefetch["images"].result()
+    with span("image_prompt", category="input", word=word):
+        image_url = select_image_for_card(word, images=images)
+
+    # Collect the word audio generated in the background
+    with span("tts_join", word=word):
+        word_audio_ref, word_audio_data = prefetch["word_audio"].result()
+
+    # Get irregular verb forms
+    irregular_forms_field = get_irregular_forms(word)
+
+    # Get Ukrainian translation
+    print(get_message("DATA_GATHERING_PROCESSING.translation_intro"))
+    with span("translation_prompt", category="input", word=word):
+        translation_ua = input(get_message("DATA_GATHERING_PROCESSING.translation_prompt")).strip()
+
+    # Format full dictionary entry
+    dictionary_entry = format_dictionary_entry(dictionary_data["dictionary_api_response"])
+
+    # Build card data dictionary
+    cards.append(({
+        "word": word,
+        "sentence": sentence,
+        "highlighted": highlighted,
+        "image_url": image_url,
+        "dictionary_data": dictionary_data,
+        "word_audio_ref": word_audio_ref,
+        "irregular_forms_field": irregular_forms_field,
+        "dictionary_entry": dictionary_entry,
+        "translation_ua": translation_ua,
+        "config": config,
+        "deck_name": deck_name
+    }, word_audio_data))
+
+if not cards:
+    sys.exit(1)
 
-# Format full dictionary entry
-dictionary_entry = format_dictionary_entry(dictionary_data["dictionary_api_response"])
+with span("tts_join", word="sentence"):
+    sentence_audio_ref, sentence_audio_data = sentence_audio.result()
 
 # ============================================================================
 # STEP 5: MEDIA FILE UPLOAD
 # ============================================================================
 
-# Upload audio files to Anki
-send_media_file(f"tts_{word}.mp3", word_audio_data)
-send_media_file(f"tts_sentence_{word}.mp3", sentence_audio_data)
+# Upload audio files to Anki: the sentence once, then one file per word
+with span("media_upload"):
+    send_media_file(f"tts_{sentence_audio_prefix(sentence, words)}.mp3", sentence_audio_data)
+    for card_data, word_audio_data in cards:
+        send_media_file(f"tts_{card_data['word']}.mp3", word_audio_data)
 
 # ============================================================================
 # STEP 6: CARD CONSTRUCTION & SUBMISSION
 # ============================================================================
 
-# Build card data dictionary
-card_data = {
-    "word": word,
-    "sentence": sentence,
-    "highlighted": highlighted,
-    "image_url": image_url,
-    "dictionary_data": dictionary_data,
-    "sentence_audio_ref": sentence_audio_ref,
-    "word_audio_ref": word_audio_ref,
-    "irregular_forms_field": irregular_forms_field,
-    "dictionary_entry": dictionary_entry,
-    "translation_ua": translation_ua,
-    "config": config,
-    "deck_name": deck_name
-}
-
-# Submit card to Anki
-submit_note_to_anki(**card_data)
+# Submit cards to Anki (the deck must exist by now)
+with span("add_note"):
+    bootstrap.wait("deck")
+    for card_data, _ in cards:
+        submit_note_to_anki(sentence_audio_ref=sentence_audio_ref, **card_data)
@@ -16,6 +16,19 @@ Examples:
   python3 generate_card.py                    # Run normally
   python3 generate_card.py --set-language     # Set/reset language preference
   python3 generate_card.py -l                 # Set/reset language preference (short)
+  python3 generate_card.py --serve            # Keep running and accept cards over loopback HTTP
+  python3 generate_card.py --batch words.tsv  # Build one card per row (sentence, word, [pos], [translation], [image])
+  python3 generate_card.py --annotate ch1.txt # CEFR level and frequency band of every word in a text
+  python3 generate_card.py --study-list books/*.txt.gz > study.tsv  # Words to learn next, as a --batch file
+  python3 generate_card.py --index-corpus books/   # Index sentences once, then:
+  python3 generate_card.py --mine-sentences words.txt > cards.tsv  # Best sentence per word, as a --batch file
+  python3 generate_card.py --i-plus-one --known-level A2 > cards.tsv  # Sentences with exactly one new word
+  python3 generate_card.py --coverage books/*.txt.gz  # How much of the text your deck covers, and what to add
+  python3 generate_card.py --build-thesaurus  # Compile WordNet synonyms/antonyms once, for lookups without API quota
+  python3 generate_card.py --refresh          # Fetch dictionary entries again instead of using the cache
+  python3 generate_card.py --cache-stats      # Show dictionary cache hits, misses and bytes saved
+  python3 generate_card.py --trace out.json   # Write a timeline of every step and upstream call
+  python3 generate_card.py --profile          # Write card_profile.pstats and card_profile.collapsed
         """,
          allow_abbrev=False  # <---- IMPORTANT: Disallows partial matches
     )
@@ -26,6 +39,125 @@ Examples:
         help='Set or reset the language preference (English/Ukrainian)'
     )
 
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run as a long-lived card server on 127.0.0.1 (POST /cards returns the note ID)'
+    )
+
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=None,
+        help='Port for --serve (default: CARD_SERVER_PORT from .env or 8766)'
+    )
+
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        default=None,
+        help='Build cards non-interactively from a TSV/CSV file: sentence, word, [pos], [translation], [image]'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Number of cards built concurrently in --batch mode, or corpus chunks profiled in parallel with --study-list/--coverage (default: 4)'
+    )
+
+    parser.add_argument(
+        '--annotate',
+        metavar='FILE',
+        default=None,
+        help="Print the CEFR level and frequency band of every word in a text file as TSV ('-' reads stdin)"
+    )
+
+    parser.add_argument(
+        '--study-list',
+        metavar='FILE',
+        nargs='+',
+        default=None,
+        help='Profile text or .gz corpora and print the words not in your deck yet, by CEFR level, as a --batch file'
+    )
+
+    parser.add_argument(
+        '--save-profile',
+        metavar='FILE',
+        default=None,
+        help='With --study-list: also save the merged word counts to FILE (.json), to pass again with new corpora'
+    )
+
+    parser.add_argument(
+        '--index-corpus',
+        metavar='DIR',
+        default=None,
+        help='Index the sentences of every .txt/.srt file (or .gz) under DIR for --mine-sentences'
+    )
+
+    parser.add_argument(
+        '--mine-sentences',
+        metavar='FILE',
+        default=None,
+        help="Print the best indexed sentence for every word in FILE (one per line, '-' reads stdin) as a --batch file"
+    )
+
+    parser.add_argument(
+        '--i-plus-one',
+        action='store_true',
+        help='Print indexed sentences with exactly one word not in your deck (one per new word) as a --batch file'
+    )
+
+    parser.add_argument(
+        '--known-level',
+        metavar='LEVEL',
+        choices=('A1', 'A2', 'B1', 'B2', 'C1', 'C2'),
+        default=None,
+        help='With --i-plus-one: also treat every word up to this CEFR level as known'
+    )
+
+    parser.add_argument(
+        '--coverage',
+        metavar='FILE',
+        nargs='*',
+        default=None,
+        help='Report how much of the corpora (or, with no FILE, of the CSV frequency ranking) your deck covers, with band/level gaps and the words that add the most'
+    )
+
+    parser.add_argument(
+        '--build-thesaurus',
+        action='store_true',
+        help='Compile the WordNet relations of the CEFR vocabulary into the local thesaurus table, then exit'
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Bypass the persistent DictionaryAPI cache for this run (fresh responses still replace cached ones)'
+    )
+
+    parser.add_argument(
+        '--cache-stats',
+        action='store_true',
+        help='Print the size of the DictionaryAPI cache and its hits, misses and bytes saved, then exit'
+    )
+
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        default=None,
+        help='Record per-stage timing spans and write a Chrome trace (chrome://tracing, Perfetto) to FILE'
+    )
+
+    parser.add_argument(
+        '--profile',
+        metavar='PREFIX',
+        nargs='?',
+        const='card_profile',
+        default=None,
+        help='Profile CPU time (input() waits excluded) and write PREFIX.pstats and PREFIX.collapsed (default PREFIX: card_profile)'
+    )
+
     def custom_error(message):
         sys.stderr.write(f'\n❌ {message}\n')
         parser.print_help(sys.stderr)
@@ -38,12 +170,14 @@ Examples:
         sys.exit(e.code)
     return args
 
-def handle_cli_arguments():
+def handle_cli_arguments(args=None):
     """
     Handle CLI arguments and perform appropriate actions.
+    Accepts already parsed arguments, otherwise parses sys.argv.
     Returns True if the program should continue, False if it should exit.
     """
-    args = parse_arguments()
+    if args is None:
+        args = parse_arguments()
     
     if args.set_language:
         # Configure language and exit
@@ -27,6 +27,36 @@ BIGHUGE_API_URL = os.getenv("BIGHUGE_API_URL", "https://words.bighugelabs.com/ap
 PEXELS_API_URL = os.getenv("PEXELS_API_URL", "https://api.pexels.com/v1/search") 
 PEXELS_IMAGE_COUNT = int(os.getenv("PEXELS_IMAGE_COUNT", "16")) 
 
+# Dictionary sources, tried in order until one has an entry: "dictionaryapi" (api.dictionaryapi.dev)
+# and "wordnet" (offline NLTK WordNet). "wordnet,dictionaryapi" makes the offline one primary.
+DICTIONARY_BACKEND_NAMES = [
+    name.strip().lower() for name in os.getenv("DICTIONARY_BACKENDS", "dictionaryapi,wordnet").split(",") if name.strip()
+]
+# Seconds to wait for the DictionaryAPI before falling back to the next backend
+DICTIONARY_API_TIMEOUT = float(os.getenv("DICTIONARY_API_TIMEOUT", "5"))
+
+# Thesaurus sources, tried in order until one has the word: "wordnet" (the local table built with
+# `generate_card.py --build-thesaurus`) and "bighuge" (Big Huge Thesaurus, needs BIG_HUGE_API_KEY).
+# "wordnet" alone never spends API quota and needs no key.
+THESAURUS_BACKEND_NAMES = [
+    name.strip().lower() for name in os.getenv("THESAURUS_BACKENDS", "wordnet,bighuge").split(",") if name.strip()
+]
+# The thesaurus is not asked when the dictionary entry already lists this many synonyms for the
+# part of speech; the Synonyms/Antonyms fields then come from the entry and Related/Similar stay empty
+# (the dictionary has neither). 0 always asks the thesaurus.
+THESAURUS_SKIP_MIN_SYNONYMS = int(os.getenv("THESAURUS_SKIP_MIN_SYNONYMS", "5"))
+
+# Persistent cache of DictionaryAPI responses (SQLite); set DICTIONARY_CACHE_PATH= (empty) to disable it.
+# Entries older than the TTL are fetched again; beyond the size limit the least recently used are dropped.
+DICTIONARY_CACHE_PATH = os.getenv("DICTIONARY_CACHE_PATH", "data/dictionary_cache.sqlite")
+DICTIONARY_CACHE_TTL_DAYS = float(os.getenv("DICTIONARY_CACHE_TTL_DAYS", "30"))
+# Words the DictionaryAPI has no entry for are asked again sooner: it may add them, or the word was a typo
+DICTIONARY_CACHE_MISS_TTL_HOURS = float(os.getenv("DICTIONARY_CACHE_MISS_TTL_HOURS", "24"))
+DICTIONARY_CACHE_MAX_MB = float(os.getenv("DICTIONARY_CACHE_MAX_MB", "50"))
+
+# Loopback port for the card server started with `generate_card.py --serve`
+CARD_SERVER_PORT = int(os.getenv("CARD_SERVER_PORT", "8766"))
+
 # User locale for message translation (e.g., 'en' or 'uk')
 # Check if USER_LOCALE is set, if not, it will be handled by language_config module
 USER_LOCALE = os.getenv("USER_LOCALE", "") 
\ No newline at end of file
@@ -4,9 +4,6 @@ POS (Part of Speech) detection and other linguistic utilities.
 
 import sys
 import os
-import nltk
-from nltk import pos_tag, word_tokenize
-from nltk.stem import WordNetLemmatizer
 import re
 from src.locales.loader import get_message
 
@@ -18,16 +15,34 @@ if project_root not in sys.path:
 from data.irregular_verbs import irregular_verbs
 
 
-def detect_pos_from_context(word, sentence):
+def tag_sentence(sentence):
+    """
+    Tokenizes and POS-tags a sentence once, so several focus words can share the result.
+    Returns a list of (token, tag) pairs, or None if NLTK is unavailable.
+    """
+    try:
+        from nltk import pos_tag, word_tokenize
+
+        return pos_tag(word_tokenize(sentence.strip()))
+    except Exception:
+        return None
+
+
+def detect_pos_from_context(word, sentence, tagged=None):
     """
     Optimized POS detection: fast suffix check, then NLTK tagging, then lemmatization, with early return. Irregular verb logic removed.
     Args:
         word (str): The word to detect POS for
         sentence (str): The sentence containing the word
+        tagged (list, optional): Output of tag_sentence(sentence), to skip re-tagging
     Returns:
         str: "noun", "verb", "adjective", "adverb", or None if not detected
     """
     try:
+        # NLTK is imported here rather than at module level: it costs ~300 ms on a cold start
+        from nltk import pos_tag, word_tokenize
+        from nltk.stem import WordNetLemmatizer
+
         lemmatizer = WordNetLemmatizer()
         word = word.lower().strip()
         sentence = sentence.strip()
@@ -41,8 +56,8 @@ def detect_pos_from_context(word, sentence):
             return 'verb'
 
         # 2. NLTK tokenization and POS tagging
-        tokens = word_tokenize(sentence)
-        tagged = pos_tag(tokens)
+        if tagged is None:
+            tagged = pos_tag(word_tokenize(sentence))
         for token, tag in tagged:
             if token.lower() == word:
                 if tag.startswith('VB'):
@@ -69,6 +84,21 @@ def detect_pos_from_context(word, sentence):
         return _fallback_pos_detection(word, sentence)
 
 
+def warm_up_nltk():
+    """
+    Loads the tokenizer, the perceptron tagger and WordNet ahead of the first detect_pos_from_context call.
+    Runs on a background thread at startup; errors are ignored because POS detection has its own fallback.
+    """
+    try:
+        from nltk import pos_tag, word_tokenize
+        from nltk.stem import WordNetLemmatizer
+
+        WordNetLemmatizer().lemmatize("warming", pos="v")
+        pos_tag(word_tokenize("The tagger is warming up."))
+    except Exception:
+        pass
+
+
 def _fallback_pos_detection(word, sentence):
     """
     Fallback POS detection using simple rules when NLTK fails.
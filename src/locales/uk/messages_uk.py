@@ -42,7 +42,15 @@ USER_INTERACTION_INPUT_VALIDATION = {
     # POS detection error
     "pos_detection_error": "⚠️ Помилка при визначенні частини мови: {error}",
     # Word and POS prompts (from user_messages.py)
-    "word_prompt": "🔤 Введи слово, яке хочеш вивчати: ",
+    "word_prompt": "🔤 Введи слово, яке хочеш вивчати (кілька слів розділяй комами): ",
+    "word_header": "\n━━ {word} ({index}/{total}) ━━",
+    "word_suggestions": "💡 Пропоновані слова: {choices}\n   Введи номер, слово або кілька через кому (напр. 1, 3 або 2, flee).",
+    "word_suggestion_item": "{index}) {word} [{level}]",
+    "spelling_unknown": "❓ Слова \"{word}\" немає у словнику. Можливо, ти мав на увазі: {choices}",
+    "spelling_suggestion_item": "{index}) {word} ({frequency})",
+    "spelling_prompt": "   Введи номер, щоб вибрати варіант, інше слово для заміни або натисни Enter, щоб залишити \"{word}\": ",
+    "word_not_provided": "Слово для вивчення не введено. Вихід.",
+    "no_words_left": "Не залишилося слів, для яких можна створити картки. Вихід.",
     "pos_prompt": "📝 Частина мови [{detected_pos}] [Натисни Enter для підтвердження або поміняй (noun/verb/adjective/adverb)]: ",
     "about_message": "🃏 AnkiCardsToolkit v{version} від Олега Ковальова - Створюйте картку Anki зі слова у вашому реченні\n"
 }
@@ -54,8 +62,12 @@ DATA_GATHERING_PROCESSING = {
     # CEFR/frequency data loading
     "cefr_loaded": "✅ Завантажено дані CEFR/частотності для {count} слів",
     "cefr_load_error": "⚠️ Не вдалося завантажити дані CEFR/частотності: {error}",
+    "cefr_csv_unreadable": "не вдається прочитати '{path}': {error}",
+    "cefr_csv_invalid": "'{path}' не має заголовка 'Word,CEFR,Frequency' або рядків. Відновіть його з git або згенеруйте заново (див. README, 'CEFR & Frequency Integration').",
     # Dictionary fetch/format
     "dict_fetch_error": "❌ Не вдалося отримати дані зі словника для '{word}'.",
+    "dict_no_entry": "❌ У словнику немає статті для '{word}'; слово пропущено.",
+    "dict_backend_unknown": "⚠️ Невідоме джерело словника '{name}' у DICTIONARY_BACKENDS (можливі: {choices}).",
     "dict_format_error": "❌ Помилка форматування даних словника: {error}",
     "dict_format_invalid": "Недійсні дані словника.",
     "dict_format_generic": "Помилка форматування словникового запису.",
@@ -65,6 +77,7 @@ DATA_GATHERING_PROCESSING = {
     "thesaurus_key_missing": "❌ BIG_HUGE_API_KEY не знайдено. Перевірте ваш .env файл.",
     "thesaurus_query": "\n🔍 Запит до Big Huge Thesaurus для слова '{word}'...",
     "thesaurus_success": "✅ Отримано відповідь від Big Huge Thesaurus",
+    "thesaurus_backend_unknown": "⚠️ Невідоме джерело тезауруса '{name}' у THESAURUS_BACKENDS (можливі: {choices}).",
     # Image selection
     "no_images_found": "Зображень не знайдено.",
     "image_number_prompt": "\n🔢 Введіть номер зображення (1-{max}) або натисніть Enter для пропуску: ",
@@ -126,6 +139,85 @@ CARD_CONSTRUCTION_SUBMISSION = {
     "note_add_error": "❌ Помилка додавання картки: {error}"
 }
 
+# SERVER MODE (generate_card.py --serve)
+SERVER_MODE = {
+    "listening": "🌐 Сервер карток слухає на {url} (колода за замовчуванням: {deck_name}). Натисніть Ctrl+C для зупинки.",
+    "stopped": "\n🛑 Сервер карток зупинено.",
+    "request_error": "❌ Не вдалося обробити запит на картку: {error}"
+}
+
+# BATCH MODE (generate_card.py --batch)
+BATCH_MODE = {
+    "started": "📦 Створення карток з {path} у колоду '{deck_name}' (по {workers} одночасно)...",
+    "journal": "📒 Журнал прогресу: {path} (повторіть ту саму команду, щоб продовжити)",
+    "row_added": "✅ Рядок {row}: '{word}' додано, ID = {note_id}",
+    "row_failed": "❌ Рядок {row}: '{word}' не вдалося: {error}",
+    "summary": "\n📊 Пакет завершено: додано {added}, з помилками {failed}",
+    "file_error": "❌ Не вдалося прочитати пакетний файл: {error}"
+}
+
+# ANNOTATE MODE (--annotate)
+ANNOTATE_MODE = {
+    "summary": "📊 Розмічено {tokens} слів ({unique} різних) за {seconds:.2f} с",
+    "level_counts": "   {counts}",
+    "file_error": "❌ Не вдалося прочитати текстовий файл: {error}"
+}
+
+# STUDY LIST MODE (--study-list)
+STUDY_LIST_MODE = {
+    "summary": "📊 Корпусів: {files}, слів: {tokens}, різних слів: {lemmas} (уже в колоді: {known})",
+    "level_counts": "   {counts}",
+    "file_error": "❌ Не вдалося прочитати файл корпусу: {error}"
+}
+
+# SENTENCE MINING MODE (--index-corpus, --mine-sentences)
+SENTENCE_MINING_MODE = {
+    "index_built": "📚 Проіндексовано {sentences} речень для {lemmas} слів із {files} файлів за {seconds:.1f} с → {path}",
+    "index_missing": "❌ Не вдалося відкрити індекс речень {path} ({error}). Спершу створи його: python generate_card.py --index-corpus DIR",
+    "mined": "📊 Речення знайдено для {found}/{total} слів ({micros:.0f} мкс на слово)",
+    "not_found": "   Без речення: {words}",
+    "file_error": "❌ Не вдалося прочитати файл: {error}"
+}
+
+# I+1 MODE (--i-plus-one)
+I_PLUS_ONE_MODE = {
+    "summary": "📊 Речень в індексі: {sentences}, відомих слів: {known} (з колоди: {deck}). Речень рівно з одним новим словом: {matches}, нових слів: {words}"
+}
+
+# COVERAGE MODE (--coverage)
+COVERAGE_MODE = {
+    "reference_corpus": "корпусів: {files}, слів: {tokens}",
+    "reference_table": "частотний рейтинг {path}",
+    "summary": "📊 Порівняно з {reference}: у колоді {known} з {words} слів, це {deck:.1f}% тексту ({with_stopwords:.1f}% разом зі службовими словами)",
+    "bands_header": "Частотні діапазони (9 = найчастіші): слів у колоді, частка тексту, покрито, прогалина",
+    "levels_header": "Рівні CEFR: слів у колоді, частка тексту, покрито, прогалина",
+    "gap_row": "   {label:>2}  {known:>6}/{words:<6}  {share:5.1f}%  {covered:5.1f}%  {gap:5.1f}%",
+    "gains_header": "Топ {count} слів поза колодою за приростом покриття (наростаючим підсумком):",
+    "gain_row": "   {rank:>3}. {word} ({level}) → {coverage:.1f}%",
+    "target_row": "🎯 Покриття {target:.0f}%: ще {count} слів",
+    "target_unreachable": "🎯 Покриття {target:.0f}%: недосяжне лише зі словником CEFR",
+    "file_error": "❌ Не вдалося прочитати файл корпусу: {error}"
+}
+
+# DICTIONARY CACHE (--refresh, --cache-stats)
+DICTIONARY_CACHE = {
+    "stats": "🗄️ Кеш словника {path}: слів: {entries} (без статті: {not_found}), байтів: {bytes}. Влучань: {hits}, промахів: {misses}, заощаджено байтів: {bytes_saved}",
+    "disabled": "🗄️ Кеш словника вимкнено (DICTIONARY_CACHE_PATH порожній або його не вдається відкрити)"
+}
+
+# THESAURUS TABLE (--build-thesaurus)
+THESAURUS_TABLE = {
+    "built": "📚 Локальний тезаурус: {words} слів, {bytes} байтів, зібрано за {seconds:.1f}s → {path}",
+    "missing": "ℹ️ Локальний тезаурус {path} не зібрано або він застарів; зберіть його: python generate_card.py --build-thesaurus",
+    "wordnet_missing": "❌ Для збирання тезауруса потрібні дані WordNet: python scripts/install_nltk_data.py",
+    "write_error": "❌ Не вдалося записати тезаурус: {error}"
+}
+
+# DICTIONARY CARD HTML (rendered on the Anki card back)
+DICTIONARY_HTML = {
+    "cefr_lemma_title": "Рівень базової форми"
+}
+
 # DEVELOPER / SYSTEM MESSAGES
 DEVELOPER_NOTES = {
     "nltk_download_failure": "⚠️ Не вдалося завантажити дані NLTK для тестування: {error}"
@@ -2,23 +2,32 @@ import requests
 import sys
 from src.config import settings
 from src.locales.loader import get_message
+from src.utils.tracing import traced
 
 ANKI_CONNECT_URL = settings.ANKI_CONNECT_URL
 
-def check_anki_connect():
-    """Check if AnkiConnect is available. If not, print instructions and exit immediately."""
+def is_anki_connect_available(timeout: int = 5) -> bool:
+    """Probe AnkiConnect without printing or exiting, so it can run on a background thread."""
     try:
-        response = requests.get(ANKI_CONNECT_URL)
+        requests.get(ANKI_CONNECT_URL, timeout=timeout)
         return True
-    except requests.exceptions.ConnectionError:
-        print(get_message("ANKI_CONNECTION_CHECK.connection_error"))
-        print(get_message("ANKI_CONNECTION_CHECK.setup_instructions"))
-        sys.exit(1)
     except Exception:
+        return False
+
+def check_anki_connect(available: bool = None):
+    """
+    Check if AnkiConnect is available. If not, print instructions and exit immediately.
+    Pass `available` to reuse the result of a probe that already ran in the background.
+    """
+    if available is None:
+        available = is_anki_connect_available()
+    if not available:
         print(get_message("ANKI_CONNECTION_CHECK.connection_error"))
         print(get_message("ANKI_CONNECTION_CHECK.setup_instructions"))
         sys.exit(1)
+    return True
 
+@traced(category="anki")
 def add_note(note: dict):
     """
     Sends an addNote request to AnkiConnect.
@@ -0,0 +1,114 @@
+"""Non-interactive batch mode: builds one card per row of a TSV/CSV file (`generate_card.py --batch`)."""
+
+import csv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from src.locales.loader import get_message
+from src.services.anki_service import check_anki_connect
+from src.services.deck_service import create_deck_if_not_exists
+from src.services.card_service import create_card
+from src.services.job_journal import JobJournal
+from src.services.cefr_data import require_cefr_frequency_data, get_cefr_lemma_map
+from src.linguistics.pos import warm_up_nltk
+
+BATCH_COLUMNS = ("sentence", "word", "pos", "translation", "image")
+DEFAULT_BATCH_WORKERS = 4
+
+def read_batch_rows(path: str):
+    """
+    Lazily yields (row_number, row) pairs from a batch file.
+    Columns: sentence, word, [pos], [translation], [image]. Files ending in .csv
+    are comma-separated, anything else is tab-separated. Blank rows, rows starting
+    with '#' and a header row beginning with "sentence" are skipped.
+    """
+    delimiter = "," if path.lower().endswith(".csv") else "\t"
+    with open(path, newline="", encoding="utf-8") as f:
+        for row_number, cells in enumerate(csv.reader(f, delimiter=delimiter), 1):
+            if not cells or not any(c.strip() for c in cells) or cells[0].lstrip().startswith("#"):
+                continue
+            if row_number == 1 and cells[0].strip().lower() == "sentence":
+                continue
+            cells = [c.strip() for c in cells] + [""] * (len(BATCH_COLUMNS) - len(cells))
+            yield row_number, dict(zip(BATCH_COLUMNS, cells))
+
+
+def parse_batch_row(row: dict) -> dict:
+    """Converts a raw batch row into create_card() keyword arguments. Raises ValueError if invalid."""
+    if not row["sentence"] or not row["word"]:
+        raise ValueError("sentence and word are required")
+    image = row["image"]
+    if image and (not image.isdigit()):
+        raise ValueError(f"image must be a non-negative number, got '{image}'")
+    return {
+        "sentence": row["sentence"],
+        "word": row["word"],
+        "pos": row["pos"] or None,
+        "translation": row["translation"],
+        "image_choice": int(image) if image else 1,
+    }
+
+
+def journal_path_for(batch_path: str) -> str:
+    """The journal lives next to the batch file, so re-running the same file resumes it."""
+    return f"{batch_path}.journal.sqlite"
+
+
+def _process_row(row: dict, config: dict, deck_name: str, journal: JobJournal = None) -> int:
+    card_args = parse_batch_row(row)
+    card_journal = journal.card(card_args["sentence"], card_args["word"]) if journal else None
+    return create_card(config=config, deck_name=deck_name, journal=card_journal, **card_args)
+
+
+def process_batch_rows(rows, config: dict, deck_name: str, workers: int = DEFAULT_BATCH_WORKERS,
+                       journal: JobJournal = None) -> dict:
+    """
+    Runs the card pipeline for every row with at most `workers` cards in flight.
+    Rows are pulled from the iterator only when a slot frees up, so memory stays
+    flat for any input size; results are reported in input order.
+    With a journal, stages finished by an earlier interrupted run are skipped.
+
+    Returns:
+        dict: {"added": int, "failed": int}
+    """
+    summary = {"added": 0, "failed": 0}
+    in_flight = deque()
+
+    def report(row_number, row, future):
+        try:
+            note_id = future.result()
+        except Exception as e:
+            summary["failed"] += 1
+            print(get_message("BATCH_MODE.row_failed", row=row_number, word=row["word"], error=str(e)))
+        else:
+            summary["added"] += 1
+            print(get_message("BATCH_MODE.row_added", row=row_number, word=row["word"], note_id=note_id))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as executor:
+        for row_number, row in rows:
+            if len(in_flight) >= workers:
+                report(*in_flight.popleft())
+            in_flight.append((row_number, row, executor.submit(_process_row, row, config, deck_name, journal)))
+        while in_flight:
+            report(*in_flight.popleft())
+    return summary
+
+
+def run_batch(path: str, config: dict, deck_name: str, workers: int = DEFAULT_BATCH_WORKERS) -> dict:
+    """
+    Checks AnkiConnect and the CEFR data, prepares the deck and NLTK once, then processes the whole batch file.
+    Progress is journaled next to the file; delete the journal to rebuild every card from scratch.
+    """
+    check_anki_connect()
+    require_cefr_frequency_data()
+    create_deck_if_not_exists(deck_name)
+    warm_up_nltk()
+    get_cefr_lemma_map()
+    journal = JobJournal(journal_path_for(path))
+    print(get_message("BATCH_MODE.started", path=path, deck_name=deck_name, workers=workers))
+    print(get_message("BATCH_MODE.journal", path=journal.path))
+    try:
+        summary = process_batch_rows(read_batch_rows(path), config, deck_name, workers, journal)
+    finally:
+        journal.close()
+    print(get_message("BATCH_MODE.summary", added=summary["added"], failed=summary["failed"]))
+    return summary
@@ -0,0 +1,64 @@
+"""Runs slow startup work on background threads while the user answers the first prompts."""
+
+from src.utils.concurrency import run_in_background
+from src.services.anki_service import is_anki_connect_available, check_anki_connect
+from src.services.cefr_data import get_cefr_frequency_data, get_cefr_lemma_map, CefrDataError, exit_on_cefr_error
+from src.services.deck_service import create_deck_if_not_exists, get_deck_words
+from src.linguistics.pos import warm_up_nltk
+
+class StartupBootstrap:
+    """
+    Starts the AnkiConnect probe, the CEFR table load, the NLTK warm-up and then the
+    CEFR lemma map in the background.
+    Each task is joined by the step that first needs its result, so the first card sees no cold-load stalls.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    def start(self) -> "StartupBootstrap":
+        self._tasks["anki"] = run_in_background(is_anki_connect_available)
+        self._tasks["cefr"] = run_in_background(get_cefr_frequency_data)
+        self._tasks["nltk"] = run_in_background(warm_up_nltk)
+        self._tasks["lemmas"] = run_in_background(self._load_lemmas)
+        return self
+
+    def _load_lemmas(self):
+        # WordNet must be fully loaded by the NLTK warm-up first: its lazy loader is not thread-safe
+        self.wait("nltk")
+        self.wait("cefr")
+        return get_cefr_lemma_map()
+
+    def create_deck(self, deck_name: str) -> None:
+        """Send the createDeck request in the background while the user picks a sentence."""
+        self._tasks["deck"] = run_in_background(create_deck_if_not_exists, deck_name)
+
+    def load_deck_words(self, deck_name: str) -> None:
+        """Fetch the Word field of the deck's notes in the background, for focus-word suggestions."""
+        self._tasks["deck_words"] = run_in_background(get_deck_words, deck_name)
+
+    def load_spelling_index(self) -> None:
+        """Read (or build) the typo index of the CEFR vocabulary in the background, for the word prompt."""
+        self._tasks["spelling"] = run_in_background(self._load_spelling_index)
+
+    def _load_spelling_index(self):
+        # Imported here: NumPy is not needed until the first focus word is checked
+        from src.services.spelling_service import get_spelling_index
+        self.wait("cefr")
+        return get_spelling_index()
+
+    def wait(self, name: str):
+        """Block until the named task finishes and return its result (None if it was never started)."""
+        task = self._tasks.get(name)
+        return task.result() if task else None
+
+    def ensure_anki_connect(self) -> None:
+        """Exit with setup instructions if the background probe could not reach AnkiConnect."""
+        check_anki_connect(available=self.wait("anki"))
+
+    def ensure_cefr_data(self) -> None:
+        """Exit with the reason if the CEFR/frequency table could not be loaded or compiled."""
+        try:
+            self.wait("cefr")
+        except CefrDataError as e:
+            exit_on_cefr_error(e)
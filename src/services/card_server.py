@@ -0,0 +1,126 @@
+"""Loopback HTTP API that keeps the card pipeline warm between requests (`generate_card.py --serve`)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.locales.loader import get_message
+from src.services.anki_service import check_anki_connect
+from src.services.cefr_data import require_cefr_frequency_data, get_cefr_lemma_map
+from src.services.deck_service import create_deck_if_not_exists
+from src.services.card_service import create_card, CardGenerationError
+from src.linguistics.pos import warm_up_nltk
+
+SERVER_HOST = "127.0.0.1"
+
+def parse_card_request(payload) -> dict:
+    """
+    Validates a JSON card request and returns keyword arguments for create_card().
+    Expected keys: "sentence", "word" and optionally "pos", "translation", "image", "deck".
+    Raises ValueError with a readable message for malformed requests.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("request body must be a JSON object")
+    for key in ("sentence", "word"):
+        if not isinstance(payload.get(key), str) or not payload[key].strip():
+            raise ValueError(f"'{key}' must be a non-empty string")
+    for key in ("pos", "translation", "deck"):
+        if payload.get(key) is not None and not isinstance(payload[key], str):
+            raise ValueError(f"'{key}' must be a string")
+    image = payload.get("image", 1)
+    if isinstance(image, bool) or not isinstance(image, int) or image < 0:
+        raise ValueError("'image' must be a non-negative integer (0 = no image)")
+    return {
+        "sentence": payload["sentence"],
+        "word": payload["word"],
+        "pos": payload.get("pos") or None,
+        "translation": payload.get("translation") or "",
+        "image_choice": image,
+        "deck_name": payload.get("deck") or None,
+    }
+
+
+class CardRequestHandler(BaseHTTPRequestHandler):
+    """Handles `GET /health` and `POST /cards` on the loopback interface."""
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/cards":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            card_request = parse_card_request(json.loads(self.rfile.read(length) or b"null"))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        deck_name = card_request.pop("deck_name") or self.server.deck_name
+        try:
+            self.server.ensure_deck(deck_name)
+            note_id = create_card(config=self.server.config, deck_name=deck_name, **card_request)
+        except CardGenerationError as e:
+            self._send_json(422, {"error": str(e)})
+            return
+        except (Exception, SystemExit) as e:
+            # Anything else (AnkiConnect/network errors, sys.exit() left in the pipeline) must not
+            # drop the connection: the client gets a JSON 500 and the server keeps running
+            error = str(e) or type(e).__name__
+            print(get_message("SERVER_MODE.request_error", error=error))
+            self._send_json(500, {"error": error})
+            return
+        self._send_json(201, {"note_id": note_id, "deck": deck_name})
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class CardServer(ThreadingHTTPServer):
+    """HTTP server that holds the configuration and remembers which decks already exist."""
+
+    daemon_threads = True
+
+    def __init__(self, address, config: dict, deck_name: str):
+        super().__init__(address, CardRequestHandler)
+        self.config = config
+        self.deck_name = deck_name
+        self._known_decks = set()
+        self._deck_lock = threading.Lock()
+
+    def ensure_deck(self, deck_name: str) -> None:
+        """
+        Sends createDeck once per deck for the lifetime of the server; a failed call
+        (e.g. Anki not running yet) is retried with the next card for that deck.
+        """
+        with self._deck_lock:
+            if deck_name not in self._known_decks and create_deck_if_not_exists(deck_name):
+                self._known_decks.add(deck_name)
+
+
+def serve(config: dict, deck_name: str, port: int, host: str = SERVER_HOST) -> None:
+    """
+    Loads everything a card needs once (AnkiConnect check, CEFR table, NLTK models)
+    and then serves card requests until interrupted with Ctrl+C.
+    """
+    check_anki_connect()
+    require_cefr_frequency_data()
+    warm_up_nltk()
+    get_cefr_lemma_map()
+
+    server = CardServer((host, port), config, deck_name)
+    print(get_message("SERVER_MODE.listening", url=f"http://{host}:{port}", deck_name=deck_name))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(get_message("SERVER_MODE.stopped"))
+    finally:
+        server.server_close()
@@ -0,0 +1,122 @@
+"""Non-interactive card pipeline shared by the daemon and batch modes."""
+
+from src.locales.loader import get_message
+from src.linguistics.pos import detect_pos_from_context, get_irregular_forms
+from src.utils.highlight import highlight_focus_word
+from src.services.dictionary_service import fetch_word_data, format_dictionary_entry, is_no_entry, is_known_no_entry
+from src.services.media_service import send_media_file
+from src.services.anki_service import add_note
+from src.services.prefetch_service import start_card_prefetch
+from src.utils.note_builder import build_anki_note
+from src.utils.tracing import span
+
+POS_MAP = {'noun': 'n', 'verb': 'v', 'adjective': 'a', 'adverb': 'r'}
+
+class CardGenerationError(Exception):
+    """Raised when a card cannot be built; the message is safe to show to the caller."""
+
+
+def pick_image(images: list, image_choice: int = 1) -> str:
+    """
+    Returns the image URL for a 1-based choice, mirroring the interactive selector:
+    0 skips the image, an out-of-range number falls back to the first image.
+    """
+    if not images or image_choice == 0:
+        return ""
+    if 1 <= image_choice <= len(images):
+        return images[image_choice - 1]['src']['medium']
+    return images[0]['src']['medium']
+
+
+def create_card(
+    sentence: str,
+    word: str,
+    config: dict,
+    deck_name: str,
+    pos: str = None,
+    translation: str = "",
+    image_choice: int = 1,
+    prefetch: dict = None,
+    journal=None
+) -> int:
+    """
+    Runs the full card pipeline without prompts and returns the new note ID.
+
+    Args:
+        sentence (str): The context sentence.
+        word (str): The focus word.
+        config (dict): Configuration from config_build().
+        deck_name (str): Target Anki deck (must already exist).
+        pos (str, optional): Part of speech; detected from the sentence when omitted.
+        translation (str, optional): Value for the Translation_UA field.
+        image_choice (int, optional): 1-based Pexels result to use, 0 for no image.
+        prefetch (dict, optional): Result of start_card_prefetch() if it was started earlier.
+        journal (CardJournal, optional): Records each stage's output and skips stages
+            that an interrupted earlier run already completed.
+
+    Raises:
+        CardGenerationError: If the dictionary has no entry, TTS fails or Anki rejects the note.
+            A word the dictionary cache already knows has no entry fails before any request.
+    """
+    word = word.strip().lower()
+    sentence = sentence.strip()
+    if not word or not sentence:
+        raise CardGenerationError(get_message("GENERAL_ERRORS.invalid_input", error="sentence and word are required"))
+
+    saved_note_id = journal.get("note") if journal is not None else None
+    if saved_note_id is not None:
+        return saved_note_id
+    if prefetch is None:
+        if is_known_no_entry(word):
+            raise CardGenerationError(get_message("DATA_GATHERING_PROCESSING.dict_no_entry", word=word))
+        prefetch = start_card_prefetch(word, sentence, exit_on_error=False, journal=journal)
+    with span("pos_tagging", word=word):
+        pos = (pos or detect_pos_from_context(word, sentence) or "noun").strip().lower()
+
+    with span("dictionary_join", word=word):
+        dictionary_data = fetch_word_data(word, pos, prefetched=prefetch["word_data"], exit_on_error=False)
+    if is_no_entry(dictionary_data):
+        raise CardGenerationError(get_message("DATA_GATHERING_PROCESSING.dict_no_entry", word=word))
+    if not dictionary_data:
+        raise CardGenerationError(get_message("DATA_GATHERING_PROCESSING.dict_fetch_error", word=word))
+
+    with span("highlight", word=word):
+        highlighted = highlight_focus_word(sentence, word, pos=POS_MAP.get(pos, 'n'))
+    with span("pexels_join", word=word):
+        image_url = pick_image(prefetch["images"].result(), image_choice)
+
+    with span("tts_join", word=word):
+        word_audio_ref, word_audio_data = prefetch["word_audio"].result()
+        sentence_audio_ref, sentence_audio_data = prefetch["sentence_audio"].result()
+    if not word_audio_data or not sentence_audio_data:
+        raise CardGenerationError(get_message("TTS_ERRORS.skip_card"))
+
+    if journal is None or not journal.get("media"):
+        with span("media_upload", word=word):
+            uploaded = send_media_file(f"tts_{word}.mp3", word_audio_data)
+            uploaded = send_media_file(f"tts_sentence_{word}.mp3", sentence_audio_data) and uploaded
+        if journal is not None and uploaded:
+            journal.put("media", True)
+
+    note = build_anki_note(
+        word=word,
+        sentence=sentence,
+        highlighted=highlighted,
+        image_url=image_url,
+        dictionary_data=dictionary_data,
+        sentence_audio_ref=sentence_audio_ref,
+        word_audio_ref=word_audio_ref,
+        irregular_forms_field=get_irregular_forms(word),
+        dictionary_entry=format_dictionary_entry(dictionary_data["dictionary_api_response"]),
+        translation_ua=translation.strip(),
+        config=config,
+        deck_name=deck_name
+    )
+    try:
+        with span("add_note", word=word):
+            note_id = add_note(note)["result"]
+    except Exception as e:
+        raise CardGenerationError(str(e))
+    if journal is not None:
+        journal.put("note", note_id)
+    return note_id
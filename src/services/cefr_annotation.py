@@ -0,0 +1,153 @@
+"""
+Bulk CEFR/frequency annotation of whole texts (`generate_card.py --annotate FILE`).
+
+The vocabulary is integer-encoded once: a sorted NumPy string array plus parallel
+level/band arrays, with the lemma fallback of lookup_cefr() already folded in.
+A text is then annotated in one vectorized pass: its distinct tokens are located
+with np.searchsorted and the per-token codes are gathered through the inverse
+index, with no per-token dict lookups.
+"""
+
+import re
+import sys
+import threading
+import time
+import numpy as np
+from src.locales.loader import get_message
+from src.services.cefr_data import get_cefr_frequency_data, get_cefr_lemma_map, require_cefr_frequency_data
+from src.services.cefr_index import CEFR_LEVELS
+from src.services.cefr_lemmas import has_cefr_level
+
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+UNKNOWN_LEVEL = CEFR_LEVELS.index("")
+NO_BAND = 0
+
+_vocabulary = None
+_vocabulary_lock = threading.Lock()
+
+
+class CefrVocabulary:
+    """Integer-encoded CEFR table: word i has level code levels[i] and frequency band bands[i] (0 = none)."""
+
+    def __init__(self, table, lemma_map: dict = None):
+        codes = {label: code for code, label in enumerate(CEFR_LEVELS)}
+        words, levels, bands = [], [], []
+        for word, entry in table.items():
+            words.append(word)
+            levels.append(codes.get(entry["cefr"], codes["?"]))
+            bands.append(int(entry["frequency"]) if entry["frequency"].isdigit() else NO_BAND)
+        words = np.array(words, dtype=str)
+        order = np.argsort(words, kind="stable")
+        self.words = words[order]
+        self.levels = np.array(levels, dtype=np.uint8)[order]
+        self.bands = np.array(bands, dtype=np.uint8)[order]
+        self.from_lemma = np.zeros(len(self.words), dtype=bool)
+        if lemma_map:
+            self._apply_lemmas(table, lemma_map)
+
+    def _apply_lemmas(self, table, lemma_map: dict) -> None:
+        # Same rule as lookup_cefr(): a form without a level takes its lemma's level and band
+        forms = np.array([f for f, lemma in lemma_map.items() if has_cefr_level(table.get(lemma))], dtype=str)
+        if not len(forms):
+            return
+        lemmas = np.array([lemma_map[f] for f in forms], dtype=str)
+        form_ids, form_found = self.lookup(forms)
+        lemma_ids, lemma_found = self.lookup(lemmas)
+        ok = form_found & lemma_found
+        self.levels[form_ids[ok]] = self.levels[lemma_ids[ok]]
+        self.bands[form_ids[ok]] = self.bands[lemma_ids[ok]]
+        self.from_lemma[form_ids[ok]] = True
+
+    def lookup(self, tokens: np.ndarray):
+        """Returns (ids, found) for an array of lowercase tokens; ids are only meaningful where found."""
+        ids = np.searchsorted(self.words, tokens)
+        ids = np.minimum(ids, len(self.words) - 1)
+        return ids, self.words[ids] == tokens
+
+
+class TextAnnotation:
+    """Per-token results of annotate_text(), as parallel NumPy arrays."""
+
+    def __init__(self, tokens, levels, bands, from_lemma):
+        self.tokens = tokens
+        self.levels = levels
+        self.bands = bands
+        self.from_lemma = from_lemma
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def cefr(self) -> np.ndarray:
+        """CEFR labels per token ('' for words not in the table)."""
+        return np.array(CEFR_LEVELS, dtype=str)[self.levels]
+
+    def level_counts(self) -> dict:
+        """Token counts per CEFR label, in CEFR_LEVELS order."""
+        counts = np.bincount(self.levels, minlength=len(CEFR_LEVELS))
+        return {label: int(count) for label, count in zip(CEFR_LEVELS, counts) if count}
+
+    def rows(self):
+        """Yields (token, cefr, frequency) per token; frequency is '' when unknown."""
+        for token, cefr, band in zip(self.tokens.tolist(), self.cefr().tolist(), self.bands.tolist()):
+            yield token, cefr, str(band) if band else ""
+
+
+def get_cefr_vocabulary() -> CefrVocabulary:
+    """The encoded vocabulary of the CEFR table (with lemma fallback), built on the first call."""
+    global _vocabulary
+    if _vocabulary is None:
+        with _vocabulary_lock:
+            if _vocabulary is None:
+                _vocabulary = CefrVocabulary(get_cefr_frequency_data(), get_cefr_lemma_map())
+    return _vocabulary
+
+
+def tokenize(text: str) -> np.ndarray:
+    """Lowercase word tokens of `text` as a NumPy string array (apostrophes kept inside words)."""
+    return np.array(TOKEN_PATTERN.findall(text.lower()), dtype=str)
+
+
+def annotate_text(text: str, vocabulary: CefrVocabulary = None) -> TextAnnotation:
+    """CEFR level and frequency band of every token in `text`, computed in one vectorized pass."""
+    vocabulary = vocabulary or get_cefr_vocabulary()
+    tokens = tokenize(text)
+    if not len(tokens):
+        empty = np.zeros(0, dtype=np.uint8)
+        return TextAnnotation(tokens, empty, empty, np.zeros(0, dtype=bool))
+    # Distinct tokens are far fewer than tokens: search those, then scatter back through the inverse
+    unique, inverse = np.unique(tokens, return_inverse=True)
+    ids, found = vocabulary.lookup(unique)
+    levels = np.where(found, vocabulary.levels[ids], UNKNOWN_LEVEL).astype(np.uint8)
+    bands = np.where(found, vocabulary.bands[ids], NO_BAND).astype(np.uint8)
+    from_lemma = found & vocabulary.from_lemma[ids]
+    return TextAnnotation(tokens, levels[inverse], bands[inverse], from_lemma[inverse])
+
+
+def read_text(path: str) -> str:
+    """Reads a text file as UTF-8 ('-' reads standard input); undecodable bytes are replaced."""
+    if path == "-":
+        return sys.stdin.read()
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def run_annotate(path: str, out=None) -> TextAnnotation:
+    """
+    Writes "token<TAB>cefr<TAB>frequency" for every token of the file to `out` (stdout by
+    default) and a summary with the per-level token counts to stderr.
+    """
+    out = out or sys.stdout
+    require_cefr_frequency_data()
+    text = read_text(path)
+    vocabulary = get_cefr_vocabulary()
+    start = time.perf_counter()
+    annotation = annotate_text(text, vocabulary)
+    seconds = time.perf_counter() - start
+
+    out.write("token\tcefr\tfrequency\n")
+    out.writelines(f"{token}\t{cefr}\t{frequency}\n" for token, cefr, frequency in annotation.rows())
+    counts = ", ".join(f"{label or '-'}: {count}" for label, count in annotation.level_counts().items())
+    print(get_message("ANNOTATE_MODE.summary", tokens=len(annotation), unique=len(np.unique(annotation.tokens)),
+                      seconds=seconds), file=sys.stderr)
+    print(get_message("ANNOTATE_MODE.level_counts", counts=counts), file=sys.stderr)
+    return annotation
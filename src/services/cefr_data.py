@@ -1,19 +1,163 @@
 import csv
+import hashlib
+import os
+import sys
+import threading
+from src.locales.loader import get_message
+from src.services.cefr_index import CefrIndex, update_cefr_index_source, write_cefr_index
+from src.services.cefr_lemmas import (
+    load_lemma_map, has_cefr_level, pick_lemma, irregular_lemma_map, wordnet_lemmatizer
+)
 
-def load_cefr_frequency_data(csv_path: str = "data/merged_cefr_frequency.csv") -> dict:
+CEFR_CSV_PATH = "data/merged_cefr_frequency.csv"
+# Compiled, memory-mapped form of the CSV (see cefr_index.py); rebuilt when the CSV changes
+CEFR_INDEX_PATH = "data/merged_cefr_frequency.idx"
+
+# Opened on first use, so importing this module does not touch the 172k-word table
+_cefr_frequency_data = None
+_cefr_load_lock = threading.Lock()
+_cefr_lemma_map = None
+_lemma_load_lock = threading.Lock()
+
+class CefrDataError(Exception):
+    """Raised when the CEFR/frequency CSV is missing, unreadable or malformed."""
+
+
+def load_cefr_frequency_data(csv_path: str = CEFR_CSV_PATH) -> dict:
+    """Parses the CSV into {word: {"cefr": ..., "frequency": ...}}. Raises CefrDataError on any problem."""
     data = {}
     try:
         with open(csv_path, newline="", encoding="utf-8") as csvfile:
             reader = csv.DictReader(csvfile)
+            if not reader.fieldnames or "Word" not in reader.fieldnames:
+                raise CefrDataError(get_message("DATA_GATHERING_PROCESSING.cefr_csv_invalid", path=csv_path))
             for row in reader:
-                word = row["Word"].strip().lower()
+                word = (row["Word"] or "").strip().lower()
+                if not word:
+                    continue
                 data[word] = {
-                    "cefr": row.get("CEFR", "").strip().upper(),
-                    "frequency": row.get("Frequency", "").strip(),
+                    "cefr": (row.get("CEFR") or "").strip().upper(),
+                    "frequency": (row.get("Frequency") or "").strip(),
                 }
-    except Exception:
-        # If file is missing or invalid, just return empty dict
-        return {}
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise CefrDataError(get_message("DATA_GATHERING_PROCESSING.cefr_csv_unreadable", path=csv_path, error=str(e)))
+    if not data:
+        raise CefrDataError(get_message("DATA_GATHERING_PROCESSING.cefr_csv_invalid", path=csv_path))
     return data
 
-CEFR_FREQUENCY_DATA = load_cefr_frequency_data() 
\ No newline at end of file
+def _source_stamp(csv_path: str) -> tuple:
+    """(size, mtime_ns, sha256) of the CSV, as stored in the index header."""
+    try:
+        stat = os.stat(csv_path)
+        with open(csv_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).digest()
+    except OSError as e:
+        raise CefrDataError(get_message("DATA_GATHERING_PROCESSING.cefr_csv_unreadable", path=csv_path, error=str(e)))
+    return stat.st_size, stat.st_mtime_ns, digest
+
+def _open_current_index(csv_path: str, index_path: str):
+    """
+    Returns the existing index if it was compiled from the current CSV, else None.
+    Size + mtime match is the fast path; otherwise the CSV is hashed, so a touched
+    but unchanged file (e.g. after a git checkout) does not trigger a rebuild, and its
+    new size and mtime are stored so the next start takes the fast path again.
+    """
+    try:
+        index = CefrIndex(index_path)
+    except (OSError, ValueError):
+        return None
+    size, mtime_ns, digest = index.source
+    try:
+        stat = os.stat(csv_path)
+    except OSError:
+        index.close()
+        return None
+    if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+        return index
+    source = _source_stamp(csv_path)
+    if source[2] != digest:
+        index.close()
+        return None
+    try:
+        update_cefr_index_source(index_path, source)
+        index.source = source
+    except OSError:
+        pass  # read-only data directory: the CSV is hashed again next time
+    return index
+
+def load_cefr_index(csv_path: str = CEFR_CSV_PATH, index_path: str = CEFR_INDEX_PATH):
+    """
+    Opens the compiled CEFR index, compiling it from the CSV first when it is missing,
+    corrupt or built from different CSV content. Returns a CefrIndex, or the parsed
+    dict if the index cannot be written (e.g. read-only data directory); both support
+    get(word, default). Raises CefrDataError if the CSV itself cannot be used.
+    """
+    index = _open_current_index(csv_path, index_path)
+    if index is not None:
+        return index
+    source = _source_stamp(csv_path)
+    data = load_cefr_frequency_data(csv_path)
+    try:
+        write_cefr_index(data, index_path, source)
+        return CefrIndex(index_path)
+    except OSError:
+        return data
+
+def get_cefr_frequency_data():
+    """Return the CEFR/frequency table (a CefrIndex), opening it on the first call."""
+    global _cefr_frequency_data
+    if _cefr_frequency_data is None:
+        # The startup bootstrap loads the table on a background thread; the lock keeps it to one build
+        with _cefr_load_lock:
+            if _cefr_frequency_data is None:
+                _cefr_frequency_data = load_cefr_index()
+    return _cefr_frequency_data
+
+def get_cefr_lemma_map() -> dict:
+    """Return the precomputed {inflected form: lemma} map, building or reading its cache on the first call."""
+    global _cefr_lemma_map
+    if _cefr_lemma_map is None:
+        with _lemma_load_lock:
+            if _cefr_lemma_map is None:
+                table = get_cefr_frequency_data()
+                source_hash = table.source[2].hex() if isinstance(table, CefrIndex) else None
+                _cefr_lemma_map = load_lemma_map(table, source_hash)
+    return _cefr_lemma_map
+
+def lookup_cefr(word: str) -> dict:
+    """
+    CEFR level and frequency band of a word, falling back to its lemma when the word
+    itself is not listed or has no level ("fled" -> "flee", "children" -> "child").
+    Returns {"cefr", "frequency", "lemma"}; "lemma" is None when the word's own entry was used.
+    """
+    word = word.strip().lower()
+    table = get_cefr_frequency_data()
+    entry = table.get(word)
+    if has_cefr_level(entry):
+        return {**entry, "lemma": None}
+    if entry is not None:
+        lemma = get_cefr_lemma_map().get(word)
+    else:
+        # Not in the vocabulary at all, so not precomputed: lemmatize this one word
+        lemma = pick_lemma(word, table, irregular_lemma_map(), wordnet_lemmatizer())
+    if lemma:
+        return {**table.get(lemma), "lemma": lemma}
+    return {"cefr": "", "frequency": "", **(entry or {}), "lemma": None}
+
+def exit_on_cefr_error(error: CefrDataError) -> None:
+    """Report why the CEFR data is unusable and stop, instead of creating cards without levels."""
+    print(get_message("DATA_GATHERING_PROCESSING.cefr_load_error", error=str(error)))
+    sys.exit(1)
+
+def require_cefr_frequency_data():
+    """get_cefr_frequency_data() for entry points: exits with the reason if the data cannot be loaded."""
+    try:
+        return get_cefr_frequency_data()
+    except CefrDataError as e:
+        exit_on_cefr_error(e)
+
+def __getattr__(name):
+    # Keeps `from src.services.cefr_data import CEFR_FREQUENCY_DATA` working without an import-time load
+    if name == "CEFR_FREQUENCY_DATA":
+        return get_cefr_frequency_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,155 @@
+"""
+Compact, memory-mapped CEFR/frequency index.
+
+File layout (little-endian):
+    magic   8 bytes   b"CEFRIDX2"
+    count   uint32    number of words
+    source  uint64 size, int64 mtime_ns, 32-byte SHA-256 of the CSV the index was built from
+    offsets uint32 * (count + 1)   start of each word in the words blob (last = blob size)
+    levels  1 byte * count         high nibble: CEFR level code, low nibble: frequency band
+    words   UTF-8 bytes of all words, sorted, concatenated
+
+Lookups binary-search the sorted words directly in the mapped file, so opening the
+index costs a few milliseconds and only the touched pages become resident.
+"""
+
+import mmap
+import os
+import struct
+
+INDEX_MAGIC = b"CEFRIDX2"
+_HEADER = struct.Struct("<8sIQq32s")
+_SOURCE = struct.Struct("<Qq32s")
+_SOURCE_OFFSET = _HEADER.size - _SOURCE.size
+_OFFSET = struct.Struct("<I")
+
+CEFR_LEVELS = ("", "?", "A1", "A2", "B1", "B2", "C1", "C2")
+_LEVEL_CODES = {level: code for code, level in enumerate(CEFR_LEVELS)}
+_NO_FREQUENCY = 0xF
+
+
+def _pack_entry(cefr: str, frequency: str) -> int:
+    level = _LEVEL_CODES.get(cefr, _LEVEL_CODES["?"])
+    band = int(frequency) if frequency.isdigit() and len(frequency) == 1 else _NO_FREQUENCY
+    return level << 4 | band
+
+
+def _unpack_entry(packed: int) -> dict:
+    band = packed & 0xF
+    return {
+        "cefr": CEFR_LEVELS[packed >> 4],
+        "frequency": "" if band == _NO_FREQUENCY else str(band),
+    }
+
+
+def write_cefr_index(entries: dict, index_path: str, source: tuple = (0, 0, b"")) -> None:
+    """
+    Writes {word: {"cefr": ..., "frequency": ...}} as an index file. `source` is the
+    (size, mtime_ns, sha256) stamp of the CSV it was compiled from. The file is
+    written next to its final name and renamed into place, so a reader never sees
+    a half-written index.
+    """
+    words = sorted(entries, key=lambda w: w.encode("utf-8"))
+    encoded = [w.encode("utf-8") for w in words]
+    offsets, position = [], 0
+    for word_bytes in encoded:
+        offsets.append(position)
+        position += len(word_bytes)
+    offsets.append(position)
+    levels = bytes(_pack_entry(entries[w]["cefr"], entries[w]["frequency"]) for w in words)
+
+    tmp_path = f"{index_path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, len(words), *source))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(levels)
+        f.write(b"".join(encoded))
+    os.replace(tmp_path, index_path)
+
+
+def update_cefr_index_source(index_path: str, source: tuple) -> None:
+    """
+    Rewrites the (size, mtime_ns, sha256) stamp in the header of an existing index, for a
+    CSV that was touched but not changed. The rest of the file is left as it is.
+    """
+    with open(index_path, "r+b") as f:
+        f.seek(_SOURCE_OFFSET)
+        f.write(_SOURCE.pack(*source))
+
+
+class CefrIndex:
+    """Read-only CEFR/frequency table with the dict-style get() used by the card renderer."""
+
+    def __init__(self, index_path: str):
+        self.path = index_path
+        with open(index_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self._count, *source = _HEADER.unpack_from(self._mm, 0)
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"{index_path} is not a CEFR index file (or an older format)")
+            self.source = tuple(source)
+            self._offsets_start = _HEADER.size
+            self._levels_start = self._offsets_start + (self._count + 1) * _OFFSET.size
+            self._words_start = self._levels_start + self._count
+            words_size, = _OFFSET.unpack_from(self._mm, self._levels_start - _OFFSET.size)
+            if len(self._mm) != self._words_start + words_size:
+                raise ValueError(f"{index_path} is truncated or corrupt")
+        except ValueError:
+            self._mm.close()
+            raise
+        except struct.error as e:
+            self._mm.close()
+            raise ValueError(f"{index_path} is truncated or corrupt") from e
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _word_at(self, i: int) -> bytes:
+        start, end = struct.unpack_from("<2I", self._mm, self._offsets_start + i * _OFFSET.size)
+        return self._mm[self._words_start + start:self._words_start + end]
+
+    def _find(self, word: str) -> int:
+        key = word.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._word_at(lo) == key:
+            return lo
+        return -1
+
+    def get(self, word: str, default=None):
+        """Returns {"cefr": ..., "frequency": ...} for the word, or `default` if it is not listed."""
+        i = self._find(word)
+        if i < 0:
+            return default
+        return _unpack_entry(self._mm[self._levels_start + i])
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) >= 0
+
+    def __getitem__(self, word: str) -> dict:
+        entry = self.get(word)
+        if entry is None:
+            raise KeyError(word)
+        return entry
+
+    def words(self):
+        """Yields every word in sorted (UTF-8 byte) order."""
+        for word, _ in self.items():
+            yield word
+
+    def items(self):
+        """Yields (word, entry) pairs in sorted order, reading the tables in one sequential pass."""
+        offsets = struct.unpack_from(f"<{self._count + 1}I", self._mm, self._offsets_start)
+        levels = self._mm[self._levels_start:self._words_start]
+        blob = self._mm[self._words_start:]
+        for i in range(self._count):
+            yield blob[offsets[i]:offsets[i + 1]].decode("utf-8"), _unpack_entry(levels[i])
+
+    def close(self) -> None:
+        self._mm.close()
@@ -0,0 +1,129 @@
+"""
+Surface-form -> lemma mapping for CEFR lookups ("fled" -> "flee", "children" -> "child").
+
+Most inflected forms in the CSV carry CEFR "?" while their lemma has a level, so the
+mapping is precomputed once for every vocabulary word without a level, from
+data/irregular_verbs.py and the WordNet lemmatizer, and cached next to the CSV.
+Lookups are then a single dict access.
+"""
+
+import functools
+import os
+from data.irregular_verbs import irregular_verbs
+
+CEFR_LEMMAS_PATH = "data/merged_cefr_frequency.lemmas"
+# Part-of-speech order for the lemmatizer: verb forms are the most common misses
+LEMMA_POS_ORDER = ("v", "n", "a")
+
+
+def has_cefr_level(entry) -> bool:
+    return bool(entry) and entry.get("cefr", "") not in ("", "?")
+
+
+@functools.lru_cache(maxsize=None)
+def irregular_lemma_map() -> dict:
+    """{"fled": "flee", "was": "be", "were": "be", ...} from data/irregular_verbs.py."""
+    lemmas = {}
+    for base, forms in irregular_verbs.items():
+        for form in forms[1:]:
+            for variant in form.split("/"):
+                variant = variant.strip().lower()
+                if variant and variant != base:
+                    lemmas.setdefault(variant, base)
+    return lemmas
+
+
+@functools.lru_cache(maxsize=None)
+def wordnet_lemmatizer():
+    """
+    Returns WordNetLemmatizer().lemmatize, or None if NLTK or its WordNet data is missing.
+    Either outcome is remembered, so lookups of unlisted words do not retry the corpus.
+    """
+    try:
+        from nltk.stem import WordNetLemmatizer
+
+        lemmatize = WordNetLemmatizer().lemmatize
+        lemmatize("tests")
+        return lemmatize
+    except Exception:
+        return None
+
+
+def lemma_candidates(word: str, irregular: dict, lemmatize=None):
+    """Yields possible lemmas of `word` (excluding the word itself), most likely first."""
+    if word in irregular:
+        yield irregular[word]
+    if lemmatize is not None:
+        for pos in LEMMA_POS_ORDER:
+            lemma = lemmatize(word, pos=pos)
+            if lemma != word:
+                yield lemma
+
+
+def pick_lemma(word: str, table, irregular: dict, lemmatize=None):
+    """
+    The lemma whose table entry should stand in for `word`: the first candidate with a
+    CEFR level, else the first candidate listed at all. None if no candidate is listed.
+    """
+    listed = None
+    for lemma in lemma_candidates(word, irregular, lemmatize):
+        entry = table.get(lemma)
+        if has_cefr_level(entry):
+            return lemma
+        if entry is not None and listed is None:
+            listed = lemma
+    return listed
+
+
+def build_lemma_map(table, lemmatize=None) -> dict:
+    """Maps every listed word without a CEFR level to a lemma that has one."""
+    irregular = irregular_lemma_map()
+    # Only ~7k words have a level; candidates are checked against this small dict, not the index
+    leveled = {word: entry for word, entry in table.items() if has_cefr_level(entry)}
+    if lemmatize is None:
+        # Only the irregular forms can have a lemma; skip the pass over the whole vocabulary
+        words = [word for word in irregular if word in table]
+    else:
+        words = (word for word, entry in table.items() if not has_cefr_level(entry))
+    lemmas = {}
+    for word in words:
+        if word in leveled:
+            continue
+        # A listed form keeps its own frequency band unless the lemma adds a CEFR level
+        lemma = pick_lemma(word, leveled, irregular, lemmatize)
+        if lemma:
+            lemmas[word] = lemma
+    return lemmas
+
+
+def _cache_header(source_hash: str, with_wordnet: bool) -> str:
+    return f"# source={source_hash} wordnet={int(with_wordnet)}\n"
+
+
+def load_lemma_map(table, source_hash: str = None, path: str = CEFR_LEMMAS_PATH) -> dict:
+    """
+    Returns the lemma map, reading the cache when it was built from the same CSV
+    (`source_hash`) with the same WordNet availability, else building and caching it.
+    Without a source hash (e.g. an in-memory table) nothing is cached.
+    """
+    lemmatize = wordnet_lemmatizer()
+    header = _cache_header(source_hash, lemmatize is not None) if source_hash else None
+    if header:
+        try:
+            with open(path, encoding="utf-8") as f:
+                if f.readline() == header:
+                    return dict(line.rstrip("\n").split("\t", 1) for line in f if "\t" in line)
+        except OSError:
+            pass
+
+    lemmas = build_lemma_map(table, lemmatize)
+    if header:
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(header)
+                f.writelines(f"{word}\t{lemma}\n" for word, lemma in lemmas.items())
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    return lemmas
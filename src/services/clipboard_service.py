@@ -6,6 +6,27 @@ import sys
 from src.locales.loader import get_message
 from src.cli.colors import cyan
 
+def clean_clipboard_text(sentence):
+    """Normalizes copied text (subtitles, PDFs, web pages) into a single clean sentence."""
+    # Remove hyphenated line breaks (e.g., generos-\nity → generosity)
+    sentence = re.sub(r'-\s*\n\s*', '', sentence)
+    # Remove all line breaks
+    sentence = re.sub(r'\s*\n\s*', ' ', sentence)
+    # Remove timestamp patterns like mm:ss or h:mm:ss
+    sentence = re.sub(r"\b\d{1,2}:\d{2}(?::\d{2})?\b", '', sentence)
+    # Remove extra spaces before punctuation
+    sentence = re.sub(r'\s+([.,:;!?])', r'\1', sentence)
+    # Restore curly quote cleaning
+    sentence = sentence.replace('“', '"').replace('”', '"')
+    sentence = sentence.replace('‘', "'").replace('’', "'")
+    # Replace middle dot with dash
+    sentence = sentence.replace('∙', '-')
+    # Remove carriage returns
+    sentence = sentence.replace('\r', '')
+    # Replace multiple spaces with one (do this last)
+    sentence = re.sub(r'\s{2,}', ' ', sentence)
+    return sentence.strip()
+
 def get_clean_sentence_from_clipboard():
     """
     Improved UX for retrieving a sentence from the clipboard or user input.
@@ -15,27 +36,7 @@ def get_clean_sentence_from_clipboard():
     4. If after both attempts the sentence is still empty, print an error and exit.
     5. Return the final sentence.
     """
-    def clean(sentence):
-        # Remove hyphenated line breaks (e.g., generos-\nity → generosity)
-        sentence = re.sub(r'-\s*\n\s*', '', sentence)
-        # Remove all line breaks
-        sentence = re.sub(r'\s*\n\s*', ' ', sentence)
-        # Remove timestamp patterns like mm:ss or h:mm:ss
-        sentence = re.sub(r"\b\d{1,2}:\d{2}(?::\d{2})?\b", '', sentence)
-        # Remove extra spaces before punctuation
-        sentence = re.sub(r'\s+([.,:;!?])', r'\1', sentence)
-        # Restore curly quote cleaning
-        sentence = sentence.replace('“', '"').replace('”', '"')
-        sentence = sentence.replace('‘', "'").replace('’', "'")
-        # Replace middle dot with dash
-        sentence = sentence.replace('∙', '-')
-        # Remove carriage returns
-        sentence = sentence.replace('\r', '')
-        # Replace multiple spaces with one (do this last)
-        sentence = re.sub(r'\s{2,}', ' ', sentence)
-        return sentence.strip()
-
-    clipboard_sentence = clean(pyperclip.paste())
+    clipboard_sentence = clean_clipboard_text(pyperclip.paste())
 
     if clipboard_sentence:
         user_input = input(get_message("USER_INTERACTION_INPUT_VALIDATION.clipboard_sentence_prompt", clipboard_sentence=cyan(clipboard_sentence))).strip()
@@ -0,0 +1,268 @@
+"""
+Corpus profiling for study lists (`generate_card.py --study-list FILE...`).
+
+Plain-text or gzipped corpora are streamed in chunks of lines, so memory stays
+bounded by the CEFR vocabulary rather than the corpus: only words found in the
+table are counted, per lemma, and one example sentence is kept per lemma. Profiles
+are plain counters that merge by addition, so chunks and files can be profiled in
+separate processes (or separate runs, via saved JSON profiles) and combined.
+The result is a batch file for `--batch`: one "sentence<TAB>word" row per word,
+grouped under "# <level>" comment lines, most frequent in the corpus first.
+"""
+
+import gzip
+import json
+import re
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+from data.stopwords import stopwords
+from src.locales.loader import get_message
+from src.services.cefr_annotation import get_cefr_vocabulary, TOKEN_PATTERN
+from src.services.cefr_data import get_cefr_frequency_data, get_cefr_lemma_map, require_cefr_frequency_data
+from src.services.deck_service import get_deck_words
+
+CHUNK_CHARS = 4_000_000
+STUDY_LIST_LIMIT = 50
+STUDY_LIST_MIN_COUNT = 2
+STUDY_LIST_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2", "?")
+# Example sentences short enough for the front of a card, long enough to give context
+EXAMPLE_MIN_TOKENS = 5
+EXAMPLE_MAX_TOKENS = 30
+PROFILE_SUFFIX = ".json"
+SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+# SubRip cue numbers and timestamps ("12", "00:01:02,500 --> 00:01:04,000") carry no text;
+# only dropped from subtitle files, where a line of digits is never a page number or a year
+SUBTITLE_SUFFIXES = (".srt", ".srt.gz")
+SUBTITLE_CUE_LINE = re.compile(r"^\s*(\d+|\d[\d:,.]*\s*-->\s*\d[\d:,.]*.*)\s*$")
+
+
+class CorpusProfile:
+    """Lemma counts of a corpus with one example sentence per lemma; merge() adds another profile."""
+
+    def __init__(self, counts: Counter = None, examples: dict = None, tokens: int = 0, files: int = 0):
+        self.counts = counts if counts is not None else Counter()
+        self.examples = examples if examples is not None else {}
+        self.tokens = tokens
+        self.files = files
+
+    def add_text(self, text: str, vocabulary=None, lemma_map: dict = None, examples: bool = True) -> None:
+        """Counts the vocabulary words of `text` per lemma and, with `examples`, collects examples for new lemmas."""
+        vocabulary = vocabulary or get_cefr_vocabulary()
+        lemma_map = get_cefr_lemma_map() if lemma_map is None else lemma_map
+        lemmas = self.add_counts(count_tokens(text), vocabulary, lemma_map)
+        missing = {lemma for lemma in lemmas if lemma not in self.examples} if examples else None
+        if missing:
+            self._collect_examples(text, missing, lemma_map)
+
+    def add_counts(self, token_counts: Counter, vocabulary=None, lemma_map: dict = None) -> set:
+        """Adds {token: count} (all tokens, not only vocabulary words) and returns the lemmas counted."""
+        vocabulary = vocabulary or get_cefr_vocabulary()
+        lemma_map = get_cefr_lemma_map() if lemma_map is None else lemma_map
+        self.tokens += sum(token_counts.values())
+        if not token_counts:
+            return set()
+        unique = np.array(list(token_counts), dtype=str)
+        _, found = vocabulary.lookup(unique)
+        lemmas = set()
+        for token in unique[found].tolist():
+            lemma = lemma_map.get(token, token)
+            self.counts[lemma] += token_counts[token]
+            lemmas.add(lemma)
+        return lemmas
+
+    def _collect_examples(self, text: str, missing: set, lemma_map: dict) -> None:
+        for sentence in SENTENCE_END.split(" ".join(text.split())):
+            words = TOKEN_PATTERN.findall(sentence.lower())
+            if not EXAMPLE_MIN_TOKENS <= len(words) <= EXAMPLE_MAX_TOKENS:
+                continue
+            for word in words:
+                lemma = lemma_map.get(word, word)
+                if lemma in missing:
+                    self.examples[lemma] = sentence
+                    missing.discard(lemma)
+            if not missing:
+                return
+
+    def merge(self, other: "CorpusProfile") -> "CorpusProfile":
+        """Adds the counts of `other`; examples already collected here are kept."""
+        self.counts.update(other.counts)
+        for lemma, sentence in other.examples.items():
+            self.examples.setdefault(lemma, sentence)
+        self.tokens += other.tokens
+        self.files += other.files
+        return self
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"tokens": self.tokens, "files": self.files, "counts": self.counts,
+                       "examples": self.examples}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "CorpusProfile":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(Counter(data["counts"]), data["examples"], data["tokens"], data["files"])
+
+
+def count_pieces(text: str) -> Counter:
+    """Counts of the lowercase whitespace-separated pieces of `text` ("night." and "night" differ)."""
+    return Counter(text.lower().split())
+
+
+def tokens_of_pieces(pieces: Counter) -> Counter:
+    """Token counts from count_pieces() counts; tokens never span whitespace, so no text is needed."""
+    counts = Counter()
+    for piece, count in pieces.items():
+        for token in TOKEN_PATTERN.findall(piece):
+            counts[token] += count
+    return counts
+
+
+def count_tokens(text: str) -> Counter:
+    """
+    Token counts of `text`, as TOKEN_PATTERN.findall(text.lower()) would give them, but
+    only the (far fewer) distinct whitespace-separated pieces go through the regex.
+    """
+    return tokens_of_pieces(count_pieces(text))
+
+
+def _open_corpus(path: str):
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def iter_chunks(path: str, chunk_chars: int = CHUNK_CHARS):
+    """Yields the text of a (possibly gzipped) corpus in chunks of whole lines, cues of .srt files removed."""
+    subtitles = path.lower().endswith(SUBTITLE_SUFFIXES)
+    f = _open_corpus(path)
+    try:
+        lines, size = [], 0
+        for line in f:
+            if subtitles and SUBTITLE_CUE_LINE.match(line):
+                continue
+            lines.append(line)
+            size += len(line)
+            if size >= chunk_chars:
+                yield "".join(lines)
+                lines, size = [], 0
+        if lines:
+            yield "".join(lines)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def profile_chunk(chunk: str, examples: bool = True) -> CorpusProfile:
+    """Profiles one chunk of text; runs in a worker process under profile_corpora()."""
+    profile = CorpusProfile()
+    profile.add_text(chunk, get_cefr_vocabulary(), get_cefr_lemma_map(), examples)
+    return profile
+
+
+def _load_vocabulary() -> None:
+    """Worker initializer: loads the CEFR vocabulary and lemma map once per process, before the first chunk."""
+    get_cefr_vocabulary()
+    get_cefr_lemma_map()
+
+
+def _map_chunks(function, chunks, workers: int, initializer=None):
+    """
+    function(chunk) for every chunk, in order, computed in `workers` processes with at most
+    2 * workers in flight; `initializer` runs once in each worker process.
+    """
+    if workers <= 1:
+        yield from map(function, chunks)
+        return
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+        for chunk in chunks:
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+            in_flight.append(executor.submit(function, chunk))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def _text_chunks(paths: list, chunk_chars: int):
+    for path in paths:
+        yield from iter_chunks(path, chunk_chars)
+
+
+def profile_corpora(paths: list, workers: int = 1, examples: bool = True, chunk_chars: int = CHUNK_CHARS) -> CorpusProfile:
+    """
+    Profiles every file and merges the results in input order, so the kept examples do
+    not depend on `workers`. Files ending in .json are profiles saved with
+    CorpusProfile.save() and are merged as they are. With workers > 1, chunks of all
+    files are profiled in that many processes. Each chunk is reduced to lemma counts
+    where it is profiled, so only vocabulary-sized profiles are merged, with or without
+    `examples`.
+    """
+    texts = [path for path in paths if not path.endswith(PROFILE_SUFFIX)]
+    merged = CorpusProfile(files=len(texts))
+    for path in paths:
+        if path.endswith(PROFILE_SUFFIX):
+            merged.merge(CorpusProfile.load(path))
+    chunks = _text_chunks(texts, chunk_chars)
+    function = partial(profile_chunk, examples=examples)
+    for profile in _map_chunks(function, chunks, workers, initializer=_load_vocabulary):
+        merged.merge(profile)
+    return merged
+
+
+def build_study_list(profile: CorpusProfile, known_words=frozenset(), limit: int = STUDY_LIST_LIMIT,
+                     min_count: int = STUDY_LIST_MIN_COUNT, lemma_map: dict = None) -> dict:
+    """
+    {level: [(lemma, count, example), ...]} in STUDY_LIST_LEVELS order, at most `limit`
+    words per level, most frequent first. Stopwords, words seen fewer than `min_count`
+    times, words without an example and words whose form or lemma is in `known_words`
+    (e.g. the deck's Word fields) are left out.
+    """
+    table = get_cefr_frequency_data()
+    lemma_map = get_cefr_lemma_map() if lemma_map is None else lemma_map
+    known = set(known_words) | {lemma_map.get(word, word) for word in known_words}
+    groups = {level: [] for level in STUDY_LIST_LEVELS}
+    for lemma, count in profile.counts.most_common():
+        if count < min_count:
+            break
+        if len(lemma) < 3 or lemma in stopwords or lemma in known or lemma not in profile.examples:
+            continue
+        level = (table.get(lemma) or {}).get("cefr") or "?"
+        group = groups.get(level, groups["?"])
+        if len(group) < limit:
+            group.append((lemma, count, profile.examples[lemma]))
+    return {level: words for level, words in groups.items() if words}
+
+
+def write_study_list(study_list: dict, out) -> None:
+    """Writes the study list as a batch file: "# <level>" headers, then "sentence<TAB>word" rows."""
+    for level, words in study_list.items():
+        out.write(f"# {level}\n")
+        out.writelines(f"{sentence}\t{lemma}\n" for lemma, _count, sentence in words)
+
+
+def run_study_list(paths: list, deck_name: str, workers: int = 1, limit: int = STUDY_LIST_LIMIT,
+                   save_path: str = None, out=None) -> dict:
+    """
+    Profiles the corpora, leaves out words already carded in `deck_name`, writes the study
+    list to `out` (stdout by default) and a summary to stderr. With `save_path`, the merged
+    profile is also saved, so it can be passed again later together with new files.
+    """
+    out = out or sys.stdout
+    require_cefr_frequency_data()
+    profile = profile_corpora(paths, workers)
+    if save_path:
+        profile.save(save_path)
+    known_words = get_deck_words(deck_name)
+    study_list = build_study_list(profile, known_words, limit)
+    write_study_list(study_list, out)
+    counts = ", ".join(f"{level}: {len(words)}" for level, words in study_list.items())
+    print(get_message("STUDY_LIST_MODE.summary", files=profile.files, tokens=profile.tokens,
+                      lemmas=len(profile.counts), known=len(known_words)), file=sys.stderr)
+    print(get_message("STUDY_LIST_MODE.level_counts", counts=counts or "-"), file=sys.stderr)
+    return study_list
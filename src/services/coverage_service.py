@@ -0,0 +1,155 @@
+"""
+Deck vocabulary coverage (`generate_card.py --coverage [FILE...]`).
+
+The reference is either corpora, profiled per lemma like --study-list does, or, with
+no files, the CSV itself: its rows are ordered by frequency, so row r gets the Zipf
+weight 1/r. Lemma weights are sorted once, most frequent first; the deck becomes a
+boolean mask over them, and the coverage figures, the per-band and per-level gaps
+and the coverage reached by learning the next uncarded words are all sums, bincounts
+and cumulative sums over those arrays.
+"""
+
+import sys
+import numpy as np
+from data.stopwords import stopwords
+from src.locales.loader import get_message
+from src.services.cefr_annotation import get_cefr_vocabulary
+from src.services.cefr_data import (
+    CEFR_CSV_PATH, get_cefr_lemma_map, load_cefr_frequency_data, require_cefr_frequency_data
+)
+from src.services.cefr_index import CEFR_LEVELS
+from src.services.corpus_profile import CorpusProfile, profile_corpora
+from src.services.deck_service import get_deck_words
+
+COVERAGE_GAIN_LIMIT = 20
+COVERAGE_TARGETS = (0.90, 0.95, 0.98)
+MOST_FREQUENT_BAND = 9
+
+
+def _by_weight(words: np.ndarray, weights: np.ndarray):
+    order = np.argsort(-weights, kind="stable")
+    return words[order], weights[order]
+
+
+def reference_from_profile(profile: CorpusProfile):
+    """(lemmas, weights, total): corpus counts per lemma, most frequent first; total counts every token."""
+    words = np.array(list(profile.counts), dtype=str)
+    weights = np.fromiter(profile.counts.values(), dtype=np.float64, count=len(words))
+    return (*_by_weight(words, weights), float(profile.tokens))
+
+
+def reference_from_table(rows, lemma_map: dict = None):
+    """
+    (lemmas, weights, total) from frequency-ordered CSV words: row r weighs 1/r, and
+    forms add their weight to their lemma ("fled" -> "flee").
+    """
+    lemma_map = get_cefr_lemma_map() if lemma_map is None else lemma_map
+    lemmas = np.array([lemma_map.get(word, word) for word in rows], dtype=str)
+    if not len(lemmas):
+        return lemmas, np.zeros(0), 0.0
+    row_weights = 1.0 / np.arange(1, len(lemmas) + 1)
+    words, inverse = np.unique(lemmas, return_inverse=True)
+    weights = np.bincount(inverse, weights=row_weights)
+    return (*_by_weight(words, weights), float(row_weights.sum()))
+
+
+def _isin(words: np.ndarray, names) -> np.ndarray:
+    return np.isin(words, np.array(sorted(names), dtype=str))
+
+
+def _breakdown(codes: np.ndarray, labels, weights: np.ndarray, known: np.ndarray, total: float) -> list:
+    """[(label, words, known words, share of the text, share covered by the deck), ...] for non-empty codes."""
+    size = len(labels)
+    words = np.bincount(codes, minlength=size)
+    known_words = np.bincount(codes, weights=known, minlength=size)
+    share = np.bincount(codes, weights=weights, minlength=size) / total
+    covered = np.bincount(codes, weights=weights * known, minlength=size) / total
+    return [(label, int(words[code]), int(known_words[code]), float(share[code]), float(covered[code]))
+            for code, label in enumerate(labels) if words[code]]
+
+
+def analyze_coverage(words: np.ndarray, weights: np.ndarray, total: float, known_words,
+                     lemma_map: dict = None, vocabulary=None, limit: int = COVERAGE_GAIN_LIMIT) -> dict:
+    """
+    Coverage of a reference (from reference_from_profile or reference_from_table) by
+    `known_words`, e.g. the deck's Word fields, matched by form or lemma:
+      "deck" / "with_stopwords": share of running text covered, without / with function words
+      "bands" / "levels": _breakdown() rows per frequency band (9 = most frequent) / CEFR level
+      "gains": [(word, level, coverage after learning it and every word above it), ...]
+      "targets": {target: uncarded words needed to reach it (None if the vocabulary cannot)}
+    """
+    lemma_map = get_cefr_lemma_map() if lemma_map is None else lemma_map
+    vocabulary = vocabulary or get_cefr_vocabulary()
+    total = total or 1.0
+    names = set(known_words) | {lemma_map.get(word, word) for word in known_words}
+    known = _isin(words, names) if names else np.zeros(len(words), dtype=bool)
+    function = _isin(words, stopwords) & ~known
+
+    ids, found = vocabulary.lookup(words) if len(words) else (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=bool))
+    bands = np.where(found, np.minimum(vocabulary.bands[ids], MOST_FREQUENT_BAND), 0).astype(np.intp)
+    levels = np.where(found, vocabulary.levels[ids], CEFR_LEVELS.index("")).astype(np.intp)
+    deck = float(weights[known].sum()) / total
+    with_stopwords = deck + float(weights[function].sum()) / total
+
+    # Uncarded vocabulary words, most frequent first: each one's coverage if learned in that order
+    uncarded = np.flatnonzero(found & ~known & ~function)
+    reached = with_stopwords + np.cumsum(weights[uncarded]) / total
+    needed = {}
+    for target in COVERAGE_TARGETS:
+        if with_stopwords >= target:
+            needed[target] = 0
+        else:
+            position = int(np.searchsorted(reached, target))
+            needed[target] = position + 1 if position < len(reached) else None
+    gains = [(str(words[i]), CEFR_LEVELS[levels[i]] or "?", float(coverage))
+             for i, coverage in zip(uncarded[:limit].tolist(), reached[:limit].tolist())]
+
+    band_labels = ["-"] + [str(band) for band in range(1, MOST_FREQUENT_BAND + 1)]
+    return {
+        "words": len(words), "known": int(known.sum()), "deck": deck, "with_stopwords": with_stopwords,
+        # Most frequent band first, unbanded words last
+        "bands": _breakdown(bands, band_labels, weights, known, total)[::-1],
+        "levels": _breakdown(levels, [level or "-" for level in CEFR_LEVELS], weights, known, total),
+        "gains": gains,
+        "targets": needed,
+    }
+
+
+def write_coverage_report(report: dict, reference: str, out) -> None:
+    print(get_message("COVERAGE_MODE.summary", reference=reference, words=report["words"],
+                      known=report["known"], deck=report["deck"] * 100,
+                      with_stopwords=report["with_stopwords"] * 100), file=out)
+    print(get_message("COVERAGE_MODE.bands_header"), file=out)
+    for label, words, known, share, covered in report["bands"]:
+        print(get_message("COVERAGE_MODE.gap_row", label=label, known=known, words=words,
+                          share=share * 100, covered=covered * 100, gap=(share - covered) * 100), file=out)
+    print(get_message("COVERAGE_MODE.levels_header"), file=out)
+    for label, words, known, share, covered in report["levels"]:
+        print(get_message("COVERAGE_MODE.gap_row", label=label, known=known, words=words,
+                          share=share * 100, covered=covered * 100, gap=(share - covered) * 100), file=out)
+    print(get_message("COVERAGE_MODE.gains_header", count=len(report["gains"])), file=out)
+    for rank, (word, level, coverage) in enumerate(report["gains"], 1):
+        print(get_message("COVERAGE_MODE.gain_row", rank=rank, word=word, level=level,
+                          coverage=coverage * 100), file=out)
+    for target, needed in report["targets"].items():
+        key = "COVERAGE_MODE.target_row" if needed is not None else "COVERAGE_MODE.target_unreachable"
+        print(get_message(key, target=target * 100, count=needed), file=out)
+
+
+def run_coverage(paths: list, deck_name: str, workers: int = 1, limit: int = COVERAGE_GAIN_LIMIT, out=None) -> dict:
+    """
+    Writes the coverage report of the deck against the corpora (or, with no paths, the
+    CSV's frequency ranking) to `out`, stdout by default.
+    """
+    out = out or sys.stdout
+    require_cefr_frequency_data()
+    if paths:
+        profile = profile_corpora(paths, workers, examples=False)
+        words, weights, total = reference_from_profile(profile)
+        reference = get_message("COVERAGE_MODE.reference_corpus", files=profile.files, tokens=profile.tokens)
+    else:
+        words, weights, total = reference_from_table(load_cefr_frequency_data(CEFR_CSV_PATH))
+        reference = get_message("COVERAGE_MODE.reference_table", path=CEFR_CSV_PATH)
+    report = analyze_coverage(words, weights, total, get_deck_words(deck_name), limit=limit)
+    write_coverage_report(report, reference, out)
+    return report
@@ -51,4 +51,31 @@ def create_deck_if_not_exists(deck_name):
         return False
     except Exception as e:
         print(get_message("USER_INTERACTION_INPUT_VALIDATION.deck_creation_unexpected_error", error=str(e)))
-        return False 
\ No newline at end of file
+        return False 
+
+def get_deck_words(deck_name):
+    """
+    Returns the lowercase Word field of every note in the deck, so words that already
+    have a card can be left out of suggestions. Returns an empty set if Anki cannot be asked.
+    """
+    try:
+        note_ids = _anki_request("findNotes", query=f'deck:"{deck_name}"')
+        if not note_ids:
+            return set()
+        notes = _anki_request("notesInfo", notes=note_ids)
+    except (requests.exceptions.RequestException, ValueError):
+        return set()
+    words = set()
+    for note in notes or []:
+        word = note.get("fields", {}).get("Word", {}).get("value", "").strip().lower()
+        if word:
+            words.add(word)
+    return words
+
+def _anki_request(action, **params):
+    response = requests.post(ANKI_CONNECT_URL, json={"action": action, "version": 6, "params": params}, timeout=10)
+    response.raise_for_status()
+    result = response.json()
+    if result.get("error"):
+        raise ValueError(result["error"])
+    return result.get("result")
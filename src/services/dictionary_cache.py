@@ -0,0 +1,186 @@
+"""
+Persistent SQLite cache of DictionaryAPI responses, shared by every run, deck and mode.
+
+Entries are keyed by the normalized word and expire after a TTL; words the API has no
+entry for are cached too, with their own shorter TTL. The database runs in WAL mode,
+so batch workers, the card server and interactive runs can read and write it at the
+same time. When the stored responses outgrow the size limit, the least recently used
+ones are evicted. Hit, miss and bytes-saved counters are kept in the database too.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from src.config.settings import (
+    DICTIONARY_CACHE_PATH, DICTIONARY_CACHE_TTL_DAYS, DICTIONARY_CACHE_MISS_TTL_HOURS, DICTIONARY_CACHE_MAX_MB
+)
+
+SECONDS_PER_DAY = 86400
+SECONDS_PER_HOUR = 3600
+# Bumped when the table layout changes; an older cache is dropped and rebuilt
+SCHEMA_VERSION = 2
+STAT_NAMES = ("hits", "misses", "bytes_saved")
+# Another process holding the write lock is waited for, not reported as an error
+BUSY_TIMEOUT_SECONDS = 5
+
+_cache = None
+_cache_lock = threading.Lock()
+_refresh = False
+
+
+def normalize_word(word: str) -> str:
+    """The cache key of a word: lowercase, trimmed, inner whitespace collapsed."""
+    return " ".join(word.lower().split())
+
+
+class DictionaryCache:
+    """
+    {word: JSON response} with a TTL and an LRU size bound. One connection is shared
+    by all threads of a process and guarded by a lock; every write is committed at once.
+    get() and put() treat database errors (e.g. a full disk) as a miss and a no-op.
+    """
+
+    def __init__(self, path: str, ttl_days: float = DICTIONARY_CACHE_TTL_DAYS,
+                 max_bytes: int = int(DICTIONARY_CACHE_MAX_MB * 1024 * 1024),
+                 miss_ttl_hours: float = DICTIONARY_CACHE_MISS_TTL_HOURS, clock=time.time):
+        self.path = path
+        self.ttl_seconds = ttl_days * SECONDS_PER_DAY
+        self.miss_ttl_seconds = miss_ttl_hours * SECONDS_PER_HOUR
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # A crash may lose the last few entries, never corrupt the file; commits skip the fsync
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS entries")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " word TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, found INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        # LRU order for eviction; with size in it, the total size is summed from the index alone
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at, size)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.commit()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        self._conn.execute(
+            "INSERT INTO stats (name, value) VALUES (?, ?)"
+            " ON CONFLICT (name) DO UPDATE SET value = value + excluded.value", (name, amount)
+        )
+
+    def _expired(self, found: int, stored_at: float, now: float) -> bool:
+        return now - stored_at > (self.ttl_seconds if found else self.miss_ttl_seconds)
+
+    def get(self, word: str):
+        """The cached value for the word, or None if it is missing or older than its TTL."""
+        key = normalize_word(word)
+        now = self._clock()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value, size, found, stored_at FROM entries WHERE word = ?", (key,)
+                ).fetchone()
+                if row and self._expired(row[2], row[3], now):
+                    self._conn.execute("DELETE FROM entries WHERE word = ?", (key,))
+                    row = None
+                if row:
+                    self._conn.execute("UPDATE entries SET used_at = ? WHERE word = ?", (now, key))
+                    self._count("hits")
+                    self._count("bytes_saved", row[1])
+                else:
+                    self._count("misses")
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                return None
+        return json.loads(row[0]) if row else None
+
+    def is_not_found(self, word: str) -> bool:
+        """True if the word is cached as having no entry (within the miss TTL). Read-only, no stats."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT stored_at FROM entries WHERE word = ? AND found = 0", (normalize_word(word),)
+                ).fetchone()
+            except sqlite3.Error:
+                return False
+        return bool(row) and not self._expired(0, row[0], self._clock())
+
+    def put(self, word: str, value, found: bool = True) -> None:
+        """
+        Stores a value, then evicts the least recently used entries beyond the size limit.
+        found=False marks a "no entry" result, which expires after the miss TTL instead.
+        """
+        data = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        now = self._clock()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (word, value, size, found, stored_at, used_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (normalize_word(word), data, len(data.encode("utf-8")), int(found), now, now)
+                )
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+
+    def _evict(self) -> None:
+        excess = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for word, size in self._conn.execute("SELECT word, size FROM entries ORDER BY used_at, word"):
+            evicted.append((word,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE word = ?", evicted)
+
+    def stats(self) -> dict:
+        """
+        {"entries", "not_found", "bytes", "hits", "misses", "bytes_saved"}: current contents
+        ("not_found" of the entries are cached "no entry" results) and lifetime counters.
+        """
+        with self._lock:
+            entries, not_found, size = self._conn.execute(
+                "SELECT COUNT(*), COUNT(*) - COALESCE(SUM(found), 0), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            counters = dict(self._conn.execute("SELECT name, value FROM stats").fetchall())
+        return {"entries": entries, "not_found": not_found, "bytes": size,
+                **{name: counters.get(name, 0) for name in STAT_NAMES}}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def get_dictionary_cache():
+    """
+    The process-wide cache at DICTIONARY_CACHE_PATH, opened on the first call.
+    None when DICTIONARY_CACHE_PATH is empty or the database cannot be opened.
+    """
+    global _cache
+    if _cache is None and DICTIONARY_CACHE_PATH:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = DictionaryCache(DICTIONARY_CACHE_PATH)
+                except sqlite3.Error:
+                    return None
+    return _cache
+
+
+def enable_refresh() -> None:
+    """Ignore cached responses for the rest of the process (`--refresh`); fresh ones are still stored."""
+    global _refresh
+    _refresh = True
+
+
+def is_refreshing() -> bool:
+    return _refresh
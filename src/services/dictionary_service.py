@@ -1,14 +1,28 @@
-"""A service for fetching and consolidating data from dictionary and thesaurus APIs."""
+"""
+A service for fetching and consolidating data from dictionary and thesaurus APIs.
+
+Dictionary entries come from pluggable backends (DictionaryBackend), tried in the order
+set by DICTIONARY_BACKENDS: the DictionaryAPI and the offline WordNet corpus. Thesaurus
+data likewise comes from THESAURUS_BACKENDS: the precompiled local table and Big Huge.
+"""
 
 import csv
 import sys
+from abc import ABC, abstractmethod
 from src.utils.api_client import get_api_data
+from src.services.job_journal import start_stage
+from src.services.dictionary_cache import get_dictionary_cache, is_refreshing
+from src.utils.tracing import traced, annotate
 from src.locales.loader import get_message
 from src.ui.html_templates import render_dictionary_html
-from src.services.cefr_data import CEFR_FREQUENCY_DATA
-from src.config.settings import DICTIONARY_API_URL, BIGHUGE_API_URL, BIG_HUGE_API_KEY
+from src.services.cefr_data import CefrDataError
+from src.config.settings import (
+    DICTIONARY_API_URL, DICTIONARY_API_TIMEOUT, DICTIONARY_BACKEND_NAMES, BIGHUGE_API_URL, BIG_HUGE_API_KEY,
+    THESAURUS_BACKEND_NAMES, THESAURUS_SKIP_MIN_SYNONYMS
+)
 
-# Load CEFR and frequency data at startup
+# DictionaryAPI answers 404 for words it has no entry for; get_api_data returns this instead
+_NOT_FOUND = object()
 
 
 def format_dictionary_entry(data):
@@ -18,20 +32,137 @@ def format_dictionary_entry(data):
     """
     try:
         return render_dictionary_html(data)
+    except CefrDataError:
+        # A broken CEFR table must stop the card, not turn into an entry without levels
+        raise
     except Exception as e:
         print(get_message("DATA_GATHERING_PROCESSING.dict_format_error", error=str(e)))
         return get_message("DATA_GATHERING_PROCESSING.dict_format_generic")
 
+def no_entry(word: str) -> dict:
+    """The result for a word the dictionary has no entry for (as opposed to None: the request failed)."""
+    return {"no_entry": True, "word": word}
+
+def is_no_entry(data) -> bool:
+    return isinstance(data, dict) and data.get("no_entry") is True
+
+class DictionaryBackend(ABC):
+    """
+    A source of DictionaryAPI-shaped entries. lookup(word) returns the list of entries,
+    no_entry(word) if the source has none, or None if it could not be asked.
+    Backends that cannot run at all (is_available() is False) are left out of the chain.
+    """
+    name = ""
+
+    @abstractmethod
+    def lookup(self, word: str):
+        """The entries for the word, no_entry(word), or None if the request failed."""
+
+    def is_available(self) -> bool:
+        """False if the backend cannot be used in this installation (e.g. its data is missing)."""
+        return True
+
+    def is_known_no_entry(self, word: str) -> bool:
+        """True if the backend can tell without a network request that it has no entry."""
+        return False
+
+
+class DictionaryApiBackend(DictionaryBackend):
+    """api.dictionaryapi.dev behind the persistent cache (bypassed with --refresh)."""
+    name = "dictionaryapi"
+
+    def lookup(self, word: str):
+        cache = get_dictionary_cache()
+        if cache and not is_refreshing():
+            data = cache.get(word)
+            annotate(cache="hit" if data is not None else "miss")
+            if data is not None:
+                return data
+        data = get_api_data(f"{DICTIONARY_API_URL}/{word}", timeout=DICTIONARY_API_TIMEOUT, not_found=_NOT_FOUND)
+        if data is _NOT_FOUND:
+            if cache:
+                cache.put(word, no_entry(word), found=False)
+            return no_entry(word)
+        if not data:
+            return None
+        if cache:
+            cache.put(word, data)
+        return data
+
+    def is_known_no_entry(self, word: str) -> bool:
+        cache = get_dictionary_cache()
+        return bool(cache) and not is_refreshing() and cache.is_not_found(word)
+
+
+class WordNetBackend(DictionaryBackend):
+    """The local NLTK WordNet corpus: no network, answers in microseconds once loaded."""
+    name = "wordnet"
+
+    def lookup(self, word: str):
+        from src.services.wordnet_dictionary import get_wordnet, wordnet_entries
+
+        wordnet = get_wordnet()
+        if wordnet is None:
+            return None
+        return wordnet_entries(word, wordnet) or no_entry(word)
+
+    def is_available(self) -> bool:
+        from src.services.wordnet_dictionary import get_wordnet
+
+        return get_wordnet() is not None
+
+    def is_known_no_entry(self, word: str) -> bool:
+        return is_no_entry(self.lookup(word))
+
+
+DICTIONARY_BACKENDS = {backend.name: backend for backend in (DictionaryApiBackend, WordNetBackend)}
+_backends = None
+
+def get_dictionary_backends() -> list:
+    """The backends named in DICTIONARY_BACKENDS (settings), in order; unknown names are reported and skipped."""
+    global _backends
+    if _backends is None:
+        backends = []
+        for name in DICTIONARY_BACKEND_NAMES:
+            if name in DICTIONARY_BACKENDS:
+                backends.append(DICTIONARY_BACKENDS[name]())
+            else:
+                print(get_message("DATA_GATHERING_PROCESSING.dict_backend_unknown", name=name,
+                                  choices=", ".join(DICTIONARY_BACKENDS)))
+        _backends = backends
+    return _backends
+
+def _available_backends() -> list:
+    """get_dictionary_backends() without the ones that cannot run here (e.g. WordNet data not installed)."""
+    return [backend for backend in get_dictionary_backends() if backend.is_available()]
+
+def is_known_no_entry(word: str) -> bool:
+    """True if no backend has an entry for the word, as far as they can tell without a network request."""
+    backends = _available_backends()
+    return bool(backends) and all(backend.is_known_no_entry(word) for backend in backends)
+
+@traced("dictionary")
 def _fetch_dictionary_api_data(word: str):
-    """Fetch raw word data from the DictionaryAPI."""
-    url = f"{DICTIONARY_API_URL}/{word}"
-    data = get_api_data(url)
-    if not data:
+    """
+    Fetch raw word data from the dictionary backends in order: the first one with an entry wins,
+    so a later backend is a fallback for words the earlier ones lack or could not be asked about.
+    Returns no_entry(word) when every backend answered without an entry, None when one failed
+    or none can run. Unavailable backends are skipped, not counted as failed requests.
+    """
+    backends = _available_backends()
+    failed = not backends
+    for backend in backends:
+        data = backend.lookup(word)
+        if data and not is_no_entry(data):
+            annotate(backend=backend.name)
+            return data
+        failed = failed or data is None
+    if failed:
         print(get_message("DATA_GATHERING_PROCESSING.dict_fetch_error", word=word))
         return None
-    return data
+    return no_entry(word)
 
-def _fetch_thesaurus_api_data(word: str):
+def _fetch_big_huge_data(word: str):
     """Fetch raw thesaurus data from Big Huge Thesaurus."""
     if not BIG_HUGE_API_KEY:
         print(get_message("DATA_GATHERING_PROCESSING.thesaurus_key_missing"))
@@ -43,6 +174,48 @@ def _fetch_thesaurus_api_data(word: str):
         print(get_message("DATA_GATHERING_PROCESSING.thesaurus_success"))
     return data
 
+def _fetch_local_thesaurus_data(word: str):
+    """Thesaurus data from the precompiled WordNet table, or None if it lacks the word or is not built."""
+    from src.services.thesaurus_table import get_thesaurus_table
+
+    table = get_thesaurus_table()
+    return table.get(word) if table is not None else None
+
+THESAURUS_BACKENDS = {"wordnet": _fetch_local_thesaurus_data, "bighuge": _fetch_big_huge_data}
+_thesaurus_backends = None
+
+def get_thesaurus_backends() -> list:
+    """[(name, fetch), ...] for the names in THESAURUS_BACKENDS (settings), in order; unknown names are reported and skipped."""
+    global _thesaurus_backends
+    if _thesaurus_backends is None:
+        backends = []
+        for name in THESAURUS_BACKEND_NAMES:
+            if name in THESAURUS_BACKENDS:
+                backends.append((name, THESAURUS_BACKENDS[name]))
+            else:
+                print(get_message("DATA_GATHERING_PROCESSING.thesaurus_backend_unknown", name=name,
+                                  choices=", ".join(THESAURUS_BACKENDS)))
+        _thesaurus_backends = backends
+    return _thesaurus_backends
+
+@traced("thesaurus")
+def _fetch_thesaurus_api_data(word: str):
+    """
+    Fetch raw thesaurus data ({pos: {"syn", "ant", "rel", "sim"}}) from the thesaurus backends
+    in order: the first one that has the word wins, so Big Huge is only asked for words the
+    local table lacks (or not at all when it is not listed).
+    """
+    for name, fetch in get_thesaurus_backends():
+        data = fetch(word)
+        if data:
+            annotate(backend=name)
+            return data
+    return None
+
+def _deduplicate(lst):
+    seen = set()
+    return [x for x in lst if not (x in seen or seen.add(x))]
+
 def _process_thesaurus_data(thesaurus_data, requested_pos=None):
     """Extracts synonyms, antonyms, etc., from raw thesaurus data for a given POS."""
     if not thesaurus_data:
@@ -65,41 +238,100 @@ def _process_thesaurus_data(thesaurus_data, requested_pos=None):
         for pos_section in thesaurus_data.values():
             extract_from_section(pos_section)
 
-    def deduplicate(lst):
-        seen = set()
-        return [x for x in lst if not (x in seen or seen.add(x))]
-
     return {
-        "synonyms": deduplicate(all_synonyms),
-        "antonyms": deduplicate(all_antonyms),
-        "related": deduplicate(all_related),
-        "similar": deduplicate(all_similar)
+        "synonyms": _deduplicate(all_synonyms),
+        "antonyms": _deduplicate(all_antonyms),
+        "related": _deduplicate(all_related),
+        "similar": _deduplicate(all_similar)
     }
 
+def _entries(dictionary_data) -> list:
+    """Dictionary entries as a list, for both list (multi-entry) and dict (legacy) payloads."""
+    if isinstance(dictionary_data, dict):
+        return [dictionary_data]
+    return dictionary_data if isinstance(dictionary_data, list) else []
+
+def dictionary_relations(dictionary_data, pos: str) -> dict:
+    """
+    {"synonyms", "antonyms", "related", "similar"} the dictionary entry itself lists for
+    one part of speech, at the meaning and definition level (it has no related/similar).
+    """
+    synonyms, antonyms = [], []
+    for entry in _entries(dictionary_data):
+        for meaning in entry.get("meanings", []):
+            if meaning.get("partOfSpeech") != pos:
+                continue
+            synonyms.extend(meaning.get("synonyms", []))
+            antonyms.extend(meaning.get("antonyms", []))
+            for definition in meaning.get("definitions", []):
+                synonyms.extend(definition.get("synonyms", []))
+                antonyms.extend(definition.get("antonyms", []))
+    return {"synonyms": _deduplicate(synonyms), "antonyms": _deduplicate(antonyms), "related": [], "similar": []}
+
+def has_enough_synonyms(relations: dict) -> bool:
+    """True if dictionary_relations() make the thesaurus request unnecessary (THESAURUS_SKIP_MIN_SYNONYMS)."""
+    return THESAURUS_SKIP_MIN_SYNONYMS > 0 and len(relations["synonyms"]) >= THESAURUS_SKIP_MIN_SYNONYMS
+
+def _thesaurus_unless_covered(word: str, dictionary):
+    """
+    Fetches the thesaurus data unless no part of speech could need it: the dictionary
+    has no usable entry, or it lists enough synonyms for every part of speech it has,
+    whichever one the user confirms. Waits for the dictionary payload first, so a
+    covered word never spends thesaurus quota, cached or not.
+    """
+    dictionary_data = dictionary.result()
+    if not dictionary_data or is_no_entry(dictionary_data):
+        return None
+    parts_of_speech = {meaning.get("partOfSpeech") for entry in _entries(dictionary_data)
+                       for meaning in entry.get("meanings", [])}
+    if parts_of_speech and all(has_enough_synonyms(dictionary_relations(dictionary_data, pos))
+                               for pos in parts_of_speech):
+        return None
+    return _fetch_thesaurus_api_data(word)
+
 def format_word_list(words):
     """Format a list of words, returning empty string if no words found."""
     return ", ".join(words) if words else ""
 
-def fetch_word_data(word: str, requested_pos: str = None):
+def prefetch_word_data(word: str, journal=None) -> dict:
+    """
+    Starts the Dictionary and Thesaurus API requests in the background.
+    Both payloads do not depend on the part of speech, so they can be requested
+    before the user confirms it. The thesaurus request starts once the dictionary
+    payload is in, and is skipped when it already lists enough synonyms for every
+    part of speech. Pass the result to
+    fetch_word_data(prefetched=...).
+    With a CardJournal, responses recorded by an earlier run are reused.
+    """
+    dictionary = start_stage(journal, "dictionary", _fetch_dictionary_api_data, word)
+    return {
+        "dictionary": dictionary,
+        "thesaurus": start_stage(journal, "thesaurus", _thesaurus_unless_covered, word, dictionary),
+    }
+
+def fetch_word_data(word: str, requested_pos: str = None, prefetched: dict = None, exit_on_error: bool = True):
     """
     Fetches and processes word data from both Dictionary and Thesaurus APIs.
-    Returns a structured dictionary for the Anki card.
-    Exits if no dictionary data is found.
+    Uses the responses started by prefetch_word_data() when given.
+    Returns a structured dictionary for the Anki card, or no_entry(word) (check with
+    is_no_entry) if the dictionary has no entry for the word, in every mode.
+    If the dictionary request fails, exits (exit_on_error=True) or returns None.
     """
-    dictionary_data = _fetch_dictionary_api_data(word)
+    if prefetched:
+        dictionary_data = prefetched["dictionary"].result()
+    else:
+        dictionary_data = _fetch_dictionary_api_data(word)
+    if is_no_entry(dictionary_data):
+        print(get_message("DATA_GATHERING_PROCESSING.dict_no_entry", word=word))
+        return no_entry(word)
     if not dictionary_data:
         print(get_message("DATA_GATHERING_PROCESSING.dict_fetch_error", word=word))
+        if not exit_on_error:
+            return None
         sys.exit(1)
 
-    thesaurus_data = _fetch_thesaurus_api_data(word)
-    processed_thesaurus = _process_thesaurus_data(thesaurus_data, requested_pos)
-
-    # Handle both list (multi-entry) and dict (legacy) for backward compatibility
-    if isinstance(dictionary_data, dict):
-        entries = [dictionary_data]
-    elif isinstance(dictionary_data, list):
-        entries = dictionary_data
-    else:
+    entries = _entries(dictionary_data)
+    if not entries:
         print(get_message("DATA_GATHERING_PROCESSING.dict_invalid_format"))
         return None
 
@@ -122,13 +354,20 @@ def fetch_word_data(word: str, requested_pos: str = None):
 
     definitions = target_meaning.get("definitions", [{}])
 
+    # Enough synonyms in the entry itself: the thesaurus is not asked (or its answer not awaited).
+    # The dictionary lists no related/similar words, so those fields stay empty then.
+    relations = dictionary_relations(dictionary_data, target_meaning.get("partOfSpeech"))
+    if not has_enough_synonyms(relations):
+        thesaurus_data = prefetched["thesaurus"].result() if prefetched else _fetch_thesaurus_api_data(word)
+        relations = _process_thesaurus_data(thesaurus_data, requested_pos)
+
     return {
         "definition": definitions[0].get("definition", ""),
         "example": definitions[0].get("example", ""),
-        "synonyms": format_word_list(processed_thesaurus["synonyms"]),
-        "antonyms": format_word_list(processed_thesaurus["antonyms"]),
-        "related": format_word_list(processed_thesaurus["related"]),
-        "similar": format_word_list(processed_thesaurus["similar"]),
+        "synonyms": format_word_list(relations["synonyms"]),
+        "antonyms": format_word_list(relations["antonyms"]),
+        "related": format_word_list(relations["related"]),
+        "similar": format_word_list(relations["similar"]),
         "partOfSpeech": target_meaning.get("partOfSpeech", ""),
         "dictionary_api_response": dictionary_data
-    } 
\ No newline at end of file
+    }
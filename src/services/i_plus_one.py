@@ -0,0 +1,90 @@
+"""
+"i+1" sentences (`generate_card.py --i-plus-one`): indexed sentences with exactly one unknown word.
+
+Known words are the deck's Word fields expanded to their lemmas, the stopwords and,
+optionally, every word up to a CEFR level. They become a boolean mask over the
+sentence index's interned word IDs; every sentence is a sorted ID array, so the
+unknown words of all sentences are counted with one gather and one bincount.
+"""
+
+import sys
+import numpy as np
+from data.stopwords import stopwords
+from src.locales.loader import get_message
+from src.services.cefr_annotation import get_cefr_vocabulary
+from src.services.cefr_data import get_cefr_lemma_map, require_cefr_frequency_data
+from src.services.cefr_index import CEFR_LEVELS
+from src.services.deck_service import get_deck_words
+from src.services.sentence_index import SentenceIndex, SENTENCE_INDEX_DIR, cefr_source_hash
+
+def known_word_mask(index: SentenceIndex, known_words, lemma_map: dict = None, known_level: str = None) -> np.ndarray:
+    """
+    known[i] is True if index.words[i] counts as known: a known word or its lemma, a
+    stopword, or (with `known_level`) a vocabulary word at or below that CEFR level.
+    """
+    lemma_map = get_cefr_lemma_map() if lemma_map is None else lemma_map
+    names = set(known_words) | {lemma_map.get(word, word) for word in known_words} | set(stopwords)
+    known = np.zeros(len(index.words), dtype=bool)
+    if not len(index.words):
+        return known
+    candidates = np.array(sorted(names), dtype=str)
+    rows = np.minimum(np.searchsorted(index.words, candidates), len(index.words) - 1)
+    known[rows[index.words[rows] == candidates]] = True
+    if known_level:
+        vocabulary = get_cefr_vocabulary()
+        ids, found = vocabulary.lookup(np.asarray(index.words))
+        levels = vocabulary.levels[ids]
+        easy = (levels >= CEFR_LEVELS.index("A1")) & (levels <= CEFR_LEVELS.index(known_level))
+        known |= found & easy
+    return known
+
+
+def find_i_plus_one(index: SentenceIndex, known: np.ndarray):
+    """(sentence_ids, word_ids) of every sentence with exactly one unknown word, and that word."""
+    offsets = np.asarray(index.sentence_word_offsets, dtype=np.int64)
+    sentence_of = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    unknown = ~known[index.sentence_words]
+    unknown_counts = np.bincount(sentence_of[unknown], minlength=len(offsets) - 1)
+    positions = np.flatnonzero(unknown & (unknown_counts[sentence_of] == 1))
+    return sentence_of[positions], np.asarray(index.sentence_words)[positions]
+
+
+def pick_study_pairs(index: SentenceIndex, sentence_ids: np.ndarray, word_ids: np.ndarray) -> list:
+    """
+    [(word, sentence, sentence_count), ...]: the easiest i+1 sentence of each new word
+    that has a CEFR entry (not a name or a typo), words with the most i+1 sentences first.
+    """
+    cardable = np.isin(np.asarray(index.words), np.asarray(index.lemmas))[word_ids]
+    sentence_ids, word_ids = sentence_ids[cardable], word_ids[cardable]
+    if not len(word_ids):
+        return []
+    order = np.lexsort((np.asarray(index.sentence_scores)[sentence_ids], word_ids))
+    sentence_ids, word_ids = sentence_ids[order], word_ids[order]
+    unique, first, counts = np.unique(word_ids, return_index=True, return_counts=True)
+    pairs = [(str(index.words[word]), index.sentence(int(sentence_ids[start])), int(count))
+             for word, start, count in zip(unique.tolist(), first.tolist(), counts.tolist())]
+    pairs.sort(key=lambda pair: -pair[2])
+    return pairs
+
+
+def run_i_plus_one(deck_name: str, known_level: str = None, path: str = SENTENCE_INDEX_DIR, out=None) -> list:
+    """
+    Writes one i+1 sentence per new word as a --batch file ("sentence<TAB>word" rows)
+    to `out`, stdout by default; a summary goes to stderr.
+    """
+    out = out or sys.stdout
+    table = require_cefr_frequency_data()
+    try:
+        index = SentenceIndex(path, cefr_source=cefr_source_hash(table))
+    except (OSError, ValueError) as e:
+        print(get_message("SENTENCE_MINING_MODE.index_missing", path=path, error=str(e)), file=sys.stderr)
+        sys.exit(1)
+    deck_words = get_deck_words(deck_name)
+    known = known_word_mask(index, deck_words, known_level=known_level)
+    sentence_ids, word_ids = find_i_plus_one(index, known)
+    pairs = pick_study_pairs(index, sentence_ids, word_ids)
+
+    out.writelines(f"{sentence}\t{word}\n" for word, sentence, _count in pairs)
+    print(get_message("I_PLUS_ONE_MODE.summary", sentences=len(index.sentence_scores), deck=len(deck_words),
+                      known=int(known.sum()), matches=len(sentence_ids), words=len(pairs)), file=sys.stderr)
+    return pairs
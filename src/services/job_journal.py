@@ -0,0 +1,98 @@
+"""SQLite journal of per-card stage outputs, so an interrupted batch resumes where it stopped."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from concurrent.futures import Future
+from src.utils.concurrency import run_in_background
+
+class JobJournal:
+    """
+    Stores the JSON output of every completed stage (dictionary, thesaurus, images,
+    word_audio, sentence_audio, media, note) keyed by card. One connection is shared
+    by all worker threads and guarded by a lock; every write is committed immediately.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stages ("
+            " card_key TEXT NOT NULL, stage TEXT NOT NULL, value TEXT NOT NULL,"
+            " PRIMARY KEY (card_key, stage))"
+        )
+        self._conn.commit()
+
+    def get(self, card_key: str, stage: str):
+        """Return the recorded output of a stage, or None if it has not completed yet."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM stages WHERE card_key = ? AND stage = ?", (card_key, stage)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, card_key: str, stage: str, value) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stages (card_key, stage, value) VALUES (?, ?, ?)",
+                (card_key, stage, json.dumps(value, ensure_ascii=False))
+            )
+            self._conn.commit()
+
+    def card(self, sentence: str, word: str) -> "CardJournal":
+        """Return the journal view for one (sentence, word) card."""
+        key = hashlib.sha1(f"{sentence.strip()}\t{word.strip().lower()}".encode("utf-8")).hexdigest()
+        return CardJournal(self, key)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CardJournal:
+    """Stage records of a single card."""
+
+    def __init__(self, journal: JobJournal, card_key: str):
+        self.journal = journal
+        self.card_key = card_key
+
+    def get(self, stage: str):
+        return self.journal.get(self.card_key, stage)
+
+    def put(self, stage: str, value) -> None:
+        self.journal.put(self.card_key, stage, value)
+
+
+def _is_complete(result) -> bool:
+    # Failed fetches return None / [] / (None, None); those must be retried on the next run
+    if isinstance(result, (tuple, list)) and result and all(item is None for item in result):
+        return False
+    # "No dictionary entry" is remembered by the dictionary cache, which lets it expire
+    if isinstance(result, dict) and result.get("no_entry") is True:
+        return False
+    return bool(result)
+
+
+def start_stage(journal: CardJournal, stage: str, func, *args) -> Future:
+    """
+    Runs func(*args) in the background like run_in_background(), unless the journal
+    already holds this stage's output. Successful results are recorded in the journal.
+    """
+    if journal is None:
+        return run_in_background(func, *args)
+    saved = journal.get(stage)
+    if saved is not None:
+        future = Future()
+        future.set_result(saved)
+        return future
+
+    def run():
+        result = func(*args)
+        if _is_complete(result):
+            journal.put(stage, result)
+        return result
+
+    return run_in_background(run)
@@ -5,6 +5,7 @@ import shutil
 import requests
 from src.locales.loader import get_message
 from src.config import settings
+from src.utils.tracing import traced, annotate
 
 ANKI_CONNECT_URL = settings.ANKI_CONNECT_URL
 
@@ -33,6 +34,7 @@ def move_old_media_to_trash_if_exists(filename: str) -> None:
             # If moving fails, just log it but don't stop the process
             print(f"Warning: Could not move {filename} to trash: {e}")
 
+@traced(category="anki")
 def send_media_file(name: str, b64_data: str) -> bool:
     """
     Sends a base64-encoded media file to AnkiConnect.
@@ -46,6 +48,7 @@ def send_media_file(name: str, b64_data: str) -> bool:
     """
     if not b64_data:
         return False
+    annotate(file=name, bytes=len(b64_data))
     
     # Move existing file to trash before overwriting
     move_old_media_to_trash_if_exists(name)
@@ -3,7 +3,9 @@
 from src.config.settings import PEXELS_API_KEY, PEXELS_API_URL, PEXELS_IMAGE_COUNT
 from src.locales.loader import get_message
 from src.utils.api_client import get_api_data
+from src.utils.tracing import traced
 
+@traced("pexels")
 def fetch_pexels_images(query: str):
     """
     Fetch images from the Pexels API.
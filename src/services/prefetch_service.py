@@ -0,0 +1,45 @@
+"""Starts every network request a card needs as soon as the focus word is known."""
+
+import hashlib
+from concurrent.futures import Future
+from src.services.job_journal import start_stage
+from src.utils.concurrency import run_in_background
+from src.services.dictionary_service import prefetch_word_data
+from src.services.pexels_api import fetch_pexels_images
+from src.services.tts_service import generate_tts_base64
+
+def sentence_audio_prefix(sentence: str, words: list) -> str:
+    """
+    Filename prefix for the sentence audio. A single word keeps the usual
+    tts_sentence_<word>.mp3; several words share one file named after the sentence.
+    """
+    if len(words) == 1:
+        return f"sentence_{words[0]}"
+    return f"sentence_{hashlib.sha1(sentence.encode('utf-8')).hexdigest()[:10]}"
+
+def start_sentence_audio(sentence: str, words: list, exit_on_error: bool = True) -> Future:
+    """Starts the sentence TTS once for all focus words; pass it to start_card_prefetch(sentence_audio=...)."""
+    return run_in_background(generate_tts_base64, sentence, sentence_audio_prefix(sentence, words), exit_on_error)
+
+def start_card_prefetch(word: str, sentence: str, exit_on_error: bool = True, journal=None,
+                        sentence_audio: Future = None) -> dict:
+    """
+    Launches the dictionary, thesaurus, Pexels and both TTS requests concurrently.
+    None of them depends on the part of speech or on user choices, so the card
+    flow can join each result where it is used and waits only for the slowest one.
+    With exit_on_error=False a failed TTS request yields (None, None) instead of exiting.
+    With a CardJournal, stages completed by an earlier run are not requested again.
+    Pass `sentence_audio` to share one sentence TTS between several focus words.
+
+    Returns:
+        dict: Futures keyed "word_data" (for fetch_word_data), "images",
+        "word_audio" and "sentence_audio" (for generate_tts_base64 results).
+    """
+    return {
+        "word_data": prefetch_word_data(word, journal),
+        "images": start_stage(journal, "images", fetch_pexels_images, word),
+        "word_audio": start_stage(journal, "word_audio", generate_tts_base64, word, word, exit_on_error),
+        "sentence_audio": sentence_audio or start_stage(
+            journal, "sentence_audio", generate_tts_base64, sentence, f"sentence_{word}", exit_on_error
+        ),
+    }
@@ -0,0 +1,319 @@
+"""
+Example-sentence mining from a local corpus (`--index-corpus DIR`, `--mine-sentences FILE`).
+
+Indexing reads every text file under a directory once (plain or gzipped) and keeps
+each sentence of 5-30 words, cleaned like clipboard text (clean_clipboard_text). Every sentence is scored
+for each vocabulary lemma in it: the mean CEFR difficulty of the other words, plus
+a penalty for being shorter or longer than a comfortable card sentence. Only the
+best MAX_SENTENCES_PER_LEMMA sentences per lemma are kept, already in score order.
+
+The index is a directory of .npy arrays (a sorted lemma array, CSR-style postings
+and a UTF-8 sentence blob) opened memory-mapped, so a query is one searchsorted and
+a slice: well under a millisecond, with no load step beyond opening the files.
+Each kept sentence is also stored as the sorted IDs of its interned words (lemmas,
+or the token itself for words missing from the table), for i_plus_one.py.
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import numpy as np
+from src.locales.loader import get_message
+from src.services.cefr_annotation import get_cefr_vocabulary, TOKEN_PATTERN
+from src.services.cefr_data import get_cefr_lemma_map, require_cefr_frequency_data
+from src.services.cefr_index import CEFR_LEVELS, CefrIndex
+from src.services.clipboard_service import clean_clipboard_text
+from src.services.corpus_profile import iter_chunks, SENTENCE_END, EXAMPLE_MIN_TOKENS, EXAMPLE_MAX_TOKENS
+
+SENTENCE_INDEX_DIR = "data/sentence_index"
+SENTENCE_INDEX_VERSION = 2
+CORPUS_SUFFIXES = (".txt", ".srt", ".txt.gz", ".srt.gz")
+MAX_SENTENCES_PER_LEMMA = 20
+MINED_SENTENCES_LIMIT = 3
+# Sentences of this many words read best on a card; each word outside the range costs LENGTH_PENALTY
+IDEAL_MIN_TOKENS = 8
+IDEAL_MAX_TOKENS = 20
+LENGTH_PENALTY = 0.25
+# Difficulty of a surrounding word by CEFR code (see CEFR_LEVELS): words missing from the
+# table (names, rare words) count as hardest, listed words without a level in between
+LEVEL_WEIGHTS = np.array([5.0, 3.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32)
+HYPHENATED_LINE_BREAK = re.compile(r"-\s*\n\s*")
+
+
+def find_corpus_files(directory: str) -> list:
+    """Text and subtitle files (plain or gzipped) under `directory`, in a stable order."""
+    paths = []
+    for root, _dirs, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(CORPUS_SUFFIXES))
+    return sorted(paths)
+
+
+def _length_penalty(lengths: np.ndarray) -> np.ndarray:
+    return LENGTH_PENALTY * np.maximum(0, np.maximum(IDEAL_MIN_TOKENS - lengths, lengths - IDEAL_MAX_TOKENS))
+
+
+def _lemma_ids(vocabulary, lemma_map: dict) -> np.ndarray:
+    """For each vocabulary row, the row of its lemma (its own row when it has none)."""
+    lemma_ids = np.arange(len(vocabulary.words))
+    forms = np.array(list(lemma_map), dtype=str)
+    if len(forms):
+        form_ids, form_found = vocabulary.lookup(forms)
+        target_ids, target_found = vocabulary.lookup(np.array([lemma_map[f] for f in forms.tolist()], dtype=str))
+        ok = form_found & target_found
+        lemma_ids[form_ids[ok]] = target_ids[ok]
+    return lemma_ids
+
+
+class SentenceIndexBuilder:
+    """Collects the best-scoring sentences per lemma, one chunk of text at a time."""
+
+    def __init__(self, vocabulary=None, lemma_map: dict = None, per_lemma: int = MAX_SENTENCES_PER_LEMMA):
+        self.vocabulary = vocabulary or get_cefr_vocabulary()
+        self.lemma_ids = _lemma_ids(self.vocabulary, get_cefr_lemma_map() if lemma_map is None else lemma_map)
+        self.per_lemma = per_lemma
+        self.candidates = {}  # lemma row -> [(score, sentence), ...]
+        # Score a sentence must beat to enter a lemma's full candidate list
+        self.cutoffs = np.full(len(self.vocabulary.words), np.inf)
+        self.sentences_seen = 0
+
+    def add_text(self, text: str) -> None:
+        # Only whitespace is normalized here; the few sentences kept are cleaned fully in write()
+        sentences, tokens = [], []
+        for sentence in SENTENCE_END.split(" ".join(HYPHENATED_LINE_BREAK.sub("", text).split())):
+            words = TOKEN_PATTERN.findall(sentence.lower())
+            if EXAMPLE_MIN_TOKENS <= len(words) <= EXAMPLE_MAX_TOKENS:
+                sentences.append(sentence)
+                tokens.append(words)
+        if not sentences:
+            return
+        self.sentences_seen += len(sentences)
+
+        # One vectorized pass over every token of the chunk
+        lengths = np.array([len(words) for words in tokens])
+        sentence_of = np.repeat(np.arange(len(sentences)), lengths)
+        unique, inverse = np.unique(np.array([w for words in tokens for w in words], dtype=str), return_inverse=True)
+        ids, found = self.vocabulary.lookup(unique)
+        levels = np.where(found, self.vocabulary.levels[ids], CEFR_LEVELS.index(""))
+        weights = LEVEL_WEIGHTS[levels][inverse]
+        totals = np.bincount(sentence_of, weights=weights, minlength=len(sentences))
+        length_penalty = _length_penalty(lengths)
+
+        # (lemma, sentence) pairs scored by the difficulty of the *other* words in the sentence
+        token_found = found[inverse]
+        lemmas = self.lemma_ids[ids[inverse][token_found]]
+        pair_sentences = sentence_of[token_found]
+        scores = ((totals[pair_sentences] - weights[token_found]) / (lengths[pair_sentences] - 1)
+                  + length_penalty[pair_sentences])
+        _, first = np.unique(lemmas * len(sentences) + pair_sentences, return_index=True)
+        first = first[scores[first] < self.cutoffs[lemmas[first]]]
+        lemmas, pair_sentences, scores = lemmas[first], pair_sentences[first], scores[first]
+
+        # Only the best per_lemma pairs of each lemma in this chunk can make the final cut
+        order = np.lexsort((scores, lemmas))
+        lemmas, pair_sentences, scores = lemmas[order], pair_sentences[order], scores[order]
+        group_start = np.searchsorted(lemmas, lemmas, side="left")
+        keep = np.arange(len(lemmas)) - group_start < self.per_lemma
+        for lemma, sentence, score in zip(lemmas[keep].tolist(), pair_sentences[keep].tolist(), scores[keep].tolist()):
+            self.candidates.setdefault(lemma, []).append((score, sentences[sentence]))
+        for lemma in set(lemmas[keep].tolist()):
+            if len(self.candidates[lemma]) > 2 * self.per_lemma:
+                self.candidates[lemma] = self._best(self.candidates[lemma])
+                self.cutoffs[lemma] = self.candidates[lemma][-1][0]
+
+    def _best(self, candidates: list) -> list:
+        best, seen = [], set()
+        for score, sentence in sorted(candidates):
+            if sentence not in seen:
+                seen.add(sentence)
+                best.append((score, sentence))
+                if len(best) == self.per_lemma:
+                    break
+        return best
+
+    def _sentence_words(self, sentences: list):
+        """
+        Interned words of the sentences as (words, offsets, ids, scores): sentence i holds
+        the sorted, unique word IDs ids[offsets[i]:offsets[i + 1]], which index `words`;
+        scores[i] is its difficulty over all of its words plus the length penalty.
+        """
+        tokens = [TOKEN_PATTERN.findall(sentence.lower()) for sentence in sentences]
+        lengths = np.array([len(words) for words in tokens], dtype=np.int64)
+        sentence_of = np.repeat(np.arange(len(sentences)), lengths)
+        unique, inverse = np.unique(np.array([w for words in tokens for w in words], dtype=str), return_inverse=True)
+        offsets = np.zeros(len(sentences) + 1, dtype=np.uint64)
+        if not len(unique):
+            return unique, offsets, np.zeros(0, dtype=np.uint32), np.zeros(len(sentences), dtype=np.float32)
+        ids, found = self.vocabulary.lookup(unique)
+        # Vocabulary words are interned as their lemma ("fled" -> "flee"), others as themselves
+        words, word_of_unique = np.unique(np.where(found, self.vocabulary.words[self.lemma_ids[ids]], unique),
+                                          return_inverse=True)
+        keys = np.unique(sentence_of * len(words) + word_of_unique[inverse])
+        offsets[1:] = np.cumsum(np.bincount(keys // len(words), minlength=len(sentences)))
+        levels = np.where(found, self.vocabulary.levels[ids], CEFR_LEVELS.index(""))
+        totals = np.bincount(sentence_of, weights=LEVEL_WEIGHTS[levels][inverse], minlength=len(sentences))
+        scores = totals / np.maximum(lengths, 1) + _length_penalty(lengths)
+        return words, offsets, (keys % len(words)).astype(np.uint32), scores.astype(np.float32)
+
+    def write(self, path: str, meta: dict) -> dict:
+        """Writes the index directory (replacing an existing one) and returns its meta data."""
+        sentence_ids, cleaned = {}, []
+        lemma_rows = sorted(self.candidates, key=lambda row: self.vocabulary.words[row])
+        posting_offsets, postings, scores = [0], [], []
+        for row in lemma_rows:
+            for score, sentence in self._best(self.candidates[row]):
+                if sentence not in sentence_ids:
+                    sentence_ids[sentence] = len(sentence_ids)
+                    cleaned.append(clean_clipboard_text(sentence))
+                postings.append(sentence_ids[sentence])
+                scores.append(score)
+            posting_offsets.append(len(postings))
+        encoded = [sentence.encode("utf-8") for sentence in cleaned]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+        offsets[1:] = np.cumsum([len(sentence) for sentence in encoded])
+        words, word_offsets, sentence_words, sentence_scores = self._sentence_words(cleaned)
+
+        meta = {**meta, "version": SENTENCE_INDEX_VERSION, "sentences": len(sentence_ids), "lemmas": len(lemma_rows)}
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        os.makedirs(tmp_path, exist_ok=True)
+        arrays = {
+            "lemmas": self.vocabulary.words[lemma_rows] if lemma_rows else np.array([], dtype=str),
+            "posting_offsets": np.array(posting_offsets, dtype=np.uint32),
+            "postings": np.array(postings, dtype=np.uint32),
+            "scores": np.array(scores, dtype=np.float32),
+            "sentence_offsets": offsets,
+            "sentences": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "words": words,
+            "sentence_word_offsets": word_offsets,
+            "sentence_words": sentence_words,
+            "sentence_scores": sentence_scores,
+        }
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_path, f"{name}.npy"), array)
+        with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(tmp_path, path)
+        return meta
+
+
+def cefr_source_hash(table):
+    """The SHA-256 stamp of the CSV behind a CefrIndex (hex), or None for an in-memory table."""
+    return table.source[2].hex() if isinstance(table, CefrIndex) else None
+
+
+class SentenceIndex:
+    """A built sentence index, memory-mapped. find() returns a word's best sentences."""
+
+    def __init__(self, path: str = SENTENCE_INDEX_DIR, cefr_source: str = None):
+        """
+        Raises OSError if the index is missing and ValueError if it is unreadable or outdated:
+        built by another version, or (given `cefr_source`, see cefr_source_hash) from another CSV,
+        whose lemmas and word IDs no longer match the current table.
+        """
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != SENTENCE_INDEX_VERSION:
+            raise ValueError(f"{path} was built by an incompatible version")
+        built_from = self.meta.get("cefr_source")
+        if cefr_source and built_from and built_from != cefr_source:
+            raise ValueError(f"{path} was built from a different CEFR table")
+        self.lemmas = self._load("lemmas")
+        self.posting_offsets = self._load("posting_offsets")
+        self.postings = self._load("postings")
+        self.scores = self._load("scores")
+        self.sentence_offsets = self._load("sentence_offsets")
+        self.sentences = self._load("sentences")
+        self.words = self._load("words")
+        self.sentence_word_offsets = self._load("sentence_word_offsets")
+        self.sentence_words = self._load("sentence_words")
+        self.sentence_scores = self._load("sentence_scores")
+
+    def _load(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+
+    def sentence(self, sentence_id: int) -> str:
+        start, end = self.sentence_offsets[sentence_id], self.sentence_offsets[sentence_id + 1]
+        return self.sentences[start:end].tobytes().decode("utf-8")
+
+    def find(self, lemma: str, limit: int = MINED_SENTENCES_LIMIT) -> list:
+        """[(sentence, score), ...] for a lemma, best (lowest score) first; [] if it has none."""
+        row = int(np.searchsorted(self.lemmas, lemma))
+        if row >= len(self.lemmas) or self.lemmas[row] != lemma:
+            return []
+        start = int(self.posting_offsets[row])
+        end = min(int(self.posting_offsets[row + 1]), start + limit)
+        return [(self.sentence(int(self.postings[i])), float(self.scores[i])) for i in range(start, end)]
+
+
+def build_sentence_index(directory: str, path: str = SENTENCE_INDEX_DIR) -> dict:
+    """Indexes every corpus file under `directory` into `path`. Returns the index meta data."""
+    table = require_cefr_frequency_data()
+    files = find_corpus_files(directory)
+    builder = SentenceIndexBuilder()
+    for file_path in files:
+        for chunk in iter_chunks(file_path):
+            builder.add_text(chunk)
+    return builder.write(path, {"corpus": os.path.abspath(directory), "files": len(files),
+                                "cefr_source": cefr_source_hash(table)})
+
+
+def read_word_list(path: str) -> list:
+    """Words from the first column of a word list, '#' comment lines and blanks skipped ('-' reads stdin)."""
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        # dict keeps the first occurrence of each word in order, with O(1) duplicate checks
+        words = {}
+        for line in f:
+            word = line.split("\t")[0].strip().lower()
+            if word and not word.startswith("#"):
+                words.setdefault(word)
+        return list(words)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def mine_sentences(words: list, index: SentenceIndex, limit: int = 1) -> dict:
+    """{word: [(sentence, score), ...]} for each word, looked up by its lemma ("fled" -> "flee")."""
+    lemma_map = get_cefr_lemma_map()
+    return {word: index.find(word, limit) or index.find(lemma_map.get(word, word), limit) for word in words}
+
+
+def run_index_corpus(directory: str, path: str = SENTENCE_INDEX_DIR) -> dict:
+    start = time.perf_counter()
+    meta = build_sentence_index(directory, path)
+    print(get_message("SENTENCE_MINING_MODE.index_built", sentences=meta["sentences"], lemmas=meta["lemmas"],
+                      files=meta["files"], seconds=time.perf_counter() - start, path=path), file=sys.stderr)
+    return meta
+
+
+def run_mine_sentences(word_list_path: str, path: str = SENTENCE_INDEX_DIR, out=None) -> dict:
+    """
+    Writes the best indexed sentence of every listed word as a --batch file
+    ("sentence<TAB>word" rows) to `out`, stdout by default; a summary goes to stderr.
+    """
+    out = out or sys.stdout
+    table = require_cefr_frequency_data()
+    try:
+        index = SentenceIndex(path, cefr_source=cefr_source_hash(table))
+    except (OSError, ValueError) as e:
+        print(get_message("SENTENCE_MINING_MODE.index_missing", path=path, error=str(e)), file=sys.stderr)
+        sys.exit(1)
+    words = read_word_list(word_list_path)
+    get_cefr_lemma_map()
+    start = time.perf_counter()
+    mined = mine_sentences(words, index)
+    seconds = time.perf_counter() - start
+
+    out.writelines(f"{found[0][0]}\t{word}\n" for word, found in mined.items() if found)
+    missing = [word for word, found in mined.items() if not found]
+    print(get_message("SENTENCE_MINING_MODE.mined", found=len(words) - len(missing), total=len(words),
+                      micros=seconds / max(1, len(words)) * 1e6), file=sys.stderr)
+    if missing:
+        print(get_message("SENTENCE_MINING_MODE.not_found", words=", ".join(missing)), file=sys.stderr)
+    return mined
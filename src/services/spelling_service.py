@@ -0,0 +1,173 @@
+"""
+Typo detection for focus words against the CEFR/frequency vocabulary, before any API call.
+
+A SymSpell-style symmetric-delete index: every vocabulary word is stored under each
+string obtained by deleting up to two characters from its first seven letters. The
+same deletes of a typed word are looked up in it, and the few candidates found are
+checked with the real edit distance. The delete keys are kept as CRC32 hashes in a
+sorted NumPy array (~4M entries, searched with np.searchsorted) and cached next to
+the CSV, keyed on its content, since building them takes a few seconds.
+"""
+
+import itertools
+import os
+import threading
+import zlib
+import numpy as np
+from src.services.cefr_data import get_cefr_frequency_data, lookup_cefr
+from src.services.cefr_index import CefrIndex
+
+SPELLING_INDEX_PATH = "data/merged_cefr_frequency.spelling.npz"
+MAX_EDIT_DISTANCE = 2
+SPELLING_SUGGESTION_LIMIT = 5
+# Only the deletes of a word's first letters are indexed (SymSpell's prefix length):
+# typos past the prefix leave it intact, and the index stays ~4x smaller
+PREFIX_LENGTH = 7
+
+_spelling_index = None
+_spelling_index_lock = threading.Lock()
+
+
+def _deletes(word: str, depth: int) -> set:
+    """The word plus every string obtained by deleting up to `depth` characters from it."""
+    found, level = {word}, {word}
+    for _ in range(depth):
+        level = {w[:i] + w[i + 1:] for w in level for i in range(len(w))}
+        found |= level
+    return found
+
+
+def _band(frequency: str) -> int:
+    # Band 9 holds the most frequent words; unbanded words rank last
+    return int(frequency) if frequency.isdigit() else 0
+
+
+def _hash(keys) -> np.ndarray:
+    return np.fromiter((zlib.crc32(key.encode("utf-8")) for key in keys), dtype=np.uint32)
+
+
+def edit_distance(a: str, b: str, max_distance: int = MAX_EDIT_DISTANCE) -> int:
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions and adjacent
+    transpositions). Returns max_distance + 1 as soon as the distance is known to exceed it.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cost = ca != cb
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class SpellingIndex:
+    """Delete-hash index over a word list: hashes[k] is a delete key of words[ids[k]]'s prefix."""
+
+    def __init__(self, words: list, hashes: np.ndarray, ids: np.ndarray):
+        self.words = words
+        self.hashes = hashes
+        self.ids = ids
+
+    @classmethod
+    def build(cls, words) -> "SpellingIndex":
+        words = list(words)
+        keys, ids = [], []
+        for i, word in enumerate(words):
+            deletes = _deletes(word[:PREFIX_LENGTH], MAX_EDIT_DISTANCE)
+            keys.extend(deletes)
+            ids.extend(itertools.repeat(i, len(deletes)))
+        hashes = _hash(keys)
+        order = np.argsort(hashes, kind="stable")
+        return cls(words, hashes[order], np.array(ids, dtype=np.uint32)[order])
+
+    def save(self, path: str, source_hash: str) -> None:
+        tmp_path = f"{path}.tmp{os.getpid()}.npz"
+        words = np.frombuffer("\n".join(self.words).encode("utf-8"), dtype=np.uint8)
+        np.savez(tmp_path, source=np.array(source_hash), words=words, hashes=self.hashes, ids=self.ids)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, source_hash: str):
+        """The cached index if it was built from the same CSV content, else None."""
+        try:
+            with np.load(path) as cache:
+                if str(cache["source"]) != source_hash:
+                    return None
+                words = cache["words"].tobytes().decode("utf-8").split("\n")
+                return cls(words, cache["hashes"], cache["ids"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def candidates(self, word: str, max_distance: int = MAX_EDIT_DISTANCE) -> dict:
+        """
+        {vocabulary word: edit distance} for every word within max_distance of `word`.
+        max_distance cannot exceed MAX_EDIT_DISTANCE, the depth of the indexed deletes.
+        """
+        query = _hash(_deletes(word[:PREFIX_LENGTH], max_distance))
+        starts = np.searchsorted(self.hashes, query, side="left")
+        ends = np.searchsorted(self.hashes, query, side="right")
+        ids = np.unique(np.concatenate([self.ids[start:end] for start, end in zip(starts, ends)]))
+        found = {}
+        for i in ids.tolist():
+            distance = edit_distance(word, self.words[i], max_distance)
+            if distance <= max_distance:
+                found[self.words[i]] = distance
+        return found
+
+
+def get_spelling_index() -> SpellingIndex:
+    """The spelling index of the CEFR vocabulary, read from its cache or built on the first call."""
+    global _spelling_index
+    if _spelling_index is None:
+        with _spelling_index_lock:
+            if _spelling_index is None:
+                _spelling_index = load_spelling_index(get_cefr_frequency_data())
+    return _spelling_index
+
+
+def load_spelling_index(table, path: str = SPELLING_INDEX_PATH) -> SpellingIndex:
+    """Reads the cached index when it matches the table's source CSV, else builds (and caches) it."""
+    source_hash = table.source[2].hex() if isinstance(table, CefrIndex) else None
+    if source_hash:
+        index = SpellingIndex.load(path, source_hash)
+        if index is not None:
+            return index
+    index = SpellingIndex.build(table.keys() if isinstance(table, dict) else table.words())
+    if source_hash:
+        try:
+            index.save(path, source_hash)
+        except OSError:
+            pass
+    return index
+
+
+def is_known_word(word: str) -> bool:
+    """True if the word, or its lemma ("fleeing" -> "flee"), is in the CEFR/frequency vocabulary."""
+    entry = lookup_cefr(word)
+    return bool(entry["cefr"] or entry["frequency"] or entry["lemma"])
+
+
+def suggest_spelling(word: str, limit: int = SPELLING_SUGGESTION_LIMIT, index: SpellingIndex = None) -> list:
+    """
+    Nearest vocabulary words to a (probably misspelled) word, as {"word", "cefr",
+    "frequency", "distance"}: closest first, then the most frequent band first.
+    """
+    word = word.strip().lower()
+    index = index or get_spelling_index()
+    table = get_cefr_frequency_data()
+    suggestions = []
+    for candidate, distance in index.candidates(word).items():
+        if candidate == word:
+            continue
+        entry = table.get(candidate) or {}
+        suggestions.append({"word": candidate, "cefr": entry.get("cefr", ""),
+                            "frequency": entry.get("frequency", ""), "distance": distance})
+    suggestions.sort(key=lambda s: (s["distance"], -_band(s["frequency"]), s["word"]))
+    return suggestions[:limit]
@@ -0,0 +1,65 @@
+"""Ranks the words of a sentence as focus-word candidates by CEFR level and rarity."""
+
+import re
+from src.services.cefr_data import lookup_cefr
+from src.services.cefr_lemmas import lemma_candidates, irregular_lemma_map, wordnet_lemmatizer
+from data.stopwords import stopwords
+
+SUGGESTION_LIMIT = 5
+CEFR_WEIGHTS = {"A1": 0, "A2": 1, "B1": 2, "B2": 3, "C1": 4, "C2": 5}
+# Words listed without a level ("?") are mostly rarer forms; their frequency band decides
+UNKNOWN_LEVEL_WEIGHT = 2
+MOST_FREQUENT_BAND = 9
+CONTENT_TAG_PREFIXES = ("NN", "VB", "JJ", "RB")
+PROPER_NOUN_TAGS = ("NNP", "NNPS")
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+
+
+def score_entry(entry: dict) -> int:
+    """Higher is more worth studying: CEFR level counts double, plus rarity (9 - frequency band)."""
+    weight = CEFR_WEIGHTS.get(entry.get("cefr", ""), UNKNOWN_LEVEL_WEIGHT)
+    band = entry.get("frequency", "")
+    rarity = MOST_FREQUENT_BAND - int(band) if band.isdigit() else 0
+    return 2 * weight + rarity
+
+
+def _candidate_tokens(sentence: str, tagged=None):
+    """(token, tag) pairs of the sentence; tag is None when the sentence could not be tagged."""
+    if tagged:
+        return tagged
+    return [(token, None) for token in TOKEN_PATTERN.findall(sentence)]
+
+
+def _is_known(word: str, entry: dict, known_words, lemmatize) -> bool:
+    """True if the word, or any of its lemmas ("abandoned" -> "abandon"), already has a card."""
+    if word in known_words or entry["lemma"] in known_words:
+        return True
+    return any(lemma in known_words for lemma in lemma_candidates(word, irregular_lemma_map(), lemmatize))
+
+
+def suggest_focus_words(sentence: str, tagged=None, known_words=frozenset(), limit: int = SUGGESTION_LIMIT) -> list:
+    """
+    Returns up to `limit` candidates as {"word", "cefr", "frequency", "score"}, best first
+    (ties keep sentence order). Stopwords, proper nouns, non-content words (when `tagged`,
+    the output of tag_sentence, is given), words missing from the CEFR table and words
+    whose form or lemma is in `known_words` (e.g. the deck's Word fields) are skipped.
+    """
+    candidates, seen = [], set()
+    lemmatize = wordnet_lemmatizer() if known_words else None
+    for token, tag in _candidate_tokens(sentence, tagged):
+        word = token.lower().replace("’", "'")
+        if word in seen or len(word) < 3 or word in stopwords or not TOKEN_PATTERN.fullmatch(word):
+            continue
+        seen.add(word)
+        if tag is not None and (tag in PROPER_NOUN_TAGS or not tag.startswith(CONTENT_TAG_PREFIXES)):
+            continue
+        entry = lookup_cefr(word)
+        if not entry["cefr"] and not entry["frequency"]:
+            continue
+        if known_words and _is_known(word, entry, known_words, lemmatize):
+            continue
+        score = score_entry(entry)
+        if score > 0:
+            candidates.append({"word": word, "cefr": entry["cefr"], "frequency": entry["frequency"], "score": score})
+    candidates.sort(key=lambda c: -c["score"])
+    return candidates[:limit]
@@ -0,0 +1,178 @@
+"""
+Local thesaurus table (`generate_card.py --build-thesaurus`): WordNet relations of the
+whole CEFR vocabulary, compiled once, so thesaurus lookups need no API key, quota or
+network, and not even WordNet at run time.
+
+Every vocabulary word WordNet knows gets the sections of a Big Huge Thesaurus response,
+per part of speech: "syn" (the other lemmas of its synsets), "ant" (antonyms of its own
+lemmas), "sim" (similar-to adjectives) and "rel" (also-see synsets). Entries are compact
+JSON slices of one UTF-8 blob, indexed by sorted words packed the same way (offsets
+into a UTF-8 blob, as in cefr_index.py), so a lookup is one binary search and one
+json.loads. The file is tied to the CSV it was built from and is read on the first
+lookup.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import numpy as np
+from src.locales.loader import get_message
+from src.services.cefr_data import get_cefr_frequency_data, require_cefr_frequency_data
+from src.services.cefr_index import CefrIndex
+from src.services.wordnet_dictionary import (
+    WORDNET_POS, dedupe, display_name, get_wordnet, own_lemmas, wordnet_key
+)
+
+THESAURUS_TABLE_PATH = "data/merged_cefr_frequency.thesaurus.npz"
+THESAURUS_SECTIONS = ("syn", "ant", "rel", "sim")
+
+_table = None
+_table_loaded = False
+_table_lock = threading.Lock()
+
+
+def _lemma_names(synsets) -> list:
+    return [display_name(lemma.name()) for synset in synsets for lemma in synset.lemmas()]
+
+
+def thesaurus_sections(word: str, wordnet) -> dict:
+    """{pos: {"syn": [...], "ant": [...], "rel": [...], "sim": [...]}} with empty sections left out; {} if unknown."""
+    key = wordnet_key(word)
+    name = display_name(key)
+    relations = {}
+    for synset in wordnet.synsets(key):
+        pos = WORDNET_POS.get(synset.pos())
+        if pos is None:
+            continue
+        own = own_lemmas(key, synset, wordnet)
+        sections = relations.setdefault(pos, {section: [] for section in THESAURUS_SECTIONS})
+        sections["syn"] += [display_name(lemma.name()) for lemma in synset.lemmas() if lemma not in own]
+        sections["ant"] += [display_name(antonym.name()) for lemma in own for antonym in lemma.antonyms()]
+        sections["rel"] += _lemma_names(synset.also_sees())
+        sections["sim"] += _lemma_names(synset.similar_tos())
+    compact = {}
+    for pos, sections in relations.items():
+        sections = {section: dedupe([term for term in terms if term != name]) for section, terms in sections.items()}
+        sections = {section: terms for section, terms in sections.items() if terms}
+        if sections:
+            compact[pos] = sections
+    return compact
+
+
+def _source_hash(table) -> str:
+    return table.source[2].hex() if isinstance(table, CefrIndex) else ""
+
+
+class ThesaurusTable:
+    """
+    {word: thesaurus sections} as UTF-8 words sorted by their bytes and a JSON blob of
+    entries, each with its offsets table, like the CEFR index keeps its words.
+    """
+
+    def __init__(self, word_offsets: np.ndarray, word_blob: np.ndarray, offsets: np.ndarray, blob: np.ndarray):
+        self.word_offsets = word_offsets
+        self.word_blob = word_blob
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @staticmethod
+    def _pack(chunks: list) -> tuple:
+        offsets = np.zeros(len(chunks) + 1, dtype=np.uint64)
+        offsets[1:] = np.cumsum([len(chunk) for chunk in chunks])
+        return offsets, np.frombuffer(b"".join(chunks), dtype=np.uint8)
+
+    @classmethod
+    def build(cls, words, wordnet) -> "ThesaurusTable":
+        """Compiles the entries of every word with at least one relation."""
+        entries = {}
+        for word in words:
+            sections = thesaurus_sections(word, wordnet)
+            if sections:
+                entries[word.encode("utf-8")] = json.dumps(
+                    sections, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        keys = sorted(entries)
+        return cls(*cls._pack(keys), *cls._pack([entries[key] for key in keys]))
+
+    def save(self, path: str, source_hash: str) -> None:
+        tmp_path = f"{path}.tmp{os.getpid()}.npz"
+        np.savez_compressed(tmp_path, source=np.array(source_hash), word_offsets=self.word_offsets,
+                            word_blob=self.word_blob, offsets=self.offsets, blob=self.blob)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, source_hash: str):
+        """The table if it was built from the same CSV content, else None."""
+        try:
+            with np.load(path) as data:
+                if str(data["source"]) != source_hash:
+                    return None
+                return cls(data["word_offsets"], data["word_blob"], data["offsets"], data["blob"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _word_at(self, i: int) -> bytes:
+        return self.word_blob[int(self.word_offsets[i]):int(self.word_offsets[i + 1])].tobytes()
+
+    def _find(self, key: bytes) -> int:
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self._word_at(lo) == key:
+            return lo
+        return -1
+
+    def get(self, word: str):
+        """Big Huge Thesaurus-shaped sections for the word, or None if the table has none."""
+        row = self._find(" ".join(word.lower().split()).encode("utf-8"))
+        if row < 0:
+            return None
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        return json.loads(self.blob[start:end].tobytes().decode("utf-8"))
+
+
+def get_thesaurus_table(path: str = THESAURUS_TABLE_PATH):
+    """
+    The table built for the current CSV, read on the first call. None (reported once)
+    if it has not been built yet or the CSV changed since.
+    """
+    global _table, _table_loaded
+    if not _table_loaded:
+        with _table_lock:
+            if not _table_loaded:
+                _table = ThesaurusTable.load(path, _source_hash(get_cefr_frequency_data()))
+                if _table is None:
+                    print(get_message("THESAURUS_TABLE.missing", path=path))
+                _table_loaded = True
+    return _table
+
+
+def build_thesaurus_table(path: str = THESAURUS_TABLE_PATH) -> ThesaurusTable:
+    """Compiles the table for the CEFR vocabulary into `path`. Raises LookupError without WordNet."""
+    table = require_cefr_frequency_data()
+    wordnet = get_wordnet()
+    if wordnet is None:
+        raise LookupError("WordNet")
+    thesaurus = ThesaurusTable.build(table.keys() if isinstance(table, dict) else table.words(), wordnet)
+    thesaurus.save(path, _source_hash(table))
+    return thesaurus
+
+
+def run_build_thesaurus(path: str = THESAURUS_TABLE_PATH) -> ThesaurusTable:
+    start = time.perf_counter()
+    try:
+        thesaurus = build_thesaurus_table(path)
+    except LookupError:
+        print(get_message("THESAURUS_TABLE.wordnet_missing"), file=sys.stderr)
+        sys.exit(1)
+    print(get_message("THESAURUS_TABLE.built", words=len(thesaurus), bytes=os.path.getsize(path),
+                      seconds=time.perf_counter() - start, path=path), file=sys.stderr)
+    return thesaurus
@@ -5,8 +5,10 @@ from io import BytesIO
 from gtts import gTTS
 import requests
 from src.locales.loader import get_message
+from src.utils.tracing import traced, annotate
 import sys
 
+@traced(category="tts")
 def generate_tts_base64(text: str, filename_prefix: str, exit_on_error: bool = True) -> tuple[str | None, str | None]:
     """
     Generates base64-encoded audio from text using Google TTS.
@@ -26,6 +28,7 @@ def generate_tts_base64(text: str, filename_prefix: str, exit_on_error: bool = T
         tts.write_to_fp(buffer)
         buffer.seek(0)
         encoded_data = base64.b64encode(buffer.read()).decode('utf-8')
+        annotate(file=f"tts_{filename_prefix}.mp3", bytes=len(encoded_data))
         sound_ref = f"[sound:tts_{filename_prefix}.mp3]"
         return sound_ref, encoded_data
     except requests.exceptions.ConnectionError:
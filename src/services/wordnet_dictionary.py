@@ -0,0 +1,86 @@
+"""
+Offline dictionary entries from the NLTK WordNet corpus (`scripts/install_nltk_data.py`).
+
+Entries have the DictionaryAPI shape that render_dictionary_html and fetch_word_data
+consume: one entry per word, meanings grouped by part of speech in WordNet's sense
+order, each sense a definition with its first example, the other lemmas of its
+synset as synonyms and the lemma's antonyms.
+"""
+
+import threading
+
+WORDNET_POS = {"n": "noun", "v": "verb", "a": "adjective", "s": "adjective", "r": "adverb"}
+# WordNet lists up to ~60 senses for common verbs; a card shows the most frequent ones
+MAX_DEFINITIONS_PER_POS = 8
+
+_wordnet = None
+_wordnet_loaded = False
+_wordnet_lock = threading.Lock()
+
+
+def get_wordnet():
+    """
+    The loaded NLTK WordNet corpus reader, or None if NLTK or its WordNet data is missing.
+    The load is tried once per process; a failure is remembered, not retried per lookup.
+    """
+    global _wordnet, _wordnet_loaded
+    if not _wordnet_loaded:
+        with _wordnet_lock:
+            if not _wordnet_loaded:
+                try:
+                    from nltk.corpus import wordnet
+
+                    wordnet.ensure_loaded()
+                    _wordnet = wordnet
+                except (ImportError, LookupError):
+                    _wordnet = None
+                _wordnet_loaded = True
+    return _wordnet
+
+
+def wordnet_key(word: str) -> str:
+    """The WordNet spelling of a word or phrase: lowercase, words joined by "_"."""
+    return "_".join(word.lower().split())
+
+
+def display_name(lemma_name: str) -> str:
+    return lemma_name.replace("_", " ")
+
+
+def dedupe(names: list) -> list:
+    seen = set()
+    return [name for name in names if not (name in seen or seen.add(name))]
+
+
+def own_lemmas(key: str, synset, wordnet) -> list:
+    """The lemmas of the synset that are the word itself or its base form ("fled" -> "flee")."""
+    lemmas = synset.lemmas()
+    forms = {key, wordnet.morphy(key, "a" if synset.pos() == "s" else synset.pos())}
+    return [lemma for lemma in lemmas if lemma.name().lower() in forms] or lemmas[:1]
+
+
+def wordnet_entries(word: str, wordnet) -> list:
+    """
+    [{"word", "phonetics", "meanings": [{"partOfSpeech", "definitions", "synonyms", "antonyms"}]}],
+    or [] if WordNet has no sense of the word (inflected forms like "fled" are found by their base form).
+    """
+    key = wordnet_key(word)
+    meanings = {}
+    for synset in wordnet.synsets(key):
+        pos = WORDNET_POS.get(synset.pos())
+        if pos is None:
+            continue
+        meaning = meanings.setdefault(pos, {"partOfSpeech": pos, "definitions": [], "synonyms": [], "antonyms": []})
+        if len(meaning["definitions"]) >= MAX_DEFINITIONS_PER_POS:
+            continue
+        own = own_lemmas(key, synset, wordnet)
+        examples = synset.examples()
+        meaning["definitions"].append({
+            "definition": synset.definition(),
+            "example": examples[0] if examples else "",
+            "synonyms": dedupe([display_name(lemma.name()) for lemma in synset.lemmas() if lemma not in own]),
+            "antonyms": dedupe([display_name(antonym.name()) for lemma in own for antonym in lemma.antonyms()]),
+        })
+    if not meanings:
+        return []
+    return [{"word": word, "phonetics": [], "meanings": list(meanings.values())}]
@@ -1,4 +1,6 @@
-from src.services.cefr_data import CEFR_FREQUENCY_DATA
+from src.locales.loader import get_message
+from src.services.cefr_data import lookup_cefr
+from html import escape
 import os
 
 # Load dictionary CSS at runtime
@@ -28,10 +30,11 @@ def render_dictionary_html(dictionary_data: dict) -> str:
     phonetics = first_entry.get("phonetics", [])
     phonetic_text = next((p.get("text", "") for p in phonetics if p.get("text")), "")
 
-    # Get CEFR and frequency data
-    cefr_freq = CEFR_FREQUENCY_DATA.get(word, {})
+    # Get CEFR and frequency data (from the lemma for inflected forms like "fled" or "children")
+    cefr_freq = lookup_cefr(word) if word else {}
     cefr = cefr_freq.get('cefr', '')
     freq = cefr_freq.get('frequency', '')
+    lemma = cefr_freq.get('lemma')
 
     # Format CEFR and frequency info
     cefr_freq_text = ''
@@ -39,6 +42,9 @@ def render_dictionary_html(dictionary_data: dict) -> str:
         cefr_freq_text = f'{cefr} ({freq})'
     elif freq:
         cefr_freq_text = f'({freq})'
+    if cefr_freq_text and lemma:
+        lemma_title = escape(get_message("DICTIONARY_HTML.cefr_lemma_title"))
+        cefr_freq_text += f' <span class="cefr-lemma" title="{lemma_title}">← {lemma}</span>'
 
     html.append('<div class="word-header">')
     html.append('<div class="word-info">')
@@ -50,9 +50,10 @@ def select_image(images, word):
         except ValueError:
             print(get_message("IMAGE_SELECTION_MESSAGES.image_invalid_input"))
 
-def select_image_for_card(word: str) -> str:
+def select_image_for_card(word: str, images: list = None) -> str:
     """
     Fetches images for the given word, shows a preview page, and returns the selected image URL.
+    Pass `images` to reuse a Pexels search that was already run (e.g. prefetched in the background).
 
     Returns:
     - If the user selects a valid image number, return the corresponding image URL.
@@ -60,8 +61,9 @@ def select_image_for_card(word: str) -> str:
     - If the user presses Escape, return an empty string.
     - If no images are found, also return an empty string.
     """
-    print(get_message("IMAGE_SELECTION_MESSAGES.image_searching"))
-    images = fetch_pexels_images(word)
+    if images is None:
+        print(get_message("IMAGE_SELECTION_MESSAGES.image_searching"))
+        images = fetch_pexels_images(word)
     if not images:
         print(get_message("IMAGE_SELECTION_MESSAGES.image_none_continue"))
         return ""
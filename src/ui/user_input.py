@@ -1,11 +1,51 @@
 from src.linguistics.pos import detect_pos_from_context
 from src.locales.loader import get_message
 
-def get_confirmed_pos(word, sentence) -> str:
+def parse_focus_words(user_input: str, suggestions: list = None) -> list:
+    """
+    Splits the word prompt answer into focus words: "flee, danger" -> ["flee", "danger"].
+    A number picks from the numbered `suggestions`: "1, danger" -> [suggestions[0], "danger"].
+    Words are lowercased and duplicates are dropped, keeping the typed order.
+    """
+    suggestions = suggestions or []
+    words = []
+    for word in user_input.split(","):
+        word = word.strip().lower()
+        if word.isdigit() and 1 <= int(word) <= len(suggestions):
+            word = suggestions[int(word) - 1]
+        if word and word not in words:
+            words.append(word)
+    return words
+
+def format_suggestions(suggestions: list) -> str:
+    """"1) perseverance [B2]  2) fled [B2]" for the word prompt."""
+    return "  ".join(
+        get_message("USER_INTERACTION_INPUT_VALIDATION.word_suggestion_item", index=i, word=s["word"], level=s["cefr"] or "?")
+        for i, s in enumerate(suggestions, 1)
+    )
+
+def confirm_spelling(word: str, suggestions: list) -> str:
+    """
+    Shows the nearest vocabulary words for a word that is not in the vocabulary and
+    returns the user's choice: a picked suggestion, a retyped word, or `word` unchanged.
+    """
+    choices = "  ".join(
+        get_message("USER_INTERACTION_INPUT_VALIDATION.spelling_suggestion_item", index=i, word=s["word"],
+                    frequency=s["frequency"] or "?")
+        for i, s in enumerate(suggestions, 1)
+    )
+    print(get_message("USER_INTERACTION_INPUT_VALIDATION.spelling_unknown", word=word, choices=choices))
+    answer = input(get_message("USER_INTERACTION_INPUT_VALIDATION.spelling_prompt", word=word)).strip().lower()
+    if answer.isdigit() and 1 <= int(answer) <= len(suggestions):
+        return suggestions[int(answer) - 1]["word"]
+    return answer or word
+
+def get_confirmed_pos(word, sentence, tagged=None) -> str:
     """
     Detects the part of speech for a word in context and asks the user to confirm or override it.
+    Pass `tagged` (from tag_sentence) to reuse one tagging pass for several words.
     Returns the confirmed part of speech as a string.
     """
-    detected = detect_pos_from_context(word, sentence) or "noun"
+    detected = detect_pos_from_context(word, sentence, tagged) or "noun"
     user_input = input(get_message("USER_INTERACTION_INPUT_VALIDATION.pos_prompt", detected_pos=detected)).strip().lower()
     return user_input if user_input else detected 
\ No newline at end of file
@@ -1,12 +1,35 @@
+import queue
 import requests
+from contextlib import contextmanager
 from typing import Optional, Any, Dict
+from urllib.parse import urlsplit
 from src.locales.loader import get_message
+from src.utils.tracing import traced, annotate
 
+# Idle Sessions: repeated lookups (daemon/batch modes, prefetch) reuse TCP/TLS connections, while
+# each request has a Session to itself, since requests does not guarantee they are thread-safe.
+# Prefetch runs every request on a new thread, so a per-thread Session would never be reused.
+_idle_sessions = queue.SimpleQueue()
+
+@contextmanager
+def _borrowed_session():
+    """Lends an idle Session (or a new one) to the calling thread and takes it back afterwards."""
+    try:
+        session = _idle_sessions.get_nowait()
+    except queue.Empty:
+        session = requests.Session()
+    try:
+        yield session
+    finally:
+        _idle_sessions.put(session)
+
+@traced(category="http")
 def get_api_data(
     url: str, 
     headers: Optional[Dict[str, str]] = None, 
     params: Optional[Dict[str, Any]] = None, 
-    timeout: int = 10
+    timeout: int = 10,
+    not_found: Any = None
 ) -> Optional[Any]:
     """
     Fetches data from an API via HTTP GET, with error handling.
@@ -16,15 +39,21 @@ def get_api_data(
         headers (dict, optional): Request headers.
         params (dict, optional): Request parameters.
         timeout (int, optional): Request timeout in seconds. Defaults to 10.
+        not_found (optional): Returned for HTTP 404 without reporting an error, when not None.
 
     Returns:
         The JSON response from the API, or None if an error occurs.
     """
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=timeout)
+        annotate(host=urlsplit(url).netloc)
+        with _borrowed_session() as session:
+            response = session.get(url, headers=headers, params=params, timeout=timeout)
+        annotate(status=response.status_code, bytes=len(response.content))
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
+        if response.status_code == 404 and not_found is not None:
+            return not_found
         if response.status_code == 401:
             print(get_message("GENERAL_ERRORS.auth"))
         elif response.status_code == 429:
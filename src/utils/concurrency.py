@@ -0,0 +1,20 @@
+import threading
+from concurrent.futures import Future
+
+def run_in_background(func, *args, **kwargs) -> Future:
+    """
+    Runs func(*args, **kwargs) on a daemon thread and returns a Future for its result.
+    Daemon threads never keep the process alive, so Ctrl+C at a prompt still exits immediately.
+    """
+    future = Future()
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=runner, name=f"bg-{getattr(func, '__name__', 'task')}", daemon=True).start()
+    return future
@@ -1,5 +1,4 @@
 import re
-from nltk.stem import WordNetLemmatizer
 
 def highlight_focus_word(sentence, focus_word, pos='n'):
     """
@@ -11,6 +10,8 @@ def highlight_focus_word(sentence, focus_word, pos='n'):
     Returns:
         str: The sentence with the focus word highlighted.
     """
+    from nltk.stem import WordNetLemmatizer
+
     lemmatizer = WordNetLemmatizer()
     focus_lemma = lemmatizer.lemmatize(focus_word.lower(), pos=pos)
 
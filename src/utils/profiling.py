@@ -0,0 +1,131 @@
+"""
+CPU profiling of a card run (`generate_card.py --profile PREFIX`).
+
+Writes PREFIX.pstats (cProfile, every thread merged; open with `python -m pstats`
+or snakeviz) and PREFIX.collapsed (sampled stacks, one "frame;frame;frame count"
+line per stack, ready for flamegraph.pl or speedscope). cProfile is driven by
+per-thread CPU time, so waiting in input(), on the network or on a lock costs
+nothing; the sampler skips threads blocked in input() or idle on a lock or socket.
+"""
+
+import atexit
+import builtins
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+SAMPLE_INTERVAL = 0.005
+# A thread whose innermost Python frame is in one of these files is blocked, not computing
+_IDLE_FILES = {"threading.py", "queue.py", "selectors.py", "socket.py", "ssl.py"}
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_name}"
+
+
+def collapse_stack(frame, thread_name: str) -> str:
+    """Returns the stack as "thread;outermost;...;innermost" for the collapsed-stack format."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join([thread_name] + labels[::-1])
+
+
+class PipelineProfiler:
+    """Runs cProfile in every thread plus a stack sampler until stop() writes the output files."""
+
+    def __init__(self, prefix: str, interval: float = SAMPLE_INTERVAL):
+        self.prefix = prefix
+        self.interval = interval
+        self.stacks = Counter()
+        self._profilers = []
+        self._profilers_lock = threading.Lock()
+        self._waiting = set()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._original_input = None
+
+    def _new_profiler(self):
+        profiler = cProfile.Profile(time.thread_time)
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+: one profiler already covers every thread
+            return None
+        with self._profilers_lock:
+            self._profilers.append(profiler)
+        return profiler
+
+    def _profile_new_thread(self, frame, event, arg):
+        sys.setprofile(None)
+        self._new_profiler()
+
+    def _input(self, prompt=""):
+        ident = threading.get_ident()
+        self._waiting.add(ident)
+        try:
+            return self._original_input(prompt)
+        finally:
+            self._waiting.discard(ident)
+
+    def _sample(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own or ident in self._waiting:
+                    continue
+                if os.path.basename(frame.f_code.co_filename) in _IDLE_FILES:
+                    continue
+                self.stacks[collapse_stack(frame, names.get(ident, str(ident)))] += 1
+
+    def start(self) -> "PipelineProfiler":
+        self._original_input = builtins.input
+        builtins.input = self._input
+        # The sampler starts before the thread hook so that it is not profiled itself
+        self._sampler = threading.Thread(target=self._sample, name="profile-sampler", daemon=True)
+        self._sampler.start()
+        threading.setprofile(self._profile_new_thread)
+        self._new_profiler()
+        return self
+
+    def stop(self) -> tuple[str, str]:
+        """Stops profiling and writes PREFIX.pstats and PREFIX.collapsed; returns both paths."""
+        with self._profilers_lock:
+            profilers = list(self._profilers)
+        for profiler in profilers:
+            profiler.disable()
+        threading.setprofile(None)
+        builtins.input = self._original_input
+        self._stop.set()
+        self._sampler.join()
+
+        pstats_path = f"{self.prefix}.pstats"
+        collapsed_path = f"{self.prefix}.collapsed"
+        if profilers:
+            stats = pstats.Stats(profilers[0])
+            for profiler in profilers[1:]:
+                try:
+                    stats.add(profiler)
+                except TypeError:
+                    # A thread that made no Python calls after profiling started has no stats
+                    continue
+            stats.dump_stats(pstats_path)
+        with open(collapsed_path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return pstats_path, collapsed_path
+
+
+def enable_profiling(prefix: str) -> PipelineProfiler:
+    """Starts profiling now and writes the output files when the process exits."""
+    profiler = PipelineProfiler(prefix).start()
+    atexit.register(profiler.stop)
+    return profiler
@@ -0,0 +1,110 @@
+"""
+Lightweight span tracing with Chrome trace export (`generate_card.py --trace out.json`).
+
+Spans are recorded only after enable_tracing(); otherwise span() and @traced cost a
+single flag check. The output opens in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_enabled = False
+_events = []
+_events_lock = threading.Lock()
+_local = threading.local()
+_named_threads = set()
+
+
+def enable_tracing(path: str) -> None:
+    """Start recording spans and write the timeline to `path` when the process exits."""
+    global _enabled
+    _enabled = True
+    atexit.register(write_trace, path)
+
+
+def is_tracing() -> bool:
+    return _enabled
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+def _record(event: dict) -> None:
+    thread = threading.current_thread()
+    with _events_lock:
+        if thread.ident not in _named_threads:
+            _named_threads.add(thread.ident)
+            _events.append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": thread.ident,
+                            "args": {"name": thread.name}})
+        _events.append(event)
+
+
+@contextmanager
+def span(name: str, category: str = "step", **args):
+    """
+    Records a complete ("X") event around the block. Extra keyword arguments, and
+    anything passed to annotate() inside the block, end up in the event's args
+    (e.g. bytes transferred, cache status, HTTP status).
+    """
+    if not _enabled:
+        yield
+        return
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(args)
+    start = _now_us()
+    try:
+        yield
+    finally:
+        duration = _now_us() - start
+        stack.pop()
+        _record({"name": name, "cat": category, "ph": "X", "ts": start, "dur": duration,
+                 "pid": os.getpid(), "tid": threading.get_ident(), "args": args})
+
+
+def annotate(**args) -> None:
+    """Attach data to the innermost open span of the current thread (no-op when tracing is off)."""
+    if not _enabled:
+        return
+    stack = getattr(_local, "stack", None)
+    if stack:
+        stack[-1].update(args)
+
+
+def traced(name: str = None, category: str = "service"):
+    """Decorator form of span(); the span is named after the function unless `name` is given."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def write_trace(path: str) -> None:
+    """Write all recorded spans as a Chrome trace JSON file."""
+    with _events_lock:
+        events = list(_events)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def reset_tracing() -> None:
+    """Disable tracing and drop recorded spans (used by tests)."""
+    global _enabled
+    _enabled = False
+    with _events_lock:
+        _events.clear()
+        _named_threads.clear()
@@ -3,7 +3,7 @@ import os
 import sys
 
 from src.locales.loader import get_message
-from src.config.settings import ANKI_CONNECT_URL, CONFIG_FILE, MODEL_NAME
+from src.config.settings import ANKI_CONNECT_URL, CONFIG_FILE, MODEL_NAME, THESAURUS_BACKEND_NAMES
 
 
 def validate_config(config: Dict[str, Any]) -> None:
@@ -28,9 +28,9 @@ def validate_config(config: Dict[str, Any]) -> None:
         if not (isinstance(pexels_api_key, str) and len(pexels_api_key) == 56 and ' ' not in pexels_api_key):
             raise ValueError(get_message("INITIALIZATION_CONFIGURATION.pexels_api_key_invalid"))
 
-        # Big Huge API key validation
+        # Big Huge API key validation (only needed when Big Huge is a thesaurus backend)
         big_huge_api_key = config.get("big_huge_api_key")
-        if not (isinstance(big_huge_api_key, str) and len(big_huge_api_key) == 32 and ' ' not in big_huge_api_key):
+        if "bighuge" in THESAURUS_BACKEND_NAMES and not (isinstance(big_huge_api_key, str) and len(big_huge_api_key) == 32 and ' ' not in big_huge_api_key):
             raise ValueError(get_message("INITIALIZATION_CONFIGURATION.big_huge_api_key_invalid"))
 
         # AnkiConnect URL validation
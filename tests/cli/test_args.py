@@ -48,4 +48,11 @@ class TestCLIArgs:
             
             result = handle_cli_arguments()
             
-            assert result is True  # Should return True to continue 
\ No newline at end of file
+            assert result is True  # Should return True to continue 
+    
+    @patch('sys.argv', ['generate_card.py', '--serve', '--port', '9000'])
+    def test_parse_arguments_serve(self):
+        """Test parsing arguments for server mode"""
+        args = parse_arguments()
+        assert args.serve
+        assert args.port == 9000
@@ -0,0 +1,71 @@
+"""Tests for the batch card mode."""
+
+import threading
+import pytest
+from unittest.mock import patch
+from src.services.batch_service import read_batch_rows, parse_batch_row, process_batch_rows
+from src.services.card_service import CardGenerationError
+
+def test_read_batch_rows_tsv(tmp_path):
+    path = tmp_path / "words.tsv"
+    path.write_text(
+        "sentence\tword\tpos\ttranslation\timage\n"
+        "He fled from danger.\tfled\tverb\tвтік\t2\n"
+        "\n"
+        "# skipped comment\n"
+        "I read a book.\tbook\n",
+        encoding="utf-8"
+    )
+    rows = list(read_batch_rows(str(path)))
+    assert rows == [
+        (2, {"sentence": "He fled from danger.", "word": "fled", "pos": "verb", "translation": "втік", "image": "2"}),
+        (5, {"sentence": "I read a book.", "word": "book", "pos": "", "translation": "", "image": ""}),
+    ]
+
+def test_read_batch_rows_csv(tmp_path):
+    path = tmp_path / "words.csv"
+    path.write_text('"Well, it runs.",runs\n', encoding="utf-8")
+    assert list(read_batch_rows(str(path))) == [
+        (1, {"sentence": "Well, it runs.", "word": "runs", "pos": "", "translation": "", "image": ""})
+    ]
+
+def test_parse_batch_row():
+    row = {"sentence": "I read a book.", "word": "book", "pos": "", "translation": "книга", "image": "0"}
+    assert parse_batch_row(row) == {"sentence": "I read a book.", "word": "book", "pos": None,
+                                    "translation": "книга", "image_choice": 0}
+    with pytest.raises(ValueError):
+        parse_batch_row({**row, "image": "x"})
+    with pytest.raises(ValueError):
+        parse_batch_row({**row, "word": ""})
+
+@patch('src.services.batch_service.create_card')
+def test_process_batch_rows_reports_in_order_and_bounds_concurrency(mock_create, capsys):
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def fake_create(config, deck_name, sentence, word, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            if word == "bad":
+                raise CardGenerationError("no entry")
+            return len(word)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    mock_create.side_effect = fake_create
+    pulled = []
+
+    def rows():
+        for i, word in enumerate(["one", "bad", "three", "four", "five"], 1):
+            pulled.append(i)
+            yield i, {"sentence": f"Sentence {word}.", "word": word, "pos": "", "translation": "", "image": ""}
+
+    summary = process_batch_rows(rows(), {"model_name": "m"}, "Deck", workers=2)
+
+    assert summary == {"added": 4, "failed": 1}
+    assert peak[0] <= 2
+    out = capsys.readouterr().out
+    assert out.index("Row 1") < out.index("Row 2") < out.index("Row 5")
+    assert "no entry" in out
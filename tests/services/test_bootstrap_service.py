@@ -0,0 +1,64 @@
+"""Tests for the startup bootstrap."""
+
+import threading
+import pytest
+from unittest.mock import patch
+from src.services.bootstrap_service import StartupBootstrap
+from src.services.cefr_data import CefrDataError
+from src.utils.concurrency import run_in_background
+
+def test_run_in_background_returns_result_and_exceptions():
+    assert run_in_background(lambda a, b: a + b, 2, 3).result(timeout=5) == 5
+    with pytest.raises(ValueError):
+        run_in_background(lambda: (_ for _ in ()).throw(ValueError("boom"))).result(timeout=5)
+
+@patch('src.services.bootstrap_service.get_cefr_lemma_map', return_value={})
+@patch('src.services.bootstrap_service.warm_up_nltk')
+@patch('src.services.bootstrap_service.get_cefr_frequency_data', return_value={"run": {}})
+@patch('src.services.bootstrap_service.is_anki_connect_available', return_value=True)
+def test_start_runs_tasks_in_background(mock_probe, mock_cefr, mock_nltk, mock_lemmas):
+    """All startup tasks run off the main thread and can be joined by name."""
+    threads = []
+    mock_nltk.side_effect = lambda: threads.append(threading.current_thread())
+
+    bootstrap = StartupBootstrap().start()
+
+    assert bootstrap.wait("anki") is True
+    assert bootstrap.wait("cefr") == {"run": {}}
+    bootstrap.wait("nltk")
+    assert threads and threads[0] is not threading.main_thread()
+    assert bootstrap.wait("lemmas") == {}
+    assert bootstrap.wait("deck") is None  # never started
+
+@patch('src.services.bootstrap_service.get_cefr_lemma_map', return_value={})
+@patch('src.services.bootstrap_service.warm_up_nltk')
+@patch('src.services.bootstrap_service.get_cefr_frequency_data')
+@patch('src.services.bootstrap_service.is_anki_connect_available', return_value=False)
+def test_ensure_anki_connect_exits_when_probe_failed(mock_probe, mock_cefr, mock_nltk, mock_lemmas):
+    bootstrap = StartupBootstrap().start()
+    with pytest.raises(SystemExit):
+        bootstrap.ensure_anki_connect()
+
+@patch('src.services.bootstrap_service.get_cefr_lemma_map', return_value={})
+@patch('src.services.bootstrap_service.warm_up_nltk')
+@patch('src.services.bootstrap_service.get_cefr_frequency_data', side_effect=CefrDataError("no rows"))
+@patch('src.services.bootstrap_service.is_anki_connect_available', return_value=True)
+def test_ensure_cefr_data_exits_with_reason(mock_probe, mock_cefr, mock_nltk, mock_lemmas, capsys):
+    bootstrap = StartupBootstrap().start()
+    with pytest.raises(SystemExit):
+        bootstrap.ensure_cefr_data()
+    assert "no rows" in capsys.readouterr().out
+
+@patch('src.services.bootstrap_service.create_deck_if_not_exists', return_value=True)
+def test_create_deck_in_background(mock_create):
+    bootstrap = StartupBootstrap()
+    bootstrap.create_deck("My Deck")
+    assert bootstrap.wait("deck") is True
+    mock_create.assert_called_once_with("My Deck")
+
+@patch('src.services.bootstrap_service.get_deck_words', return_value={"flee"})
+def test_load_deck_words_in_background(mock_words):
+    bootstrap = StartupBootstrap()
+    bootstrap.load_deck_words("My Deck")
+    assert bootstrap.wait("deck_words") == {"flee"}
+    mock_words.assert_called_once_with("My Deck")
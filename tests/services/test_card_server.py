@@ -0,0 +1,88 @@
+"""Tests for the loopback card server."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from unittest.mock import patch
+from src.services.card_server import CardServer, parse_card_request
+from src.services.card_service import CardGenerationError
+
+def test_parse_card_request_defaults():
+    parsed = parse_card_request({"sentence": "I run daily.", "word": "run"})
+    assert parsed == {"sentence": "I run daily.", "word": "run", "pos": None,
+                      "translation": "", "image_choice": 1, "deck_name": None}
+
+@pytest.mark.parametrize("payload", [
+    None,
+    [],
+    {"word": "run"},
+    {"sentence": "I run.", "word": ""},
+    {"sentence": "I run.", "word": "run", "image": -1},
+    {"sentence": "I run.", "word": "run", "image": "2"},
+    {"sentence": "I run.", "word": "run", "pos": 3},
+])
+def test_parse_card_request_rejects_malformed(payload):
+    with pytest.raises(ValueError):
+        parse_card_request(payload)
+
+@pytest.fixture
+def server():
+    with patch('src.services.card_server.create_deck_if_not_exists', return_value=True) as mock_deck:
+        srv = CardServer(("127.0.0.1", 0), {"model_name": "m"}, "Default")
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        srv.mock_deck = mock_deck
+        yield srv
+        srv.shutdown()
+        srv.server_close()
+
+def post(server, body):
+    url = f"http://127.0.0.1:{server.server_address[1]}/cards"
+    request = urllib.request.Request(url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+@patch('src.services.card_server.create_card', return_value=42)
+def test_post_card_returns_note_id(mock_create, server):
+    status, body = post(server, {"sentence": "I run daily.", "word": "run", "deck": "Verbs"})
+    assert status == 201
+    assert body == {"note_id": 42, "deck": "Verbs"}
+    assert mock_create.call_args.kwargs["deck_name"] == "Verbs"
+
+    post(server, {"sentence": "I ran.", "word": "ran", "deck": "Verbs"})
+    server.mock_deck.assert_called_once_with("Verbs")
+
+@patch('src.services.card_server.create_card', side_effect=CardGenerationError("no entry"))
+def test_post_card_failure_is_reported(mock_create, server):
+    status, body = post(server, {"sentence": "I xqz.", "word": "xqz"})
+    assert status == 422
+    assert body == {"error": "no entry"}
+
+def test_post_malformed_request(server):
+    status, body = post(server, {"word": "run"})
+    assert status == 400
+    assert "sentence" in body["error"]
+
+@pytest.mark.parametrize("error", [KeyError("fields"), SystemExit(1)])
+def test_unexpected_errors_return_json_500(error, server):
+    with patch('src.services.card_server.create_card', side_effect=error), \
+            patch('src.services.card_server.print'):
+        status, body = post(server, {"sentence": "I run daily.", "word": "run"})
+    assert status == 500
+    assert body["error"]
+    with patch('src.services.card_server.create_card', return_value=7):
+        assert post(server, {"sentence": "I run daily.", "word": "run"})[0] == 201
+
+@patch('src.services.card_server.create_card', return_value=42)
+def test_failed_deck_creation_is_retried(mock_create, server):
+    server.mock_deck.return_value = False
+    post(server, {"sentence": "I run daily.", "word": "run", "deck": "Verbs"})
+    server.mock_deck.return_value = True
+    post(server, {"sentence": "I ran.", "word": "ran", "deck": "Verbs"})
+    post(server, {"sentence": "I ran.", "word": "ran", "deck": "Verbs"})
+    assert server.mock_deck.call_count == 2
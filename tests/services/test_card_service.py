@@ -0,0 +1,70 @@
+"""Tests for the non-interactive card pipeline."""
+
+import pytest
+from concurrent.futures import Future
+from unittest.mock import patch
+from src.services.card_service import create_card, pick_image, CardGenerationError
+
+IMAGES = [{"src": {"medium": "url1"}}, {"src": {"medium": "url2"}}]
+
+def done(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+def make_prefetch(dictionary=None, audio=("[sound:tts_run.mp3]", "data")):
+    return {
+        "word_data": {"dictionary": done(dictionary), "thesaurus": done({"verb": {"syn": ["sprint"]}})},
+        "images": done(IMAGES),
+        "word_audio": done(audio),
+        "sentence_audio": done(audio),
+    }
+
+DICTIONARY = [{"word": "run", "meanings": [{"partOfSpeech": "verb", "definitions": [{"definition": "move fast"}]}]}]
+
+@pytest.mark.parametrize("choice, expected", [(1, "url1"), (2, "url2"), (0, ""), (9, "url1")])
+def test_pick_image(choice, expected):
+    assert pick_image(IMAGES, choice) == expected
+
+def test_pick_image_no_images():
+    assert pick_image([], 1) == ""
+
+@patch('src.services.card_service.add_note', return_value={"result": 1234, "error": None})
+@patch('src.services.card_service.send_media_file', return_value=True)
+@patch('src.services.card_service.highlight_focus_word', side_effect=lambda s, w, pos: s)
+@patch('src.services.card_service.format_dictionary_entry', return_value="<div></div>")
+def test_create_card_returns_note_id(mock_format, mock_highlight, mock_send, mock_add):
+    note_id = create_card("I run daily.", "Run", {"model_name": "VocabCard_English_UA"}, "Deck",
+                          pos="verb", translation=" бігти ", image_choice=2, prefetch=make_prefetch(DICTIONARY))
+
+    assert note_id == 1234
+    note = mock_add.call_args[0][0]
+    assert note["deckName"] == "Deck"
+    assert note["fields"]["Word"] == "run"
+    assert note["fields"]["Definition"] == "move fast"
+    assert note["fields"]["Synonyms"] == "sprint"
+    assert note["fields"]["Translation_UA"] == "бігти"
+    assert "url2" in note["fields"]["Image"]
+    assert mock_send.call_count == 2
+
+def test_create_card_missing_dictionary_entry_raises():
+    with pytest.raises(CardGenerationError):
+        create_card("I run daily.", "run", {"model_name": "m"}, "Deck", pos="verb", prefetch=make_prefetch(None))
+
+def test_create_card_no_entry_raises():
+    prefetch = make_prefetch({"no_entry": True, "word": "runn"})
+    with pytest.raises(CardGenerationError, match="no entry"):
+        create_card("I runn daily.", "runn", {"model_name": "m"}, "Deck", pos="verb", prefetch=prefetch)
+
+@patch('src.services.card_service.start_card_prefetch')
+@patch('src.services.card_service.is_known_no_entry', return_value=True)
+def test_create_card_skips_known_no_entry_without_requests(mock_known, mock_prefetch):
+    with pytest.raises(CardGenerationError):
+        create_card("I runn daily.", "runn", {"model_name": "m"}, "Deck", pos="verb")
+    mock_prefetch.assert_not_called()
+
+@patch('src.services.card_service.highlight_focus_word', side_effect=lambda s, w, pos: s)
+def test_create_card_tts_failure_raises(mock_highlight):
+    with pytest.raises(CardGenerationError):
+        create_card("I run daily.", "run", {"model_name": "m"}, "Deck", pos="verb",
+                    prefetch=make_prefetch(DICTIONARY, audio=(None, None)))
@@ -0,0 +1,59 @@
+import io
+import numpy as np
+import pytest
+
+from src.services import cefr_annotation
+from src.services.cefr_annotation import CefrVocabulary, annotate_text, tokenize, run_annotate
+
+TABLE = {
+    "the": {"cefr": "A1", "frequency": "9"},
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "fled": {"cefr": "?", "frequency": "6"},
+    "quietly": {"cefr": "?", "frequency": "4"},
+    "zebra": {"cefr": "B1", "frequency": ""},
+}
+
+@pytest.fixture
+def vocabulary():
+    return CefrVocabulary(TABLE, {"fled": "flee"})
+
+def test_tokenize_lowercases_and_keeps_contractions():
+    assert tokenize("The zebra didn't flee, 42 times!").tolist() == ["the", "zebra", "didn't", "flee", "times"]
+
+def test_annotate_text_per_token(vocabulary):
+    annotation = annotate_text("The zebra fled quietly; the END.", vocabulary)
+    assert list(annotation.rows()) == [
+        ("the", "A1", "9"),
+        ("zebra", "B1", ""),
+        ("fled", "B2", "5"),
+        ("quietly", "?", "4"),
+        ("the", "A1", "9"),
+        ("end", "", ""),
+    ]
+    assert annotation.from_lemma.tolist() == [False, False, True, False, False, False]
+    assert annotation.level_counts() == {"": 1, "?": 1, "A1": 2, "B1": 1, "B2": 1}
+
+def test_annotate_text_matches_per_word_lookup_on_large_input(vocabulary):
+    words = list(TABLE) + ["unknown", "zzz", "a"]
+    rng = np.random.default_rng(0)
+    text = " ".join(rng.choice(words, size=20_000))
+    annotation = annotate_text(text, vocabulary)
+    expected_cefr = {"fled": "B2", **{w: e["cefr"] for w, e in TABLE.items() if w != "fled"}}
+    assert annotation.cefr().tolist() == [expected_cefr.get(t, "") for t in annotation.tokens.tolist()]
+
+def test_annotate_empty_text(vocabulary):
+    annotation = annotate_text("123 ... !!!", vocabulary)
+    assert len(annotation) == 0
+    assert annotation.level_counts() == {}
+
+def test_run_annotate_writes_tsv(tmp_path, vocabulary, monkeypatch, capsys):
+    monkeypatch.setattr(cefr_annotation, "_vocabulary", vocabulary)
+    monkeypatch.setattr(cefr_annotation, "require_cefr_frequency_data", lambda: TABLE)
+    path = tmp_path / "chapter.txt"
+    path.write_text("The zebra fled.", encoding="utf-8")
+    out = io.StringIO()
+
+    run_annotate(str(path), out)
+
+    assert out.getvalue().splitlines() == ["token\tcefr\tfrequency", "the\tA1\t9", "zebra\tB1\t", "fled\tB2\t5"]
+    assert "3 tokens" in capsys.readouterr().err
@@ -0,0 +1,94 @@
+import os
+import pytest
+from unittest.mock import patch
+
+from src.services.cefr_index import CefrIndex, write_cefr_index
+from src.services.cefr_data import load_cefr_index, load_cefr_frequency_data, CefrDataError
+
+ENTRIES = {
+    "run": {"cefr": "A1", "frequency": "1"},
+    "abandon": {"cefr": "B2", "frequency": "4"},
+    "acquaintance": {"cefr": "?", "frequency": "6"},
+    "café": {"cefr": "A2", "frequency": ""},
+    "zeal": {"cefr": "", "frequency": "9"},
+}
+
+@pytest.fixture
+def index(tmp_path):
+    path = str(tmp_path / "cefr.idx")
+    write_cefr_index(ENTRIES, path)
+    idx = CefrIndex(path)
+    yield idx
+    idx.close()
+
+def test_lookup_matches_source_entries(index):
+    for word, entry in ENTRIES.items():
+        assert index.get(word) == entry
+    assert len(index) == len(ENTRIES)
+
+def test_missing_words_return_default(index):
+    assert index.get("ru") is None
+    assert index.get("runs", {}) == {}
+    assert index.get("") is None
+    assert "zzz" not in index
+    with pytest.raises(KeyError):
+        index["aardvark"]
+
+def test_words_are_sorted(index):
+    assert list(index.words()) == sorted(ENTRIES, key=lambda w: w.encode("utf-8"))
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "not_an_index.idx"
+    path.write_bytes(b"Word,CEFR,Frequency\n")
+    with pytest.raises(ValueError):
+        CefrIndex(str(path))
+
+def test_load_cefr_index_rebuilds_when_csv_content_changes(tmp_path):
+    csv_path = tmp_path / "cefr.csv"
+    index_path = str(tmp_path / "cefr.idx")
+    csv_path.write_text("Word,CEFR,Frequency\nrun,A1,1\n", encoding="utf-8")
+    assert load_cefr_index(str(csv_path), index_path).get("run") == {"cefr": "A1", "frequency": "1"}
+
+    csv_path.write_text("Word,CEFR,Frequency\nrun,A2,2\n", encoding="utf-8")
+    stamp = os.path.getmtime(index_path) + 10
+    os.utime(csv_path, (stamp, stamp))
+    assert load_cefr_index(str(csv_path), index_path).get("run") == {"cefr": "A2", "frequency": "2"}
+
+def test_load_cefr_index_keeps_index_when_csv_is_only_touched(tmp_path):
+    csv_path = tmp_path / "cefr.csv"
+    index_path = tmp_path / "cefr.idx"
+    csv_path.write_text("Word,CEFR,Frequency\nrun,A1,1\n", encoding="utf-8")
+    load_cefr_index(str(csv_path), str(index_path)).close()
+    built_inode = index_path.stat().st_ino
+
+    stamp = os.path.getmtime(csv_path) + 10
+    os.utime(csv_path, (stamp, stamp))
+    index = load_cefr_index(str(csv_path), str(index_path))
+    assert index.get("run")["cefr"] == "A1"
+    assert index_path.stat().st_ino == built_inode
+    index.close()
+
+    # The new size and mtime were stored, so the next open does not hash the CSV again
+    with patch("src.services.cefr_data._source_stamp", side_effect=AssertionError("CSV hashed again")):
+        index = load_cefr_index(str(csv_path), str(index_path))
+    assert index.source[:2] == (csv_path.stat().st_size, csv_path.stat().st_mtime_ns)
+    index.close()
+
+def test_load_cefr_index_replaces_corrupt_index(tmp_path):
+    csv_path = tmp_path / "cefr.csv"
+    index_path = tmp_path / "cefr.idx"
+    csv_path.write_text("Word,CEFR,Frequency\nrun,A1,1\n", encoding="utf-8")
+    load_cefr_index(str(csv_path), str(index_path)).close()
+    index_path.write_bytes(index_path.read_bytes()[:-2])
+
+    assert load_cefr_index(str(csv_path), str(index_path)).get("run")["cefr"] == "A1"
+
+@pytest.mark.parametrize("content", [None, "", "Palavra;Nivel\nrun;A1\n", "Word,CEFR,Frequency\n"])
+def test_unusable_csv_raises_instead_of_returning_empty_table(tmp_path, content):
+    csv_path = tmp_path / "cefr.csv"
+    if content is not None:
+        csv_path.write_text(content, encoding="utf-8")
+    with pytest.raises(CefrDataError):
+        load_cefr_frequency_data(str(csv_path))
+    with pytest.raises(CefrDataError):
+        load_cefr_index(str(csv_path), str(tmp_path / "cefr.idx"))
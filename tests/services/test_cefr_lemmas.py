@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import patch
+
+from src.services import cefr_data
+from src.locales.loader import get_message
+from src.services.cefr_lemmas import wordnet_lemmatizer, irregular_lemma_map, pick_lemma, build_lemma_map, load_lemma_map
+from src.ui.html_templates import render_dictionary_html
+
+TABLE = {
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "fled": {"cefr": "?", "frequency": "6"},
+    "child": {"cefr": "A1", "frequency": "2"},
+    "children": {"cefr": "?", "frequency": "3"},
+    "runner": {"cefr": "?", "frequency": "7"},
+    "run": {"cefr": "A1", "frequency": "1"},
+}
+
+def fake_lemmatize(word, pos="n"):
+    return {("children", "n"): "child", ("running", "v"): "run"}.get((word, pos), word)
+
+@pytest.fixture
+def cefr_table(monkeypatch):
+    monkeypatch.setattr(cefr_data, "_cefr_frequency_data", TABLE)
+    monkeypatch.setattr(cefr_data, "_cefr_lemma_map", build_lemma_map(TABLE, fake_lemmatize))
+    monkeypatch.setattr(cefr_data, "wordnet_lemmatizer", lambda: fake_lemmatize)
+
+def test_irregular_forms_map_to_base_form():
+    lemmas = irregular_lemma_map()
+    assert lemmas["fled"] == "flee"
+    assert lemmas["was"] == lemmas["were"] == "be"
+    assert "flee" not in lemmas
+
+def test_missing_wordnet_lemmatizer_is_looked_up_once():
+    wordnet_lemmatizer.cache_clear()
+    try:
+        with patch.dict("sys.modules", {"nltk.stem": None}):
+            assert wordnet_lemmatizer() is None
+            assert wordnet_lemmatizer() is None
+        assert wordnet_lemmatizer.cache_info().misses == 1
+    finally:
+        wordnet_lemmatizer.cache_clear()
+
+def test_pick_lemma_prefers_candidate_with_level():
+    assert pick_lemma("fled", TABLE, irregular_lemma_map()) == "flee"
+    assert pick_lemma("children", TABLE, {}, fake_lemmatize) == "child"
+    assert pick_lemma("runner", TABLE, {}, fake_lemmatize) is None
+
+def test_build_lemma_map_covers_only_forms_without_level():
+    assert build_lemma_map(TABLE, fake_lemmatize) == {"fled": "flee", "children": "child"}
+    assert build_lemma_map(TABLE) == {"fled": "flee"}
+
+def test_load_lemma_map_caches_per_source(tmp_path, monkeypatch):
+    path = str(tmp_path / "cefr.lemmas")
+    monkeypatch.setattr("src.services.cefr_lemmas.wordnet_lemmatizer", lambda: fake_lemmatize)
+    assert load_lemma_map(TABLE, "abc", path) == {"fled": "flee", "children": "child"}
+
+    monkeypatch.setattr("src.services.cefr_lemmas.build_lemma_map", lambda *a: pytest.fail("cache not used"))
+    assert load_lemma_map(TABLE, "abc", path) == {"fled": "flee", "children": "child"}
+
+def test_lookup_cefr_falls_back_to_lemma(cefr_table):
+    assert cefr_data.lookup_cefr("Fled") == {"cefr": "B2", "frequency": "5", "lemma": "flee"}
+    assert cefr_data.lookup_cefr("run") == {"cefr": "A1", "frequency": "1", "lemma": None}
+    assert cefr_data.lookup_cefr("running") == {"cefr": "A1", "frequency": "1", "lemma": "run"}
+    assert cefr_data.lookup_cefr("runner") == {"cefr": "?", "frequency": "7", "lemma": None}
+    assert cefr_data.lookup_cefr("qwxz") == {"cefr": "", "frequency": "", "lemma": None}
+
+def test_card_marks_level_taken_from_lemma(cefr_table):
+    html = render_dictionary_html([{"word": "children", "meanings": []}])
+    assert 'A1 (2) <span class="cefr-lemma"' in html
+    assert "← child" in html
+    assert f'title="{get_message("DICTIONARY_HTML.cefr_lemma_title")}"' in html
+    assert 'class="cefr-lemma"' not in render_dictionary_html([{"word": "child", "meanings": []}])
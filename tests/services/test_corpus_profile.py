@@ -0,0 +1,120 @@
+import gzip
+import io
+from collections import Counter
+import pytest
+
+from src.services import cefr_data, corpus_profile
+from src.services.cefr_annotation import CefrVocabulary
+from src.services.corpus_profile import (
+    CorpusProfile, build_study_list, count_tokens, iter_chunks, profile_corpora, write_study_list, run_study_list
+)
+
+TABLE = {
+    "the": {"cefr": "A1", "frequency": "9"},
+    "soldier": {"cefr": "A2", "frequency": "7"},
+    "soldiers": {"cefr": "?", "frequency": "6"},
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "fled": {"cefr": "?", "frequency": "6"},
+    "village": {"cefr": "A2", "frequency": "6"},
+    "quietly": {"cefr": "?", "frequency": "4"},
+}
+LEMMAS = {"fled": "flee", "soldiers": "soldier"}
+TEXT = ("The soldiers fled the burning village quietly at night.\n"
+        "Soldiers rarely flee, the old soldier said.\n"
+        "He fled.\n")
+
+@pytest.fixture(autouse=True)
+def cefr_table(monkeypatch):
+    vocabulary = CefrVocabulary(TABLE, LEMMAS)
+    monkeypatch.setattr(cefr_data, "_cefr_frequency_data", TABLE)
+    monkeypatch.setattr(corpus_profile, "get_cefr_vocabulary", lambda: vocabulary)
+    monkeypatch.setattr(corpus_profile, "get_cefr_lemma_map", lambda: LEMMAS)
+
+def test_add_text_counts_vocabulary_words_per_lemma():
+    profile = CorpusProfile()
+    profile.add_text(TEXT)
+    assert profile.counts == {"the": 3, "soldier": 3, "flee": 3, "village": 1, "quietly": 1}
+    assert profile.tokens == 18
+    # "He fled." is too short to be an example sentence
+    assert profile.examples["flee"] == "The soldiers fled the burning village quietly at night."
+
+def test_profiles_merge_like_one_pass():
+    whole = CorpusProfile()
+    whole.add_text(TEXT * 2)
+    merged = CorpusProfile()
+    for _ in range(2):
+        part = CorpusProfile()
+        part.add_text(TEXT)
+        merged.merge(part)
+    assert merged.counts == whole.counts
+    assert merged.tokens == whole.tokens
+
+def test_iter_chunks_streams_gzip_and_drops_subtitle_cues(tmp_path):
+    path = tmp_path / "movie.srt.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("1\n00:00:01,000 --> 00:00:02,500\nThe soldiers fled.\n\n2\n00:00:03,000 --> 00:00:04,000\nQuietly.\n")
+    chunks = list(iter_chunks(str(path), chunk_chars=10))
+    assert "".join(chunks) == "The soldiers fled.\n\nQuietly.\n"
+    assert len(chunks) == 2
+
+def test_digit_lines_are_kept_outside_subtitle_files(tmp_path):
+    path = tmp_path / "book.txt"
+    path.write_text("Chapter\n12\n1984\nThe soldiers fled.\n", encoding="utf-8")
+    assert "".join(iter_chunks(str(path))) == "Chapter\n12\n1984\nThe soldiers fled.\n"
+
+def test_profile_corpora_merges_files_and_saved_profiles(tmp_path):
+    text_path = tmp_path / "book.txt"
+    text_path.write_text(TEXT, encoding="utf-8")
+    saved = CorpusProfile(files=1)
+    saved.add_text(TEXT)
+    saved.save(str(tmp_path / "old.json"))
+    profile = profile_corpora([str(text_path), str(tmp_path / "old.json")])
+    assert profile.files == 2
+    assert profile.counts["soldier"] == 6
+
+def test_study_list_groups_by_level_and_skips_known_words():
+    profile = CorpusProfile()
+    profile.add_text(TEXT * 2)
+    study_list = build_study_list(profile, known_words={"soldiers"}, lemma_map=LEMMAS)
+    assert [level for level in study_list] == ["A2", "B2", "?"]
+    assert [lemma for lemma, _, _ in study_list["A2"]] == ["village"]
+    assert study_list["B2"][0][:2] == ("flee", 6)
+
+    out = io.StringIO()
+    write_study_list(study_list, out)
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "# A2"
+    assert lines[1] == "The soldiers fled the burning village quietly at night.\tvillage"
+
+def test_run_study_list_writes_batch_file(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(corpus_profile, "get_deck_words", lambda deck: {"village"})
+    path = tmp_path / "book.txt"
+    path.write_text(TEXT * 2, encoding="utf-8")
+    out = io.StringIO()
+    run_study_list([str(path)], "My Deck", save_path=str(tmp_path / "book.json"), out=out)
+    assert "\tvillage" not in out.getvalue()
+    assert "\tflee\n" in out.getvalue()
+    assert CorpusProfile.load(str(tmp_path / "book.json")).counts["flee"] == 6
+    assert "1 already in the deck" in capsys.readouterr().err
+
+def test_count_tokens_matches_findall_over_the_whole_text():
+    text = TEXT + "Don't stop — it's 3am, isn't it?\n"
+    expected = Counter(corpus_profile.TOKEN_PATTERN.findall(text.lower()))
+    assert count_tokens(text) == expected
+
+def test_profile_without_examples_counts_the_same_in_worker_processes(tmp_path):
+    path = tmp_path / "book.txt"
+    path.write_text(TEXT * 3, encoding="utf-8")
+    with_examples = profile_corpora([str(path)], chunk_chars=40)
+    in_workers = profile_corpora([str(path)], workers=2, examples=False, chunk_chars=40)
+    assert in_workers.counts == with_examples.counts
+    assert in_workers.tokens == with_examples.tokens
+    assert in_workers.examples == {}
+
+def test_profile_with_examples_counts_the_same_in_worker_processes(tmp_path):
+    path = tmp_path / "book.txt"
+    path.write_text(TEXT * 3, encoding="utf-8")
+    in_workers = profile_corpora([str(path)], workers=2, chunk_chars=40)
+    single = profile_corpora([str(path)], chunk_chars=40)
+    assert in_workers.counts == single.counts
+    assert in_workers.examples == single.examples
@@ -0,0 +1,87 @@
+import io
+import pytest
+
+from src.services import cefr_data, corpus_profile, coverage_service
+from src.services.cefr_annotation import CefrVocabulary
+from src.services.corpus_profile import CorpusProfile
+from src.services.coverage_service import (
+    analyze_coverage, reference_from_profile, reference_from_table, run_coverage
+)
+
+TABLE = {
+    "the": {"cefr": "A1", "frequency": "9"},
+    "dog": {"cefr": "A1", "frequency": "8"},
+    "cat": {"cefr": "A1", "frequency": "8"},
+    "garden": {"cefr": "A1", "frequency": "7"},
+    "chase": {"cefr": "B1", "frequency": "6"},
+    "chased": {"cefr": "?", "frequency": "6"},
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "fled": {"cefr": "?", "frequency": "6"},
+}
+LEMMAS = {"fled": "flee", "chased": "chase"}
+# 22 tokens: the x7, dog x4, cat x3, chase x2, flee x2, Rex x2, and x1, garden x1
+TEXT = ("The dog chased the cat. The cat fled the dog. "
+        "The dog fled. Rex chased the cat, Rex and the dog garden.")
+
+@pytest.fixture(autouse=True)
+def cefr_table(monkeypatch):
+    vocabulary = CefrVocabulary(TABLE, LEMMAS)
+    monkeypatch.setattr(cefr_data, "_cefr_frequency_data", TABLE)
+    for module in (corpus_profile, coverage_service):
+        monkeypatch.setattr(module, "get_cefr_vocabulary", lambda: vocabulary)
+        monkeypatch.setattr(module, "get_cefr_lemma_map", lambda: LEMMAS)
+
+def profile_reference():
+    profile = CorpusProfile()
+    profile.add_text(TEXT, examples=False)
+    return reference_from_profile(profile)
+
+def test_reference_from_profile_is_sorted_by_count():
+    words, weights, total = profile_reference()
+    assert words.tolist()[:3] == ["the", "dog", "cat"]
+    assert weights.tolist()[:3] == [7, 4, 3]
+    assert total == 22
+
+def test_reference_from_table_adds_zipf_weights_of_forms_to_lemmas():
+    words, weights, total = reference_from_table(["the", "dog", "fled", "flee"], LEMMAS)
+    assert words.tolist() == ["the", "flee", "dog"]
+    assert weights.tolist() == pytest.approx([1, 1 / 3 + 1 / 4, 1 / 2])
+    assert total == pytest.approx(1 + 1 / 2 + 1 / 3 + 1 / 4)
+
+def test_coverage_counts_deck_forms_by_lemma_and_stopwords_separately():
+    words, weights, total = profile_reference()
+    report = analyze_coverage(words, weights, total, {"dog", "fled"})
+    assert report["known"] == 2
+    assert report["deck"] == pytest.approx(6 / 22)
+    assert report["with_stopwords"] == pytest.approx(13 / 22)
+    assert [(word, level) for word, level, _ in report["gains"]] == [("cat", "A1"), ("chase", "B1"), ("garden", "A1")]
+    assert [coverage for _, _, coverage in report["gains"]] == pytest.approx([16 / 22, 18 / 22, 19 / 22])
+    # "Rex" and "and" are not in the vocabulary, so 19/22 is the ceiling
+    assert report["targets"] == {0.90: None, 0.95: None, 0.98: None}
+
+def test_coverage_gaps_per_band_and_level():
+    words, weights, total = profile_reference()
+    report = analyze_coverage(words, weights, total, {"dog", "cat"})
+    bands = {label: tuple(row) for label, *row in report["bands"]}
+    assert list(bands) == ["9", "8", "7", "6", "5"]
+    assert bands["8"] == (2, 2, pytest.approx(7 / 22), pytest.approx(7 / 22))
+    assert bands["6"] == (1, 0, pytest.approx(2 / 22), 0)
+    levels = {label: tuple(row) for label, *row in report["levels"]}
+    assert levels["B1"] == (1, 0, pytest.approx(2 / 22), 0)
+
+def test_words_needed_to_reach_a_target():
+    words, weights, total = reference_from_table(["the", "dog", "cat", "garden"], {})
+    report = analyze_coverage(words, weights, total, set())
+    # the: 1, dog: 1/2, cat: 1/3, garden: 1/4 of 25/12; "the" is a stopword
+    assert report["with_stopwords"] == pytest.approx(12 / 25)
+    assert report["targets"][0.90] == 3
+
+def test_run_coverage_reports_against_a_corpus(tmp_path, monkeypatch):
+    monkeypatch.setattr(coverage_service, "get_deck_words", lambda deck: {"dog"})
+    path = tmp_path / "book.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    out = io.StringIO()
+    report = run_coverage([str(path)], "My Deck", out=out)
+    assert report["deck"] == pytest.approx(4 / 22)
+    assert "1 corpora, 22 tokens" in out.getvalue()
+    assert "cat (A1)" in out.getvalue()
@@ -0,0 +1,30 @@
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from src.services.deck_service import get_deck_words
+
+def anki_response(result, error=None):
+    response = MagicMock()
+    response.json.return_value = {"result": result, "error": error}
+    return response
+
+@patch('src.services.deck_service.requests.post')
+def test_get_deck_words_returns_lowercase_word_fields(mock_post):
+    mock_post.side_effect = [
+        anki_response([1, 2, 3]),
+        anki_response([
+            {"fields": {"Word": {"value": " Flee "}}},
+            {"fields": {"Word": {"value": "danger"}}},
+            {"fields": {"Sentence": {"value": "no word field"}}},
+        ]),
+    ]
+    assert get_deck_words("My Deck") == {"flee", "danger"}
+    assert mock_post.call_args_list[0].kwargs["json"]["params"] == {"query": 'deck:"My Deck"'}
+
+@patch('src.services.deck_service.requests.post')
+def test_get_deck_words_empty_when_anki_fails(mock_post):
+    mock_post.side_effect = requests.exceptions.ConnectionError()
+    assert get_deck_words("My Deck") == set()
+    mock_post.side_effect = [anki_response(None, error="collection is not available")]
+    assert get_deck_words("My Deck") == set()
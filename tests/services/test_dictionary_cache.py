@@ -0,0 +1,127 @@
+"""Tests for the persistent DictionaryAPI cache."""
+
+import sqlite3
+import threading
+from unittest.mock import patch
+from src.services import dictionary_cache, dictionary_service
+from src.services.dictionary_cache import DictionaryCache, normalize_word
+
+ENTRY = [{"word": "run", "meanings": [{"partOfSpeech": "verb", "definitions": [{"definition": "move fast"}]}]}]
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+def test_round_trip_across_connections_with_normalized_keys(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = DictionaryCache(path)
+    assert cache.get("run") is None
+    cache.put(" Run ", ENTRY)
+    cache.close()
+
+    reopened = DictionaryCache(path)
+    assert reopened.get("RUN") == ENTRY
+    assert normalize_word("  Ice   Cream ") == "ice cream"
+
+def test_entries_expire_after_the_ttl(tmp_path):
+    clock = Clock()
+    cache = DictionaryCache(str(tmp_path / "cache.sqlite"), ttl_days=1, clock=clock)
+    cache.put("run", ENTRY)
+    clock.now += 86399
+    assert cache.get("run") == ENTRY
+    clock.now += 2
+    assert cache.get("run") is None
+    assert cache.stats()["entries"] == 0
+
+def test_least_recently_used_entries_are_evicted_beyond_the_size_limit(tmp_path):
+    clock = Clock()
+    cache = DictionaryCache(str(tmp_path / "cache.sqlite"), max_bytes=300, clock=clock)
+    for word in ("alpha", "beta", "gamma"):
+        clock.now += 1
+        cache.put(word, [{"word": word, "padding": "x" * 60}])
+    clock.now += 1
+    assert cache.get("alpha") is not None  # now more recently used than "beta"
+    clock.now += 1
+    cache.put("delta", [{"word": "delta", "padding": "x" * 60}])
+
+    assert cache.get("beta") is None
+    assert all(cache.get(word) for word in ("alpha", "gamma", "delta"))
+    assert cache.stats()["bytes"] <= 300
+
+def test_not_found_entries_use_the_shorter_ttl(tmp_path):
+    clock = Clock()
+    cache = DictionaryCache(str(tmp_path / "cache.sqlite"), ttl_days=30, miss_ttl_hours=1, clock=clock)
+    cache.put("runn", {"no_entry": True, "word": "runn"}, found=False)
+    cache.put("run", ENTRY)
+    assert cache.is_not_found("runn") and not cache.is_not_found("run")
+    assert cache.stats()["not_found"] == 1
+    clock.now += 3601
+    assert not cache.is_not_found("runn")
+    assert cache.get("runn") is None
+    assert cache.get("run") == ENTRY
+
+def test_cache_from_an_older_schema_is_rebuilt(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE entries (word TEXT PRIMARY KEY, value TEXT, size INTEGER, stored_at REAL, used_at REAL)")
+    conn.execute("INSERT INTO entries VALUES ('run', '[]', 2, 0, 0)")
+    conn.commit()
+    conn.close()
+    cache = DictionaryCache(path)
+    assert cache.get("run") is None
+    cache.put("run", ENTRY)
+    assert cache.get("run") == ENTRY
+
+def test_stats_count_hits_misses_and_bytes_saved(tmp_path):
+    cache = DictionaryCache(str(tmp_path / "cache.sqlite"))
+    cache.get("run")
+    cache.put("run", ENTRY)
+    cache.get("run")
+    cache.get("run")
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 2, 1)
+    assert stats["bytes_saved"] == 2 * stats["bytes"] > 0
+
+def test_concurrent_workers_share_the_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    caches = [DictionaryCache(path) for _ in range(4)]
+
+    def work(cache, n):
+        for i in range(25):
+            cache.put(f"word{n}-{i}", ENTRY)
+            assert cache.get(f"word{n}-{i}") == ENTRY
+
+    threads = [threading.Thread(target=work, args=(cache, n)) for n, cache in enumerate(caches)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert caches[0].stats()["entries"] == 100
+
+def test_fetch_uses_the_cache_unless_refreshing(tmp_path, monkeypatch):
+    cache = DictionaryCache(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(dictionary_service, "get_dictionary_cache", lambda: cache)
+    monkeypatch.setattr(dictionary_service, "_backends", [dictionary_service.DictionaryApiBackend()])
+    with patch("src.services.dictionary_service.get_api_data", return_value=ENTRY) as get_api_data:
+        assert dictionary_service._fetch_dictionary_api_data("run") == ENTRY
+        assert dictionary_service._fetch_dictionary_api_data("Run") == ENTRY
+        assert get_api_data.call_count == 1
+
+        monkeypatch.setattr(dictionary_cache, "_refresh", False)
+        dictionary_cache.enable_refresh()
+        assert dictionary_service._fetch_dictionary_api_data("run") == ENTRY
+        assert get_api_data.call_count == 2
+
+def test_not_found_is_cached_and_returned_as_no_entry(tmp_path, monkeypatch):
+    cache = DictionaryCache(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(dictionary_service, "get_dictionary_cache", lambda: cache)
+    monkeypatch.setattr(dictionary_service, "_backends", [dictionary_service.DictionaryApiBackend()])
+    not_found = lambda url, timeout=None, not_found=None: not_found
+    with patch("src.services.dictionary_service.get_api_data", side_effect=not_found) as get_api_data:
+        assert dictionary_service._fetch_dictionary_api_data("runn") == {"no_entry": True, "word": "runn"}
+        assert dictionary_service.is_known_no_entry("runn")
+        assert dictionary_service.is_no_entry(dictionary_service._fetch_dictionary_api_data("runn"))
+        assert get_api_data.call_count == 1
@@ -60,6 +60,14 @@ def test_fetch_word_data_dict_fails(mock_fetch_dict):
     with pytest.raises(SystemExit):
         fetch_word_data("test")
 
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data')
+@patch('src.services.dictionary_service._fetch_dictionary_api_data', return_value={"no_entry": True, "word": "runn"})
+def test_fetch_word_data_no_entry_does_not_exit(mock_fetch_dict, mock_fetch_thes):
+    """A word the dictionary does not know yields a no-entry result, even with exit_on_error."""
+    from src.services.dictionary_service import is_no_entry
+    assert is_no_entry(fetch_word_data("runn", requested_pos="noun"))
+    mock_fetch_thes.assert_not_called()
+
 @patch('src.services.dictionary_service._fetch_thesaurus_api_data')
 @patch('src.services.dictionary_service._fetch_dictionary_api_data')
 def test_fetch_word_data_thesaurus_fails(mock_fetch_dict, mock_fetch_thes):
@@ -116,4 +124,80 @@ def test_format_dictionary_entry_multi_entry():
     assert "an event or situation that reveals the strength or quality of someone or something" in html
     assert "take measures to check the quality" in html
     assert "/tɛst/" in html  # phonetic from first entry 
-    
\ No newline at end of file
+    
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data', return_value=mock_thes_response)
+@patch('src.services.dictionary_service._fetch_dictionary_api_data', return_value=mock_dict_response)
+def test_fetch_word_data_uses_prefetched_responses(mock_fetch_dict, mock_fetch_thes):
+    """Prefetched payloads are processed for the POS confirmed later, without new requests."""
+    from src.services.dictionary_service import prefetch_word_data
+    prefetched = prefetch_word_data("test")
+    prefetched["dictionary"].result(timeout=5)
+    prefetched["thesaurus"].result(timeout=5)
+
+    result = fetch_word_data("test", requested_pos="verb", prefetched=prefetched)
+
+    assert result['partOfSpeech'] == 'verb'
+    assert "check" in result['synonyms']
+    mock_fetch_dict.assert_called_once_with("test")
+    mock_fetch_thes.assert_called_once_with("test")
+
+mock_dict_with_synonyms = {
+    "word": "quick",
+    "meanings": [
+        {
+            "partOfSpeech": "adjective",
+            "synonyms": ["fast", "rapid", "speedy"],
+            "antonyms": ["slow"],
+            "definitions": [{"definition": "moving fast", "synonyms": ["swift", "fleet", "fast"]}]
+        },
+        {"partOfSpeech": "noun", "definitions": [{"definition": "the sensitive flesh under the nails"}]}
+    ]
+}
+
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data')
+@patch('src.services.dictionary_service._fetch_dictionary_api_data', return_value=mock_dict_with_synonyms)
+def test_fetch_word_data_skips_thesaurus_when_the_entry_has_enough_synonyms(mock_fetch_dict, mock_fetch_thes):
+    result = fetch_word_data("quick", requested_pos="adjective")
+    mock_fetch_thes.assert_not_called()
+    assert result["synonyms"] == "fast, rapid, speedy, swift, fleet"
+    assert result["antonyms"] == "slow"
+    assert result["related"] == "" and result["similar"] == ""
+
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data', return_value={"noun": {"syn": ["cuticle"]}})
+@patch('src.services.dictionary_service._fetch_dictionary_api_data', return_value=mock_dict_with_synonyms)
+def test_fetch_word_data_asks_thesaurus_for_a_pos_without_enough_synonyms(mock_fetch_dict, mock_fetch_thes):
+    from src.services.dictionary_service import prefetch_word_data
+    # The noun has no synonyms in the entry, so the prefetch cannot skip the thesaurus
+    prefetched = prefetch_word_data("quick")
+    assert prefetched["thesaurus"].result(timeout=5) == {"noun": {"syn": ["cuticle"]}}
+    result = fetch_word_data("quick", requested_pos="noun", prefetched=prefetched)
+    assert result["synonyms"] == "cuticle"
+    mock_fetch_thes.assert_called_once_with("quick")
+
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data')
+@patch('src.services.dictionary_service._fetch_dictionary_api_data')
+def test_prefetch_skips_thesaurus_when_every_pos_is_covered(mock_fetch_dict, mock_fetch_thes):
+    from src.services.dictionary_service import prefetch_word_data
+    mock_fetch_dict.return_value = {"word": "quick", "meanings": mock_dict_with_synonyms["meanings"][:1]}
+    prefetched = prefetch_word_data("quick")
+    assert prefetched["thesaurus"].result(timeout=5) is None
+    assert fetch_word_data("quick", requested_pos="adjective", prefetched=prefetched)["antonyms"] == "slow"
+    mock_fetch_dict.return_value = {"no_entry": True, "word": "quikc"}
+    assert prefetch_word_data("quikc")["thesaurus"].result(timeout=5) is None
+    mock_fetch_thes.assert_not_called()
+
+@patch('src.services.dictionary_service.THESAURUS_SKIP_MIN_SYNONYMS', 0)
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data', return_value={"adjective": {"syn": ["brisk"]}})
+@patch('src.services.dictionary_service._fetch_dictionary_api_data', return_value=mock_dict_with_synonyms)
+def test_thesaurus_is_always_asked_when_the_policy_is_off(mock_fetch_dict, mock_fetch_thes):
+    assert fetch_word_data("quick", requested_pos="adjective")["synonyms"] == "brisk"
+
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data')
+@patch('src.services.dictionary_service._fetch_dictionary_api_data')
+def test_prefetch_skips_thesaurus_for_a_slow_uncached_dictionary(mock_fetch_dict, mock_fetch_thes):
+    import time
+    from src.services.dictionary_service import prefetch_word_data
+    covered = {"word": "quick", "meanings": mock_dict_with_synonyms["meanings"][:1]}
+    mock_fetch_dict.side_effect = lambda word: time.sleep(0.3) or covered
+    assert prefetch_word_data("quick")["thesaurus"].result(timeout=5) is None
+    mock_fetch_thes.assert_not_called()
@@ -0,0 +1,89 @@
+import io
+import pytest
+
+from src.services import cefr_data, i_plus_one, sentence_index
+from src.services.cefr_annotation import CefrVocabulary
+from src.services.i_plus_one import known_word_mask, find_i_plus_one, pick_study_pairs, run_i_plus_one
+from src.services.sentence_index import SentenceIndexBuilder, SentenceIndex
+
+TABLE = {
+    "the": {"cefr": "A1", "frequency": "9"},
+    "dog": {"cefr": "A1", "frequency": "8"},
+    "cat": {"cefr": "A1", "frequency": "8"},
+    "garden": {"cefr": "A1", "frequency": "7"},
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "fled": {"cefr": "?", "frequency": "6"},
+    "chase": {"cefr": "B1", "frequency": "6"},
+    "chased": {"cefr": "?", "frequency": "6"},
+    "ubiquitous": {"cefr": "C2", "frequency": "3"},
+}
+LEMMAS = {"fled": "flee", "chased": "chase"}
+CORPUS = (
+    "The dog fled the cat in the garden. "
+    "The dog chased the cat in the garden. "
+    "The cat chased the dog and the dog fled. "
+    "The ubiquitous dog chased the cat to the garden. "
+    "Gandalf fled the dog in the garden."
+)
+
+@pytest.fixture(autouse=True)
+def cefr_table(monkeypatch):
+    vocabulary = CefrVocabulary(TABLE, LEMMAS)
+    monkeypatch.setattr(cefr_data, "_cefr_frequency_data", TABLE)
+    monkeypatch.setattr(sentence_index, "get_cefr_lemma_map", lambda: LEMMAS)
+    monkeypatch.setattr(i_plus_one, "get_cefr_lemma_map", lambda: LEMMAS)
+    monkeypatch.setattr(i_plus_one, "get_cefr_vocabulary", lambda: vocabulary)
+
+@pytest.fixture
+def index(tmp_path):
+    builder = SentenceIndexBuilder(CefrVocabulary(TABLE, LEMMAS), LEMMAS)
+    builder.add_text(CORPUS)
+    builder.write(str(tmp_path / "index"), {})
+    return SentenceIndex(str(tmp_path / "index"))
+
+def words_of(index, sentence_id):
+    start, end = index.sentence_word_offsets[sentence_id], index.sentence_word_offsets[sentence_id + 1]
+    return [str(index.words[i]) for i in index.sentence_words[start:end]]
+
+def test_sentences_stored_as_sorted_lemma_ids(index):
+    sentence_id = [index.sentence(i) for i in range(index.meta["sentences"])].index(
+        "The cat chased the dog and the dog fled.")
+    assert words_of(index, sentence_id) == ["and", "cat", "chase", "dog", "flee", "the"]
+
+def test_known_mask_expands_deck_words_by_lemma(index):
+    known = known_word_mask(index, {"fled", "dog"})
+    known_words = {str(w) for w, k in zip(index.words, known) if k}
+    assert {"flee", "dog", "the", "and", "in"} <= known_words
+    assert "chase" not in known_words and "cat" not in known_words
+
+def test_known_level_marks_easy_vocabulary_known(index):
+    known = known_word_mask(index, set(), known_level="A1")
+    known_words = {str(w) for w, k in zip(index.words, known) if k}
+    assert {"cat", "dog", "garden"} <= known_words
+    assert "flee" not in known_words and "ubiquitous" not in known_words
+
+def test_only_sentences_with_one_unknown_word(index):
+    known = known_word_mask(index, {"flee"}, known_level="A1")
+    sentence_ids, word_ids = find_i_plus_one(index, known)
+    found = sorted((index.sentence(int(s)), str(index.words[w])) for s, w in zip(sentence_ids, word_ids))
+    # The ubiquitous sentence has two new words; "Gandalf" counts as one
+    assert found == [
+        ("Gandalf fled the dog in the garden.", "gandalf"),
+        ("The cat chased the dog and the dog fled.", "chase"),
+        ("The dog chased the cat in the garden.", "chase"),
+    ]
+    pairs = pick_study_pairs(index, sentence_ids, word_ids)
+    assert [(word, count) for word, _, count in pairs] == [("chase", 2)]
+
+def test_words_missing_from_the_table_are_not_offered(index):
+    known = known_word_mask(index, {"flee", "chase"}, known_level="A1")
+    sentence_ids, word_ids = find_i_plus_one(index, known)
+    assert {str(index.words[w]) for w in word_ids} == {"gandalf", "ubiquitous"}
+    assert [word for word, _, _ in pick_study_pairs(index, sentence_ids, word_ids)] == ["ubiquitous"]
+
+def test_run_i_plus_one_writes_batch_rows(index, monkeypatch, capsys):
+    monkeypatch.setattr(i_plus_one, "get_deck_words", lambda deck: {"fled"})
+    out = io.StringIO()
+    run_i_plus_one("My Deck", known_level="A1", path=index.path, out=out)
+    assert out.getvalue() == "The dog chased the cat in the garden.\tchase\n"
+    assert "1 from the deck" in capsys.readouterr().err
@@ -0,0 +1,64 @@
+"""Tests for the resumable batch journal."""
+
+from unittest.mock import patch, MagicMock
+from src.services.job_journal import JobJournal, start_stage
+from src.services.card_service import create_card
+
+def test_journal_round_trip_and_persistence(tmp_path):
+    path = str(tmp_path / "job.sqlite")
+    journal = JobJournal(path)
+    card = journal.card("I run daily.", "Run")
+    assert card.get("dictionary") is None
+    card.put("dictionary", [{"word": "run"}])
+    card.put("word_audio", ("[sound:tts_run.mp3]", "data"))
+    journal.close()
+
+    reopened = JobJournal(path).card(" I run daily. ", "run")
+    assert reopened.get("dictionary") == [{"word": "run"}]
+    assert reopened.get("word_audio") == ["[sound:tts_run.mp3]", "data"]
+
+def test_start_stage_records_success_and_skips_on_resume(tmp_path):
+    card = JobJournal(str(tmp_path / "job.sqlite")).card("s", "w")
+    fetch = MagicMock(return_value={"verb": {"syn": ["sprint"]}})
+
+    assert start_stage(card, "thesaurus", fetch, "w").result(timeout=5) == {"verb": {"syn": ["sprint"]}}
+    assert start_stage(card, "thesaurus", fetch, "w").result(timeout=5) == {"verb": {"syn": ["sprint"]}}
+    fetch.assert_called_once_with("w")
+
+def test_start_stage_does_not_record_failures(tmp_path):
+    card = JobJournal(str(tmp_path / "job.sqlite")).card("s", "w")
+    start_stage(card, "word_audio", lambda: (None, None)).result(timeout=5)
+    start_stage(card, "dictionary", lambda: None).result(timeout=5)
+    assert card.get("word_audio") is None
+    assert card.get("dictionary") is None
+
+@patch('src.services.card_service.start_card_prefetch')
+def test_create_card_returns_journaled_note_without_work(mock_prefetch, tmp_path):
+    card = JobJournal(str(tmp_path / "job.sqlite")).card("I run daily.", "run")
+    card.put("note", 555)
+    assert create_card("I run daily.", "run", {"model_name": "m"}, "Deck", journal=card) == 555
+    mock_prefetch.assert_not_called()
+
+@patch('src.services.card_service.add_note', return_value={"result": 777, "error": None})
+@patch('src.services.card_service.send_media_file', return_value=True)
+@patch('src.services.card_service.format_dictionary_entry', return_value="<div></div>")
+@patch('src.services.card_service.highlight_focus_word', side_effect=lambda s, w, pos: s)
+@patch('src.services.prefetch_service.generate_tts_base64')
+@patch('src.services.prefetch_service.fetch_pexels_images')
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data')
+@patch('src.services.dictionary_service._fetch_dictionary_api_data')
+def test_create_card_resumes_after_failed_add(mock_dict, mock_thes, mock_pexels, mock_tts,
+                                              mock_highlight, mock_format, mock_send, mock_add, tmp_path):
+    """A card that died at addNote re-runs only the addNote stage."""
+    card = JobJournal(str(tmp_path / "job.sqlite")).card("I run daily.", "run")
+    card.put("dictionary", [{"word": "run", "meanings": [{"partOfSpeech": "verb", "definitions": [{"definition": "move fast"}]}]}])
+    card.put("thesaurus", {"verb": {"syn": ["sprint"]}})
+    card.put("images", [{"src": {"medium": "url1"}}])
+    card.put("word_audio", ["[sound:tts_run.mp3]", "a"])
+    card.put("sentence_audio", ["[sound:tts_sentence_run.mp3]", "b"])
+    card.put("media", True)
+
+    assert create_card("I run daily.", "run", {"model_name": "m"}, "Deck", pos="verb", journal=card) == 777
+    for mock in (mock_dict, mock_thes, mock_pexels, mock_tts, mock_send):
+        mock.assert_not_called()
+    assert card.get("note") == 777
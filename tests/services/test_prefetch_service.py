@@ -0,0 +1,57 @@
+"""Tests for the card prefetch stage."""
+
+import threading
+from unittest.mock import patch
+from src.services.prefetch_service import start_card_prefetch
+
+@patch('src.services.prefetch_service.generate_tts_base64')
+@patch('src.services.prefetch_service.fetch_pexels_images')
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data')
+@patch('src.services.dictionary_service._fetch_dictionary_api_data')
+def test_start_card_prefetch_runs_requests_concurrently(mock_dict, mock_thes, mock_pexels, mock_tts):
+    """
+    The four independent requests must be in flight at the same time, not one after
+    another; the thesaurus waits for the dictionary payload it may make unnecessary.
+    """
+    barrier = threading.Barrier(4, timeout=5)
+
+    def waits_for_all(result):
+        def side_effect(*args):
+            barrier.wait()
+            return result(*args) if callable(result) else result
+        return side_effect
+
+    mock_dict.side_effect = waits_for_all({"word": "run"})
+    mock_thes.return_value = {"verb": {"syn": ["sprint"]}}
+    mock_pexels.side_effect = waits_for_all([{"src": {"medium": "url1"}}])
+    mock_tts.side_effect = waits_for_all(lambda text, prefix, exit_on_error: (f"[sound:tts_{prefix}.mp3]", "data"))
+
+    prefetch = start_card_prefetch("run", "I run daily.")
+
+    assert prefetch["word_data"]["dictionary"].result(timeout=5) == {"word": "run"}
+    assert prefetch["word_data"]["thesaurus"].result(timeout=5) == {"verb": {"syn": ["sprint"]}}
+    assert prefetch["images"].result(timeout=5) == [{"src": {"medium": "url1"}}]
+    assert prefetch["word_audio"].result(timeout=5) == ("[sound:tts_run.mp3]", "data")
+    assert prefetch["sentence_audio"].result(timeout=5) == ("[sound:tts_sentence_run.mp3]", "data")
+
+def test_sentence_audio_prefix():
+    from src.services.prefetch_service import sentence_audio_prefix
+    assert sentence_audio_prefix("He fled from danger.", ["fled"]) == "sentence_fled"
+    shared = sentence_audio_prefix("He fled from danger.", ["fled", "danger"])
+    assert shared.startswith("sentence_") and shared != "sentence_fled"
+    assert shared == sentence_audio_prefix("He fled from danger.", ["danger", "fled"])
+
+@patch('src.services.prefetch_service.generate_tts_base64', return_value=("[sound:tts_x.mp3]", "data"))
+@patch('src.services.prefetch_service.fetch_pexels_images', return_value=[])
+@patch('src.services.dictionary_service._fetch_thesaurus_api_data', return_value=None)
+@patch('src.services.dictionary_service._fetch_dictionary_api_data', return_value=None)
+def test_shared_sentence_audio_is_synthesized_once(mock_dict, mock_thes, mock_pexels, mock_tts):
+    from src.services.prefetch_service import start_sentence_audio
+    shared = start_sentence_audio("He fled from danger.", ["fled", "danger"])
+    prefetches = [start_card_prefetch(w, "He fled from danger.", sentence_audio=shared) for w in ("fled", "danger")]
+    for prefetch in prefetches:
+        assert prefetch["sentence_audio"] is shared
+        prefetch["word_audio"].result(timeout=5)
+    shared.result(timeout=5)
+    sentence_calls = [c for c in mock_tts.call_args_list if c.args[0] == "He fled from danger."]
+    assert len(sentence_calls) == 1
@@ -0,0 +1,98 @@
+import io
+import pytest
+
+from src.services import cefr_data, sentence_index
+from src.services.cefr_annotation import CefrVocabulary
+from src.services.sentence_index import (
+    SentenceIndexBuilder, SentenceIndex, find_corpus_files, read_word_list, mine_sentences, run_mine_sentences
+)
+
+TABLE = {
+    "the": {"cefr": "A1", "frequency": "9"},
+    "a": {"cefr": "A1", "frequency": "9"},
+    "dog": {"cefr": "A1", "frequency": "8"},
+    "cat": {"cefr": "A1", "frequency": "8"},
+    "saw": {"cefr": "?", "frequency": "7"},
+    "see": {"cefr": "A1", "frequency": "9"},
+    "in": {"cefr": "A1", "frequency": "9"},
+    "garden": {"cefr": "A1", "frequency": "7"},
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "fled": {"cefr": "?", "frequency": "6"},
+    "ubiquitous": {"cefr": "C2", "frequency": "3"},
+    "perspicacious": {"cefr": "C2", "frequency": "1"},
+}
+LEMMAS = {"saw": "see", "fled": "flee"}
+CORPUS = (
+    "The dog fled the cat in the garden. "
+    "The ubiquitous perspicacious dog fled the perspicacious cat. "
+    "A cat saw the dog in the garden. "
+    "Dog fled. "
+    "The dog fled the cat in the garden."
+)
+
+@pytest.fixture(autouse=True)
+def cefr_table(monkeypatch):
+    monkeypatch.setattr(cefr_data, "_cefr_frequency_data", TABLE)
+    monkeypatch.setattr(sentence_index, "get_cefr_lemma_map", lambda: LEMMAS)
+
+@pytest.fixture
+def index(tmp_path):
+    builder = SentenceIndexBuilder(CefrVocabulary(TABLE, LEMMAS), LEMMAS)
+    builder.add_text(CORPUS)
+    builder.write(str(tmp_path / "index"), {"files": 1})
+    return SentenceIndex(str(tmp_path / "index"))
+
+def test_sentences_ranked_by_difficulty_of_other_words(index):
+    found = index.find("flee", limit=5)
+    assert [sentence for sentence, _ in found] == [
+        "The dog fled the cat in the garden.",
+        "The ubiquitous perspicacious dog fled the perspicacious cat.",
+    ]
+    assert found[0][1] < found[1][1]
+
+def test_short_sentences_and_duplicates_are_skipped(index):
+    assert all(sentence != "Dog fled." for sentence, _ in index.find("flee", limit=5))
+    assert index.meta["sentences"] == 3
+
+def test_inflected_forms_are_indexed_under_their_lemma(index):
+    assert index.find("see") == [("A cat saw the dog in the garden.", pytest.approx(index.find("see")[0][1]))]
+    assert index.find("saw") == []
+    assert mine_sentences(["saw", "unknown"], index) == {"saw": index.find("see", 1), "unknown": []}
+
+def test_index_rejects_other_versions(tmp_path, index):
+    (tmp_path / "index" / "meta.json").write_text('{"version": 0}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        SentenceIndex(str(tmp_path / "index"))
+    with pytest.raises(OSError):
+        SentenceIndex(str(tmp_path / "missing"))
+
+def test_index_rejects_a_different_cefr_table(tmp_path):
+    builder = SentenceIndexBuilder(CefrVocabulary(TABLE, LEMMAS), LEMMAS)
+    builder.add_text(CORPUS)
+    builder.write(str(tmp_path / "index"), {"cefr_source": "aaaa"})
+    assert SentenceIndex(str(tmp_path / "index"), cefr_source="aaaa").meta["sentences"] == 3
+    with pytest.raises(ValueError, match="different CEFR table"):
+        SentenceIndex(str(tmp_path / "index"), cefr_source="bbbb")
+
+def test_read_word_list_keeps_the_first_of_duplicates(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("run\nFled\nrun\nfled\tverb\ndog\n", encoding="utf-8")
+    assert read_word_list(str(words)) == ["run", "fled", "dog"]
+
+def test_find_corpus_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ("a.txt", "sub/b.srt.gz", "notes.md", "c.TXT"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    assert [p[len(str(tmp_path)) + 1:] for p in find_corpus_files(str(tmp_path))] == ["a.txt", "c.TXT", "sub/b.srt.gz"]
+
+def test_run_mine_sentences_writes_batch_rows(tmp_path, index, capsys):
+    words = tmp_path / "words.txt"
+    words.write_text("# to learn\nfled\n\nubiquitous\tadj\nzebra\n", encoding="utf-8")
+    assert read_word_list(str(words)) == ["fled", "ubiquitous", "zebra"]
+    out = io.StringIO()
+    run_mine_sentences(str(words), index.path, out=out)
+    assert out.getvalue().splitlines() == [
+        "The dog fled the cat in the garden.\tfled",
+        "The ubiquitous perspicacious dog fled the perspicacious cat.\tubiquitous",
+    ]
+    assert "zebra" in capsys.readouterr().err
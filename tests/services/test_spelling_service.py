@@ -0,0 +1,66 @@
+import pytest
+
+from src.services import cefr_data
+from src.services.cefr_lemmas import build_lemma_map
+from src.services.spelling_service import (
+    SpellingIndex, edit_distance, is_known_word, suggest_spelling, load_spelling_index
+)
+
+TABLE = {
+    "perseverance": {"cefr": "C2", "frequency": "8"},
+    "receive": {"cefr": "A2", "frequency": "9"},
+    "relieve": {"cefr": "B2", "frequency": "6"},
+    "recite": {"cefr": "?", "frequency": "3"},
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "fled": {"cefr": "?", "frequency": "6"},
+}
+
+@pytest.fixture(autouse=True)
+def cefr_table(monkeypatch):
+    monkeypatch.setattr(cefr_data, "_cefr_frequency_data", TABLE)
+    monkeypatch.setattr(cefr_data, "_cefr_lemma_map", build_lemma_map(TABLE))
+    monkeypatch.setattr(cefr_data, "wordnet_lemmatizer", lambda: None)
+
+@pytest.fixture
+def index():
+    return SpellingIndex.build(TABLE)
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("recieve", "receive", 1),      # transposition
+    ("perseverence", "perseverance", 1),
+    ("fle", "flee", 1),
+    ("recive", "recite", 1),
+    ("flead", "fled", 1),
+    ("relive", "receive", 2),
+    ("abc", "flee", 3),             # capped at max_distance + 1
+])
+def test_edit_distance(a, b, expected):
+    assert edit_distance(a, b) == expected
+
+def test_suggestions_ranked_by_distance_then_frequency(index):
+    words = [s["word"] for s in suggest_spelling("recieve", index=index)]
+    assert words == ["receive", "relieve", "recite"]
+
+def test_suggestions_within_two_edits(index):
+    assert suggest_spelling("persevrence", index=index)[0] == {
+        "word": "perseverance", "cefr": "C2", "frequency": "8", "distance": 2
+    }
+    assert suggest_spelling("xyzzy", index=index) == []
+
+def test_is_known_word_uses_table_and_lemmas():
+    assert is_known_word("Fled")
+    assert is_known_word("fleed") is False
+
+def test_spelling_index_cache_keyed_on_source(tmp_path, index):
+    path = str(tmp_path / "cefr.spelling.npz")
+    index.save(path, "abc")
+    cached = SpellingIndex.load(path, "abc")
+    assert cached.words == index.words
+    assert suggest_spelling("recieve", index=cached)[0]["word"] == "receive"
+    assert SpellingIndex.load(path, "other") is None
+    assert SpellingIndex.load(str(tmp_path / "missing.npz"), "abc") is None
+
+def test_load_spelling_index_builds_from_dict_table(tmp_path):
+    index = load_spelling_index(TABLE, str(tmp_path / "unused.npz"))
+    assert sorted(index.words) == sorted(TABLE)
+    assert not (tmp_path / "unused.npz").exists()
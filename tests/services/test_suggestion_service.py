@@ -0,0 +1,53 @@
+import pytest
+
+from src.services import cefr_data
+from src.services import suggestion_service
+from src.services.cefr_lemmas import build_lemma_map
+from src.services.suggestion_service import suggest_focus_words, score_entry
+
+TABLE = {
+    "soldiers": {"cefr": "?", "frequency": "4"},
+    "soldier": {"cefr": "A2", "frequency": "3"},
+    "fled": {"cefr": "?", "frequency": "6"},
+    "flee": {"cefr": "B2", "frequency": "5"},
+    "perseverance": {"cefr": "C2", "frequency": "8"},
+    "city": {"cefr": "A1", "frequency": "1"},
+    "paris": {"cefr": "?", "frequency": "4"},
+}
+
+def fake_lemmatize(word, pos="n"):
+    return {("soldiers", "n"): "soldier"}.get((word, pos), word)
+
+@pytest.fixture(autouse=True)
+def cefr_table(monkeypatch):
+    monkeypatch.setattr(cefr_data, "_cefr_frequency_data", TABLE)
+    monkeypatch.setattr(cefr_data, "_cefr_lemma_map", build_lemma_map(TABLE, fake_lemmatize))
+    monkeypatch.setattr(cefr_data, "wordnet_lemmatizer", lambda: fake_lemmatize)
+    monkeypatch.setattr(suggestion_service, "wordnet_lemmatizer", lambda: fake_lemmatize)
+
+SENTENCE = "The soldiers fled the city of Paris with perseverance."
+
+def test_score_entry_weighs_level_and_rarity():
+    assert score_entry({"cefr": "C2", "frequency": "8"}) == 11
+    assert score_entry({"cefr": "A1", "frequency": "1"}) == 8
+    assert score_entry({"cefr": "", "frequency": ""}) == 4
+
+def test_suggestions_ranked_by_level_and_rarity():
+    words = [s["word"] for s in suggest_focus_words(SENTENCE)]
+    assert words[:2] == ["perseverance", "fled"]
+    assert "the" not in words and "of" not in words
+
+def test_suggestions_skip_proper_nouns_and_function_words_when_tagged():
+    tagged = [("The", "DT"), ("soldiers", "NNS"), ("fled", "VBD"), ("the", "DT"), ("city", "NN"),
+              ("of", "IN"), ("Paris", "NNP"), ("with", "IN"), ("perseverance", "NN"), (".", ".")]
+    words = [s["word"] for s in suggest_focus_words(SENTENCE, tagged)]
+    assert "paris" not in words
+    assert set(words) == {"soldiers", "fled", "city", "perseverance"}
+
+def test_suggestions_skip_words_already_in_deck_by_lemma():
+    words = [s["word"] for s in suggest_focus_words(SENTENCE, known_words={"flee", "soldier"})]
+    assert "fled" not in words and "soldiers" not in words
+    assert words[0] == "perseverance"
+
+def test_suggestions_respect_limit():
+    assert len(suggest_focus_words(SENTENCE, limit=2)) == 2
@@ -0,0 +1,110 @@
+"""Tests for the precompiled local thesaurus table and the thesaurus backend chain."""
+
+from unittest.mock import patch
+from src.services import dictionary_service, thesaurus_table
+from src.services.thesaurus_table import ThesaurusTable, get_thesaurus_table, thesaurus_sections
+
+class Lemma:
+    def __init__(self, name, antonyms=()):
+        self._name, self._antonyms = name, [Lemma(a) for a in antonyms]
+
+    def name(self):
+        return self._name
+
+    def antonyms(self):
+        return self._antonyms
+
+class Synset:
+    def __init__(self, pos, lemmas, similar=(), also=()):
+        self._pos, self._lemmas, self._similar, self._also = pos, lemmas, list(similar), list(also)
+
+    def pos(self):
+        return self._pos
+
+    def lemmas(self):
+        return self._lemmas
+
+    def similar_tos(self):
+        return self._similar
+
+    def also_sees(self):
+        return self._also
+
+class WordNet:
+    BASE_FORMS = {"hotter": "hot"}
+
+    def __init__(self, synsets):
+        self._synsets = synsets
+
+    def synsets(self, key):
+        return self._synsets.get(self.BASE_FORMS.get(key, key), [])
+
+    def morphy(self, key, pos):
+        return self.BASE_FORMS.get(key, key)
+
+WARM = Synset("s", [Lemma("warm"), Lemma("red-hot")])
+PASSIONATE = Synset("a", [Lemma("passionate")])
+WORDNET = WordNet({
+    "hot": [
+        Synset("a", [Lemma("hot", ["cold"])], similar=[WARM], also=[PASSIONATE]),
+        Synset("s", [Lemma("hot"), Lemma("raging")]),
+        Synset("n", [Lemma("heat"), Lemma("hot")]),
+    ],
+    "warm": [Synset("s", [Lemma("warm"), Lemma("red-hot")])],
+    "naïve": [Synset("s", [Lemma("naïve"), Lemma("naive")])],
+})
+
+def test_sections_follow_big_huge_layout_per_pos():
+    assert thesaurus_sections("hot", WORDNET) == {
+        "adjective": {"syn": ["raging"], "ant": ["cold"], "rel": ["passionate"], "sim": ["warm", "red-hot"]},
+        "noun": {"syn": ["heat"]},
+    }
+    assert thesaurus_sections("hotter", WORDNET)["adjective"]["ant"] == ["cold"]
+    assert thesaurus_sections("zzxq", WORDNET) == {}
+
+def test_table_round_trip_and_lookup(tmp_path):
+    path = str(tmp_path / "thesaurus.npz")
+    ThesaurusTable.build(["warm", "naïve", "zzxq", "hot"], WORDNET).save(path, "abc")
+    table = ThesaurusTable.load(path, "abc")
+    assert len(table) == 3
+    assert table.get(" Hot ") == thesaurus_sections("hot", WORDNET)
+    assert table.get("warm") == {"adjective": {"syn": ["red-hot"]}}
+    assert table.get("Naïve") == {"adjective": {"syn": ["naive"]}}
+    assert table.get("zzxq") is None and table.get("zzzz") is None
+    # Built from another CSV, or not built at all
+    assert ThesaurusTable.load(path, "def") is None
+    assert ThesaurusTable.load(str(tmp_path / "missing.npz"), "abc") is None
+
+@patch("src.services.thesaurus_table.print")
+def test_missing_table_is_reported_once(mock_print, monkeypatch, tmp_path):
+    monkeypatch.setattr(thesaurus_table, "_table_loaded", False)
+    monkeypatch.setattr(thesaurus_table, "_table", None)
+    path = str(tmp_path / "missing.npz")
+    assert get_thesaurus_table(path) is None
+    assert get_thesaurus_table(path) is None
+    mock_print.assert_called_once()
+
+def test_chain_prefers_the_local_table_and_spends_no_quota(monkeypatch):
+    table = ThesaurusTable.build(["hot"], WORDNET)
+    monkeypatch.setattr(thesaurus_table, "_table_loaded", True)
+    monkeypatch.setattr(thesaurus_table, "_table", table)
+    big_huge = {"verb": {"syn": ["sprint"]}}
+    calls = []
+    monkeypatch.setattr(dictionary_service, "_thesaurus_backends", [
+        ("wordnet", dictionary_service._fetch_local_thesaurus_data),
+        ("bighuge", lambda word: calls.append(word) or big_huge),
+    ])
+    assert dictionary_service._fetch_thesaurus_api_data("hot")["noun"] == {"syn": ["heat"]}
+    assert calls == []
+    assert dictionary_service._fetch_thesaurus_api_data("run") == big_huge
+    assert calls == ["run"]
+    processed = dictionary_service._process_thesaurus_data(table.get("hot"), "adjective")
+    assert processed == {"synonyms": ["raging"], "antonyms": ["cold"], "related": ["passionate"],
+                         "similar": ["warm", "red-hot"]}
+
+@patch("src.services.dictionary_service.print")
+def test_unknown_thesaurus_backends_are_skipped(mock_print, monkeypatch):
+    monkeypatch.setattr(dictionary_service, "_thesaurus_backends", None)
+    monkeypatch.setattr(dictionary_service, "THESAURUS_BACKEND_NAMES", ["wordnet", "roget"])
+    assert [name for name, _ in dictionary_service.get_thesaurus_backends()] == ["wordnet"]
+    mock_print.assert_called_once()
@@ -0,0 +1,136 @@
+"""Tests for the offline WordNet dictionary backend and the backend chain."""
+
+import pytest
+from unittest.mock import patch
+from src.services import dictionary_service, wordnet_dictionary
+from src.services.dictionary_service import DictionaryBackend, WordNetBackend, is_no_entry
+from src.services.wordnet_dictionary import MAX_DEFINITIONS_PER_POS, wordnet_entries
+from src.ui.html_templates import render_dictionary_html
+
+class Lemma:
+    def __init__(self, name, antonyms=()):
+        self._name, self._antonyms = name, [Lemma(a) for a in antonyms]
+
+    def name(self):
+        return self._name
+
+    def antonyms(self):
+        return self._antonyms
+
+class Synset:
+    def __init__(self, pos, definition, lemmas, examples=()):
+        self._pos, self._definition, self._lemmas, self._examples = pos, definition, lemmas, list(examples)
+
+    def pos(self):
+        return self._pos
+
+    def definition(self):
+        return self._definition
+
+    def lemmas(self):
+        return self._lemmas
+
+    def examples(self):
+        return self._examples
+
+class WordNet:
+    BASE_FORMS = {"fled": "flee"}
+
+    def __init__(self, synsets):
+        self._synsets = synsets
+
+    def synsets(self, key):
+        return self._synsets.get(self.BASE_FORMS.get(key, key), [])
+
+    def morphy(self, key, pos):
+        return self.BASE_FORMS.get(key, key)
+
+WORDNET = WordNet({
+    "hot": [
+        Synset("a", "used of physical heat", [Lemma("hot", ["cold"])], ["a hot stove"]),
+        Synset("s", "characterized by violent activity", [Lemma("hot"), Lemma("raging")]),
+        Synset("n", "a state of high temperature", [Lemma("heat"), Lemma("hot")]),
+    ],
+    "flee": [Synset("v", "run away quickly", [Lemma("flee"), Lemma("fly"), Lemma("take_flight")], ["He fled."])],
+    "run": [Synset("v", f"sense {i}", [Lemma("run")]) for i in range(MAX_DEFINITIONS_PER_POS + 3)],
+})
+
+def test_entries_group_senses_by_pos_with_relations():
+    [entry] = wordnet_entries("hot", WORDNET)
+    assert entry["word"] == "hot"
+    assert [m["partOfSpeech"] for m in entry["meanings"]] == ["adjective", "noun"]
+    adjective = entry["meanings"][0]["definitions"]
+    assert adjective[0] == {"definition": "used of physical heat", "example": "a hot stove",
+                            "synonyms": [], "antonyms": ["cold"]}
+    assert adjective[1]["synonyms"] == ["raging"]
+    assert entry["meanings"][1]["definitions"][0]["synonyms"] == ["heat"]
+
+def test_inflected_forms_use_their_base_lemma():
+    [entry] = wordnet_entries("fled", WORDNET)
+    assert entry["meanings"][0]["definitions"][0]["synonyms"] == ["fly", "take flight"]
+
+def test_senses_per_pos_are_capped_and_unknown_words_have_no_entries():
+    [entry] = wordnet_entries("run", WORDNET)
+    assert len(entry["meanings"][0]["definitions"]) == MAX_DEFINITIONS_PER_POS
+    assert wordnet_entries("zzxq", WORDNET) == []
+
+def test_entries_render_like_dictionary_api_responses():
+    html = render_dictionary_html(wordnet_entries("hot", WORDNET))
+    assert '<div class="pos">adjective</div>' in html
+    assert "a hot stove" in html
+    assert "Antonyms: cold" in html
+
+class Failing(DictionaryBackend):
+    name = "failing"
+
+    def lookup(self, word):
+        return None
+
+def test_chain_falls_back_to_wordnet_when_the_api_fails(monkeypatch):
+    monkeypatch.setattr(wordnet_dictionary, "_wordnet", WORDNET)
+    monkeypatch.setattr(wordnet_dictionary, "_wordnet_loaded", True)
+    monkeypatch.setattr(dictionary_service, "_backends", [Failing(), WordNetBackend()])
+    data = dictionary_service._fetch_dictionary_api_data("flee")
+    assert data[0]["meanings"][0]["partOfSpeech"] == "verb"
+    # The failed API might still know the word, so it is not reported as having no entry
+    assert dictionary_service._fetch_dictionary_api_data("zzxq") is None
+
+def test_chain_reports_no_entry_only_when_every_backend_answered(monkeypatch):
+    monkeypatch.setattr(wordnet_dictionary, "_wordnet", WORDNET)
+    monkeypatch.setattr(wordnet_dictionary, "_wordnet_loaded", True)
+    monkeypatch.setattr(dictionary_service, "_backends", [WordNetBackend()])
+    assert is_no_entry(dictionary_service._fetch_dictionary_api_data("zzxq"))
+    assert dictionary_service.is_known_no_entry("zzxq")
+    assert not dictionary_service.is_known_no_entry("hot")
+
+def test_wordnet_backend_without_nltk_data_fails_softly(monkeypatch):
+    monkeypatch.setattr(wordnet_dictionary, "get_wordnet", lambda: None)
+    assert WordNetBackend().lookup("hot") is None
+    assert not WordNetBackend().is_available()
+
+@patch("src.services.dictionary_service.get_dictionary_cache", return_value=None)
+def test_missing_wordnet_does_not_turn_an_api_no_entry_into_a_failure(mock_cache, monkeypatch):
+    monkeypatch.setattr(wordnet_dictionary, "get_wordnet", lambda: None)
+    monkeypatch.setattr(dictionary_service, "_backends",
+                        [dictionary_service.DictionaryApiBackend(), WordNetBackend()])
+    monkeypatch.setattr(dictionary_service, "get_api_data", lambda url, timeout=10, not_found=None: not_found)
+    assert is_no_entry(dictionary_service._fetch_dictionary_api_data("zzxq"))
+
+def test_failed_wordnet_load_is_not_retried(monkeypatch):
+    monkeypatch.setattr(wordnet_dictionary, "_wordnet", None)
+    monkeypatch.setattr(wordnet_dictionary, "_wordnet_loaded", False)
+    with patch.dict("sys.modules", {"nltk.corpus": None}):
+        assert wordnet_dictionary.get_wordnet() is None
+    assert wordnet_dictionary._wordnet_loaded
+    assert wordnet_dictionary.get_wordnet() is None
+
+def test_backends_must_implement_lookup():
+    with pytest.raises(TypeError):
+        DictionaryBackend()
+
+@patch("src.services.dictionary_service.print")
+def test_unknown_backend_names_are_skipped(mock_print, monkeypatch):
+    monkeypatch.setattr(dictionary_service, "_backends", None)
+    monkeypatch.setattr(dictionary_service, "DICTIONARY_BACKEND_NAMES", ["wordnet", "oxford"])
+    assert [backend.name for backend in dictionary_service.get_dictionary_backends()] == ["wordnet"]
+    mock_print.assert_called_once()
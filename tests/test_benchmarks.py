@@ -0,0 +1,32 @@
+import json
+from benchmarks.run import (
+    build_cases, compare, load_baseline, missing_from_baseline, save_baseline, selected_cases, NLTK_CASES
+)
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    baseline = {"fast": 1.0, "steady": 1.0, "slow": 1.0}
+    results = {"fast": 0.5, "steady": 1.2, "slow": 1.5, "new": 9.0}
+    regressions = compare(results, baseline, threshold=0.25)
+    assert [(name, ratio) for name, _, _, ratio in regressions] == [("slow", 1.5)]
+
+def test_cases_without_a_baseline_are_listed():
+    cases = {"build_anki_note": None, "detect_pos_from_context": None, "highlight_focus_word": None}
+    baseline = {"build_anki_note": 2e-06}
+    assert missing_from_baseline(selected_cases(cases), baseline) == ["detect_pos_from_context", "highlight_focus_word"]
+    assert missing_from_baseline(selected_cases(cases, ["build"]), baseline) == []
+
+def test_save_baseline_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline({"build_anki_note": 2e-06}, str(path))
+    assert load_baseline(str(path)) == {"build_anki_note": 2e-06}
+    assert "python" in json.loads(path.read_text())
+    assert load_baseline(str(tmp_path / "missing.json")) == {}
+
+def test_cases_run_on_the_fixtures():
+    cases = build_cases()
+    html = cases["render_dictionary_html[set]"]()
+    assert html.count('class="definition"') > 100
+    assert cases["clean_clipboard_text"]().count("\n") == 0
+    assert cases["process_thesaurus_data[set]"]()["synonyms"]
+    assert cases["build_anki_note"]()["fields"]["Word"] == "set"
+    assert NLTK_CASES <= set(cases)
@@ -1,6 +1,6 @@
 import pytest
 import pyperclip
-from src.services.clipboard_service import get_clean_sentence_from_clipboard
+from src.services.clipboard_service import get_clean_sentence_from_clipboard, clean_clipboard_text
 
 def test_get_clean_sentence_from_clipboard_basic(monkeypatch):
     # Simulate copying a sentence with various formatting issues
@@ -49,4 +49,8 @@ def test_get_clean_sentence_removes_timestamps(monkeypatch):
     monkeypatch.setattr('builtins.input', lambda prompt: "")
     cleaned = get_clean_sentence_from_clipboard()
     expected = "Well, we're going to give you a similar library for at least the next week..."
-    assert cleaned == expected 
\ No newline at end of file
+    assert cleaned == expected 
+
+def test_clean_clipboard_text_without_clipboard():
+    raw = "0:07\r\nThe generos-\n  ity of “strangers” ∙ carried him .  \n"
+    assert clean_clipboard_text(raw) == 'The generosity of "strangers" - carried him.'
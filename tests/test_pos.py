@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from src.linguistics.pos import detect_pos_from_context
 
 @pytest.mark.parametrize("word,sentence,expected", [
@@ -14,4 +15,13 @@ from src.linguistics.pos import detect_pos_from_context
     ("house", "The house is big", "noun"),
 ])
 def test_detect_pos(word, sentence, expected):
-    assert detect_pos_from_context(word, sentence) == expected 
\ No newline at end of file
+    assert detect_pos_from_context(word, sentence) == expected 
+
+
+def test_detect_pos_reuses_tagged_sentence():
+    # A pre-tagged sentence is used as-is, so several focus words share one tagging pass
+    tagged = [("He", "PRP"), ("fled", "VBD"), ("from", "IN"), ("danger", "NN")]
+    with patch('nltk.pos_tag') as mock_pos_tag:
+        assert detect_pos_from_context("fled", "He fled from danger", tagged) == "verb"
+        assert detect_pos_from_context("danger", "He fled from danger", tagged) == "noun"
+        mock_pos_tag.assert_not_called()
@@ -0,0 +1,61 @@
+"""Cold-start guard: `generate_card.py --help` must not pay for NLTK, gTTS or the CEFR table."""
+
+import os
+import subprocess
+import sys
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Total self import time allowed for `generate_card.py --help`, in milliseconds.
+# Override with IMPORT_TIME_BUDGET_MS on slow CI machines.
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "150"))
+
+HEAVY_MODULES = ("nltk", "gtts", "pyperclip", "requests", "src.services.cefr_data")
+
+
+def run_with_importtime(cwd, args):
+    """Run Python with -X importtime and return (returncode, {module: self_us})."""
+    env = {**os.environ, "VIRTUAL_ENV": os.environ.get("VIRTUAL_ENV", sys.prefix), "PYTHONPATH": PROJECT_ROOT}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=60
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = int(self_us)
+    return result.returncode, imports
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """A working directory with the minimal .env the entry point insists on."""
+    (tmp_path / ".env").write_text("USER_LOCALE=en\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_help_does_not_import_heavy_modules(project_dir):
+    code, imports = run_with_importtime(project_dir, [os.path.join(PROJECT_ROOT, "generate_card.py"), "--help"])
+    assert code == 0
+    loaded = [name for name in imports if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES]
+    assert loaded == []
+
+
+def test_help_import_time_within_budget(project_dir):
+    code, imports = run_with_importtime(project_dir, [os.path.join(PROJECT_ROOT, "generate_card.py"), "--help"])
+    assert code == 0
+    total_ms = sum(imports.values()) / 1000
+    assert total_ms <= IMPORT_TIME_BUDGET_MS, f"cold start imports took {total_ms:.1f} ms (budget {IMPORT_TIME_BUDGET_MS} ms)"
+
+
+def test_service_imports_defer_nltk_and_cefr_load(project_dir):
+    code, imports = run_with_importtime(project_dir, [
+        "-c",
+        "import src.services.dictionary_service, src.ui.user_input, src.utils.highlight, src.services.cefr_data as c;"
+        "assert c._cefr_frequency_data is None"
+    ])
+    assert code == 0
+    assert not any(name.split(".")[0] == "nltk" for name in imports)
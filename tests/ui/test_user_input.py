@@ -0,0 +1,34 @@
+"""Tests for the focus word and POS prompts."""
+
+import pytest
+from unittest.mock import patch
+from src.ui.user_input import parse_focus_words, get_confirmed_pos, confirm_spelling
+
+def test_parse_focus_words_single():
+    assert parse_focus_words("  Conquest ") == ["conquest"]
+
+def test_parse_focus_words_multiple_deduplicated():
+    assert parse_focus_words("fled, Danger, ,fled") == ["fled", "danger"]
+
+def test_parse_focus_words_empty():
+    assert parse_focus_words(" , ") == []
+
+def test_parse_focus_words_picks_numbered_suggestions():
+    suggestions = ["perseverance", "fled"]
+    assert parse_focus_words("2, danger, 7", suggestions) == ["fled", "danger", "7"]
+
+@patch('builtins.input', return_value="")
+@patch('src.ui.user_input.detect_pos_from_context', return_value="verb")
+def test_get_confirmed_pos_passes_tagged_sentence(mock_detect, mock_input):
+    tagged = [("He", "PRP"), ("fled", "VBD")]
+    assert get_confirmed_pos("fled", "He fled", tagged) == "verb"
+    mock_detect.assert_called_once_with("fled", "He fled", tagged)
+
+SPELLING = [{"word": "receive", "cefr": "A2", "frequency": "9", "distance": 1},
+            {"word": "relieve", "cefr": "B2", "frequency": "6", "distance": 1}]
+
+@pytest.mark.parametrize("answer, expected", [("2", "relieve"), ("", "recieve"), (" Recede ", "recede")])
+def test_confirm_spelling(answer, expected, capsys):
+    with patch('builtins.input', return_value=answer):
+        assert confirm_spelling("recieve", SPELLING) == expected
+    assert "1) receive (9)" in capsys.readouterr().out
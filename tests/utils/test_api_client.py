@@ -0,0 +1,58 @@
+import queue
+import threading
+from unittest.mock import patch
+from src.utils import api_client
+from src.utils.api_client import get_api_data
+
+class Response:
+    status_code = 200
+    content = b"{}"
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {}
+
+class Session:
+    """Records which threads use it at the same time."""
+    barrier = None
+    created = 0
+
+    def __init__(self):
+        Session.created += 1
+        self.users = 0
+        self.shared = False
+
+    def get(self, url, **kwargs):
+        self.users += 1
+        self.shared |= self.users > 1
+        if Session.barrier:
+            Session.barrier.wait()
+        self.users -= 1
+        return Response()
+
+@patch.object(api_client.requests, "Session", Session)
+def test_concurrent_requests_never_share_a_session(monkeypatch):
+    monkeypatch.setattr(api_client, "_idle_sessions", queue.SimpleQueue())
+    monkeypatch.setattr(Session, "created", 0)
+    monkeypatch.setattr(Session, "barrier", threading.Barrier(3, timeout=5))
+    threads = [threading.Thread(target=get_api_data, args=("https://example.com",)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert Session.created == 3
+    sessions = [api_client._idle_sessions.get_nowait() for _ in range(3)]
+    assert not any(session.shared for session in sessions)
+
+@patch.object(api_client.requests, "Session", Session)
+def test_sessions_are_reused_across_threads(monkeypatch):
+    monkeypatch.setattr(api_client, "_idle_sessions", queue.SimpleQueue())
+    monkeypatch.setattr(Session, "created", 0)
+    monkeypatch.setattr(Session, "barrier", None)
+    for _ in range(3):
+        thread = threading.Thread(target=get_api_data, args=("https://example.com",))
+        thread.start()
+        thread.join()
+    assert Session.created == 1
@@ -0,0 +1,53 @@
+import builtins
+import pstats
+import sys
+import threading
+import time
+import pytest
+
+from src.utils.profiling import PipelineProfiler, collapse_stack
+
+def _busy_loop(n=300_000):
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+
+def _slow_prompt(prompt=""):
+    time.sleep(0.3)
+    return "run"
+
+@pytest.fixture
+def slow_input(monkeypatch):
+    monkeypatch.setattr(builtins, "input", _slow_prompt)
+
+def test_collapse_stack_orders_frames_from_outermost():
+    def inner():
+        return collapse_stack(sys._getframe(), "MainThread")
+
+    stack = inner()
+    assert stack.startswith("MainThread;")
+    assert stack.endswith("test_profiling:test_collapse_stack_orders_frames_from_outermost;test_profiling:inner")
+
+def test_profiler_writes_pstats_and_collapsed_stacks(tmp_path, slow_input):
+    profiler = PipelineProfiler(str(tmp_path / "run"), interval=0.001).start()
+    worker = threading.Thread(target=_busy_loop, args=(2_000_000,), name="worker")
+    worker.start()
+    worker.join()
+    _busy_loop(2_000_000)
+    pstats_path, collapsed_path = profiler.stop()
+
+    functions = {name for (_, _, name) in pstats.Stats(pstats_path).stats}
+    assert "_busy_loop" in functions
+    lines = open(collapsed_path).read().splitlines()
+    assert any(line.startswith("worker;") and "_busy_loop" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+def test_input_wait_is_excluded(tmp_path, slow_input):
+    profiler = PipelineProfiler(str(tmp_path / "run"), interval=0.001).start()
+    assert input("word: ") == "run"
+    pstats_path, collapsed_path = profiler.stop()
+
+    assert builtins.input is _slow_prompt
+    assert pstats.Stats(pstats_path).total_tt < 0.1
+    assert "_slow_prompt" not in open(collapsed_path).read()
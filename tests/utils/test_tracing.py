@@ -0,0 +1,70 @@
+import json
+import threading
+import pytest
+
+from src.utils import tracing
+from src.utils.tracing import span, annotate, traced, write_trace
+
+@pytest.fixture(autouse=True)
+def clean_tracing():
+    tracing.reset_tracing()
+    yield
+    tracing.reset_tracing()
+
+def _spans():
+    return [e for e in tracing._events if e["ph"] == "X"]
+
+def test_disabled_tracing_records_nothing():
+    with span("clipboard"):
+        annotate(bytes=10)
+    assert tracing._events == []
+
+def test_span_records_duration_and_annotations():
+    tracing._enabled = True
+    with span("dictionary_join", word="run"):
+        annotate(bytes=42)
+    event = _spans()[0]
+    assert event["name"] == "dictionary_join"
+    assert event["args"] == {"word": "run", "bytes": 42}
+    assert event["dur"] >= 0
+
+def test_annotate_targets_innermost_span():
+    tracing._enabled = True
+    with span("outer"):
+        with span("inner"):
+            annotate(status=200)
+    inner, outer = _spans()
+    assert inner["args"] == {"status": 200}
+    assert outer["args"] == {}
+
+def test_traced_decorator_uses_function_name_and_category():
+    tracing._enabled = True
+
+    @traced(category="http")
+    def fetch():
+        return "ok"
+
+    assert fetch() == "ok"
+    event = _spans()[0]
+    assert (event["name"], event["cat"]) == ("fetch", "http")
+
+def test_write_trace_produces_chrome_trace_with_thread_names(tmp_path):
+    tracing._enabled = True
+
+    def background():
+        with span("tts"):
+            pass
+    worker = threading.Thread(target=background, name="prefetch")
+    worker.start()
+    worker.join()
+    with span("add_note"):
+        pass
+
+    path = tmp_path / "out.json"
+    write_trace(str(path))
+    trace = json.loads(path.read_text())
+    names = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+    assert "prefetch" in names
+    assert {e["name"] for e in trace["traceEvents"] if e["ph"] == "X"} == {"tts", "add_note"}
+    tids = {e["tid"] for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert len(tids) == 2
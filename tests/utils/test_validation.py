@@ -102,6 +102,12 @@ def test_validate_config_invalid_big_huge_api_key_spaces(monkeypatch):
     with pytest.raises(SystemExit):
         validate_config(config)
 
+def test_validate_config_big_huge_api_key_not_needed_without_bighuge(monkeypatch):
+    config = valid_config()
+    config["big_huge_api_key"] = ""
+    monkeypatch.setattr("src.utils.validation.THESAURUS_BACKEND_NAMES", ["wordnet"])
+    validate_config(config)
+
 def test_validate_config_invalid_anki_connect_url(monkeypatch):
     config = valid_config()
     config["anki_connect_url"] = "http://127.0.0.1:8765"